@@ -1,9 +1,13 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import APIKeyHeader
 from starlette.status import HTTP_403_FORBIDDEN
 
+from app.business.call_summary_buffer import CallSummaryBuffer
+from app.business.fmcsa_client import FMCSAClient
+from app.business.load_index import LoadIndex
+from app.business.load_search_cache import LoadSearchCache
 from app.core.config import settings
 
 # Define the API key header to be extracted from incoming requests
@@ -35,3 +39,78 @@ async def verify_api_key(api_key: str = Depends(api_key_header)) -> str:
 
 # Annotated type alias for dependency injection of the API key
 APIKeyDep = Annotated[str, Depends(verify_api_key)]
+
+
+def get_call_summary_buffer(request: Request) -> Optional[CallSummaryBuffer]:
+    """
+    Returns the write-behind call summary buffer, if enabled.
+
+    Args:
+        request (Request): Incoming request, giving access to the app state.
+
+    Returns:
+        Optional[CallSummaryBuffer]: The running buffer, or None when call
+        summaries are written synchronously.
+    """
+    return getattr(request.app.state, "call_summary_buffer", None)
+
+
+# Annotated type alias for dependency injection of the call summary buffer
+CallSummaryBufferDep = Annotated[
+    Optional[CallSummaryBuffer], Depends(get_call_summary_buffer)
+]
+
+
+def get_load_index(request: Request) -> Optional[LoadIndex]:
+    """
+    Returns the in-memory load index, if enabled.
+
+    Args:
+        request (Request): Incoming request, giving access to the app state.
+
+    Returns:
+        Optional[LoadIndex]: The worker's load index, or None when load
+        searches always go to the database.
+    """
+    return getattr(request.app.state, "load_index", None)
+
+
+# Annotated type alias for dependency injection of the load index
+LoadIndexDep = Annotated[Optional[LoadIndex], Depends(get_load_index)]
+
+
+def get_load_search_cache(request: Request) -> Optional[LoadSearchCache]:
+    """
+    Returns the load search result cache, if enabled.
+
+    Args:
+        request (Request): Incoming request, giving access to the app state.
+
+    Returns:
+        Optional[LoadSearchCache]: The worker's cache, or None when every
+        search is evaluated.
+    """
+    return getattr(request.app.state, "load_search_cache", None)
+
+
+# Annotated type alias for dependency injection of the load search cache
+LoadSearchCacheDep = Annotated[
+    Optional[LoadSearchCache], Depends(get_load_search_cache)
+]
+
+
+def get_fmcsa_client(request: Request) -> FMCSAClient:
+    """
+    Returns the application-wide FMCSA client.
+
+    Args:
+        request (Request): Incoming request, giving access to the app state.
+
+    Returns:
+        FMCSAClient: The pooled client created at start-up.
+    """
+    return request.app.state.fmcsa_client
+
+
+# Annotated type alias for dependency injection of the FMCSA client
+FMCSAClientDep = Annotated[FMCSAClient, Depends(get_fmcsa_client)]
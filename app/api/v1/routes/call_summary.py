@@ -1,12 +1,29 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, Optional
+from uuid import UUID
 
-from app.database_engine.session import get_db
-from app.api.dependencies import APIKeyDep
-from app.crud.call_summary import create_call_summary, get_all_call_summaries
-from app.schemas.call_summary import CallSummaryCreate, CallSummaryResponse
+from app.core.config import constants
+from app.database_engine.session import AsyncSessionLocal, get_async_db
+from app.api.dependencies import APIKeyDep, CallSummaryBufferDep
+from app.business.call_summary import ingest_call_summaries_async
+from app.business.call_summary_buffer import BufferFullError
+from app.crud.call_summary import (
+    create_call_summary_async,
+    get_call_summaries_page_async,
+    stream_call_summaries_async,
+)
+from app.schemas.call_summary import (
+    CallOutcomeEnum,
+    CallSummaryBulkResponse,
+    CallSummaryCreate,
+    CallSummaryFilter,
+    CallSummaryPage,
+    CallSummaryResponse,
+    SentimentEnum,
+)
 
 router = APIRouter(tags=["Call Summary"])
 
@@ -22,13 +39,28 @@ logging.basicConfig(level=logging.INFO)
     summary="Log a new call summary",
     description=(
         "Log a carrier interaction summarizing the outcome, sentiment, pricing, and any relevant metadata. "
-        "This endpoint captures all negotiation details including counter offers, special conditions, and sentiment."
+        "This endpoint captures all negotiation details including counter offers, special conditions, and sentiment. "
+        "With write-behind enabled the summary is queued and the endpoint answers 202 right away."
     ),
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "description": (
+                "Write-behind mode: summary queued for background storage. The "
+                "load is not checked before answering: summaries of unknown loads "
+                "(or rejected by the database) go to the dead-letter file of "
+                "`CALL_SUMMARY_SPILL_DIR` instead of the table."
+            )
+        },
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "Write-behind queue full; retry after `Retry-After` seconds."
+        },
+    },
 )
-def add_call_summary(
+async def add_call_summary(
     token: APIKeyDep,
     payload: CallSummaryCreate,
-    db: Session = Depends(get_db),
+    buffer: CallSummaryBufferDep,
+    db: AsyncSession = Depends(get_async_db),
 ) -> CallSummaryResponse:
     """
     Create a new call summary record.
@@ -36,50 +68,180 @@ def add_call_summary(
     Args:
         token (APIKeyDep): Secured API access.
         payload (CallSummaryCreate): Summary data to be logged.
-        db (Session): Active database session.
+        buffer (CallSummaryBufferDep): Write-behind buffer, None when disabled.
+        db (AsyncSession): Active database session.
+
+    Raises:
+        HTTPException: If the write-behind queue stays full.
 
     Returns:
         CallSummaryResponse: Saved record with database-generated ID and timestamp.
     """
     logger.info(f"[CALL SUMMARY - INPUT] Payload received: {payload.dict()}")
 
-    result = create_call_summary(db, payload)
+    if buffer is not None:
+        try:
+            await buffer.enqueue(payload)
+        except BufferFullError as e:
+            logger.warning(f"[CALL SUMMARY - BACKPRESSURE] {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Call summary queue is full, retry later.",
+                headers={"Retry-After": "1"},
+            )
+        logger.info("[CALL SUMMARY - OUTPUT] Summary queued")
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"detail": "Call summary queued for storage."},
+        )
+
+    result = await create_call_summary_async(db, payload)
 
     logger.info(f"[CALL SUMMARY - OUTPUT] Summary stored: {result}")
 
     return result
 
 
+@router.post(
+    "/call-summary/bulk",
+    response_model=CallSummaryBulkResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Log call summaries in bulk",
+    description=(
+        "Backfill many call summaries at once. The body is either a JSON array or "
+        "NDJSON (`Content-Type: application/x-ndjson`) of call summary objects. "
+        "Every item is validated on its own: valid items are stored together in one "
+        "transaction and rejected ones are reported with their index."
+    ),
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Malformed JSON array or too many items."
+        },
+    },
+)
+async def add_call_summaries_bulk(
+    request: Request,
+    token: APIKeyDep,
+    db: AsyncSession = Depends(get_async_db),
+) -> CallSummaryBulkResponse:
+    """
+    Validate and store a batch of call summaries.
+
+    Args:
+        request (Request): Incoming request; its raw body holds the items.
+        token (APIKeyDep): Secured API access.
+        db (AsyncSession): Active database session.
+
+    Raises:
+        HTTPException: If the body as a whole cannot be accepted.
+
+    Returns:
+        CallSummaryBulkResponse: Counts and per-item errors.
+    """
+    body = await request.body()
+    content_type = request.headers.get("content-type", "")
+    ndjson = "ndjson" in content_type or not body.lstrip().startswith(b"[")
+
+    try:
+        result = await ingest_call_summaries_async(db, body, ndjson)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return result
+
+
 @router.get(
     "/call-summary",
-    response_model=List[CallSummaryResponse],
-    summary="Get all call summaries",
+    response_model=CallSummaryPage,
+    summary="List call summaries",
     description=(
-        "Retrieve all logged carrier call summaries from the system. "
-        "Includes outcome, sentiment, satisfaction, counter offers, and more."
+        "Retrieve logged carrier call summaries one page at a time, ordered by ID. "
+        "Pass the returned `next_cursor` as `cursor` to fetch the next page. "
+        "Results can be filtered by outcome, sentiment and load."
     ),
 )
-def get_summary(
+async def get_summary(
     token: APIKeyDep,
-    db: Session = Depends(get_db),
-) -> List[CallSummaryResponse]:
+    db: AsyncSession = Depends(get_async_db),
+    cursor: Optional[int] = Query(
+        None, ge=0, description="`next_cursor` of the previous page"
+    ),
+    limit: int = Query(
+        constants.CALL_SUMMARY_PAGE_SIZE,
+        ge=1,
+        le=constants.CALL_SUMMARY_MAX_PAGE_SIZE,
+        description="Maximum number of summaries per page",
+    ),
+    outcome: Optional[CallOutcomeEnum] = Query(None),
+    sentiment: Optional[SentimentEnum] = Query(None),
+    load_id: Optional[UUID] = Query(None),
+) -> CallSummaryPage:
     """
-    Retrieve all stored call summaries.
+    Retrieve one keyset page of call summaries.
 
     Args:
         token (APIKeyDep): Secured API access.
-        db (Session): Active database session.
+        db (AsyncSession): Active database session.
+        cursor (Optional[int]): Cursor returned with the previous page.
+        limit (int): Page size.
+        outcome (Optional[CallOutcomeEnum]): Only summaries with this outcome.
+        sentiment (Optional[SentimentEnum]): Only summaries with this sentiment.
+        load_id (Optional[UUID]): Only summaries of this load.
+
+    Returns:
+        CallSummaryPage: The page and the cursor of the next one (null on the last page).
+    """
+    filters = CallSummaryFilter(outcome=outcome, sentiment=sentiment, load_id=load_id)
+    items, next_cursor = await get_call_summaries_page_async(
+        db, filters, after_id=cursor, limit=limit
+    )
+    return CallSummaryPage(items=items, next_cursor=next_cursor)
+
+
+async def _ndjson_export(filters: CallSummaryFilter) -> AsyncIterator[str]:
+    # The request-scoped session is closed before the body is sent, so the
+    # export holds its own session (and server-side cursor) while streaming.
+    lines = []
+    async with AsyncSessionLocal() as db:
+        async for summary in stream_call_summaries_async(db, filters):
+            lines.append(CallSummaryResponse.model_validate(summary).model_dump_json())
+            if len(lines) == constants.CALL_SUMMARY_STREAM_BATCH:
+                yield "\n".join(lines) + "\n"
+                lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
 
-    Raises:
-        HTTPException: If no records are found.
+
+@router.get(
+    "/call-summary/export",
+    response_class=StreamingResponse,
+    summary="Export call summaries as NDJSON",
+    description=(
+        "Stream every matching call summary as newline-delimited JSON, ordered by ID. "
+        "Rows are read through a server-side cursor, so memory use does not grow "
+        "with the number of summaries."
+    ),
+)
+async def export_summaries(
+    token: APIKeyDep,
+    outcome: Optional[CallOutcomeEnum] = Query(None),
+    sentiment: Optional[SentimentEnum] = Query(None),
+    load_id: Optional[UUID] = Query(None),
+) -> StreamingResponse:
+    """
+    Stream the filtered call summaries, one JSON object per line.
+
+    Args:
+        token (APIKeyDep): Secured API access.
+        outcome (Optional[CallOutcomeEnum]): Only summaries with this outcome.
+        sentiment (Optional[SentimentEnum]): Only summaries with this sentiment.
+        load_id (Optional[UUID]): Only summaries of this load.
 
     Returns:
-        List[CallSummaryResponse]: List of all call summary records.
+        StreamingResponse: `application/x-ndjson` body.
     """
-    summaries = get_all_call_summaries(db)
-    if not summaries:
-        raise HTTPException(
-            status_code=status.HTTP_204_NO_CONTENT,
-            detail="No call summaries found",
-        )
-    return summaries
+    filters = CallSummaryFilter(outcome=outcome, sentiment=sentiment, load_id=load_id)
+    logger.info(f"[CALL SUMMARY - EXPORT] Streaming summaries with filters: {filters}")
+    return StreamingResponse(
+        _ndjson_export(filters), media_type="application/x-ndjson"
+    )
@@ -1,8 +1,15 @@
-from fastapi import APIRouter, Path
-from app.schemas.carrier import VerifyMCResponse
-import httpx
-import os
-from app.core.config import settings
+from typing import AsyncIterator
+from fastapi import APIRouter, HTTPException, Path, Response, status
+from fastapi.responses import StreamingResponse
+from app.api.dependencies import FMCSAClientDep
+from app.business.carrier import authorization_status, verify_carriers
+from app.business.fmcsa_client import (
+    FMCSAClient,
+    FMCSARequestError,
+    FMCSAUnavailableError,
+)
+from app.core.config import constants, settings
+from app.schemas.carrier import CarrierBatchRequest, VerifyMCResponse
 router = APIRouter()
 
 
@@ -24,34 +31,77 @@ def get_carrier_authorization_status(
     - Starts with '5' → authorized.
     - Others → non-authorized.
     """
-    if mc_number.startswith("5"):
-        return VerifyMCResponse(
-            status="authorized",
-            carrier_name=f"Carrier MC-{mc_number}",
-            operation="Interstate",
-        )
-    return VerifyMCResponse(
-        status="non-authorized",
-        carrier_name="None",
-        operation="None",
-    )
+    return authorization_status(mc_number)
 
 
 @router.get(
     "/carriers/fmcsa/{mc_number}",
     tags=["Carriers"],
     summary="Get carrier info from FMCSA API by MC number",
+    responses={
+        status.HTTP_502_BAD_GATEWAY: {"description": "FMCSA rejected the lookup."},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "FMCSA is failing and no cached answer is available."
+        },
+    },
 )
 async def get_carrier_from_fmcsa(
+    response: Response,
+    fmcsa: FMCSAClientDep,
     mc_number: str = Path(
         ..., min_length=5, max_length=8, description="Motor Carrier number"
     ),
 ):
     """
     Calls the FMCSA API to retrieve carrier details for a given MC number.
+
+    Answers are cached and served stale while FMCSA fails; the `X-Cache`
+    header tells whether the answer was a `hit`, a `miss` or `stale`.
+    """
+    try:
+        lookup = await fmcsa.lookup(mc_number)
+    except FMCSAUnavailableError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="FMCSA is unavailable, try again later.",
+        )
+    except FMCSARequestError as e:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(e))
+    response.headers["X-Cache"] = lookup.source
+    return lookup.payload
+
+
+async def _ndjson_verifications(
+    batch: CarrierBatchRequest, fmcsa: FMCSAClient
+) -> AsyncIterator[str]:
+    async for verification in verify_carriers(
+        batch.mc_numbers, batch.source, fmcsa, settings.CARRIER_BATCH_CONCURRENCY
+    ):
+        yield verification.model_dump_json() + "\n"
+
+
+@router.post(
+    "/carriers/verify/batch",
+    tags=["Carriers"],
+    response_class=StreamingResponse,
+    summary="Verify many MC numbers, streaming the results",
+    description=(
+        "Verify a list of MC numbers against FMCSA (or the local authorization "
+        "rule) with bounded concurrency. Results are streamed as NDJSON as soon as "
+        "each one is known; `index` refers to the position in the request. At "
+        f"most {constants.CARRIER_BATCH_MAX_SIZE} MC numbers per request."
+    ),
+)
+async def verify_carriers_batch(
+    batch: CarrierBatchRequest, fmcsa: FMCSAClientDep
+) -> StreamingResponse:
+    """
+    Stream the verification of every MC number of the batch.
+
+    Cached FMCSA answers are reused, duplicates share one lookup and MC
+    numbers that cannot be verified get an `error` line instead of failing
+    the whole batch.
     """
-    url = settings.FMCSA_URL.format(mc_number=mc_number, web_key=settings.WEB_KEY)
-    async with httpx.AsyncClient(timeout=10) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.json()
+    return StreamingResponse(
+        _ndjson_verifications(batch, fmcsa), media_type="application/x-ndjson"
+    )
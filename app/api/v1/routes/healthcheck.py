@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
+from app.api.dependencies import LoadSearchCacheDep
 from app.business.healthcheck import HealthcheckManager
 
 router = APIRouter()
@@ -11,16 +12,28 @@ router = APIRouter()
     description="Returns the current health status of the API. Useful for monitoring and uptime checks.",
     response_model=dict,
 )
-def health(manager: HealthcheckManager = Depends()) -> dict:
+def health(
+    request: Request,
+    load_search_cache: LoadSearchCacheDep,
+    manager: HealthcheckManager = Depends(),
+) -> dict:
     """
     Healthcheck endpoint.
 
     Returns the system's current health status as determined by the HealthcheckManager.
 
     Args:
+        request (Request): Incoming request, giving access to the FMCSA client,
+            the request capture and the call summary buffer.
+        load_search_cache (LoadSearchCacheDep): Load search cache, if enabled.
         manager (HealthcheckManager): Dependency that encapsulates health check logic.
 
     Returns:
         dict: Dictionary containing health status details.
     """
-    return manager.status()
+    fmcsa_client = getattr(request.app.state, "fmcsa_client", None)
+    request_capture = getattr(request.app.state, "request_capture", None)
+    call_summary_buffer = getattr(request.app.state, "call_summary_buffer", None)
+    return manager.status(
+        load_search_cache, fmcsa_client, request_capture, call_summary_buffer
+    )
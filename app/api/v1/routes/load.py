@@ -1,18 +1,31 @@
 from fastapi import APIRouter, Depends, Request, status, Query, HTTPException
-from sqlalchemy.orm import Session
-from typing import Optional, Union
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import IO, Optional, Union
+import io
 import logging
+import tempfile
 
-from app.api.dependencies import APIKeyDep
-from app.database_engine.session import get_db
-from app.schemas.load import LoadBase, LoadFilter, LoadResponse
-from app.business.load import get_best_load
+from app.api.dependencies import APIKeyDep, LoadIndexDep, LoadSearchCacheDep
+from app.database_engine.session import SessionLocal, get_async_db
+from app.schemas.load import (
+    LoadBase,
+    LoadFilter,
+    LoadImportFormat,
+    LoadImportReport,
+    LoadResponse,
+    LoadSearchPage,
+)
+from app.business.load import get_best_load_async, get_load_page_async
+from app.business.load_import import import_loads, read_load_records
+from app.business.load_index import LoadIndex
+from app.business.load_search_cache import LoadSearchCache
 from app.utils.parsing import safe_parse_datetime
 from app.utils.normalization import (
     normalize_numeric_param,
     normalize_city,
 )
-from app.core.config import constants
+from app.core.config import constants, settings
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +35,49 @@ router = APIRouter(
 )
 
 
+async def _search(
+    db: AsyncSession,
+    filters: LoadFilter,
+    limit: Optional[int],
+    cursor: Optional[str],
+    load_index: Optional[LoadIndex],
+) -> Union[LoadResponse, LoadSearchPage, dict]:
+    """Evaluate a search: a page with `limit`/`cursor`, else the best load."""
+    if limit is not None or cursor is not None:
+        try:
+            page = await get_load_page_async(db, filters, limit, cursor, load_index)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        logger.info(
+            f"[LOAD SEARCH - OUTPUT] {len(page.items)} loads found "
+            f"(more: {page.next_cursor is not None})"
+        )
+        return page
+
+    # --- Business logic: retrieve best load ---
+    best_load = await get_best_load_async(db, filters, load_index)
+
+    if not best_load:
+        logger.info("[LOAD SEARCH - OUTPUT] No matching loads found.")
+        return {"message": constants.NO_LOADS_FOUND_MSG}
+
+    logger.info(
+        f"[LOAD SEARCH - OUTPUT] Best load found "
+        f"({best_load.match_tier.value} match): {best_load}"
+    )
+    return best_load
+
+
 @router.get(
     path="",
     name="Search Loads",
     summary="Search for available loads using multiple filters",
-    response_model=Union[LoadResponse, dict],
+    response_model=Union[LoadResponse, LoadSearchPage, dict],
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Invalid cursor, or a cursor issued for other filters."
+        },
         status.HTTP_422_UNPROCESSABLE_ENTITY: {
             "description": "Validation error. Query parameters malformed or conflicting."
         },
@@ -37,10 +86,12 @@ router = APIRouter(
         },
     },
 )
-def search_loads(
+async def search_loads(
     request: Request,
     token: APIKeyDep,
-    db: Session = Depends(get_db),
+    load_index: LoadIndexDep,
+    cache: LoadSearchCacheDep,
+    db: AsyncSession = Depends(get_async_db),
     origin: Optional[str] = Query(None),
     destination: Optional[str] = Query(None),
     equipment_type: Optional[str] = Query(None),
@@ -53,12 +104,28 @@ def search_loads(
     max_rate: Optional[str] = Query(None),
     min_miles: Optional[str] = Query(None),
     max_miles: Optional[str] = Query(None),
-) -> Union[LoadBase, dict]:
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=constants.LOAD_SEARCH_MAX_LIMIT,
+        description="Return a page of the top `limit` loads instead of the best one",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="`next_cursor` of the previous page"
+    ),
+) -> Union[LoadBase, LoadSearchPage, dict]:
     """
     Search for the most suitable load based on filter parameters.
     If no exact match is found, the search is relaxed using business rules.
+    The `match_tier` field reports whether the strict or relaxed filters matched.
+    With `LOAD_INDEX_ENABLED`, the search is answered from the in-memory index.
+    With `LOAD_SEARCH_CACHE_ENABLED`, repeated identical searches are served
+    from a short-lived cache.
 
     Returns the highest-priority matching load or a message if none found.
+    With `limit` (or `cursor`), returns a page of the top loads, ranked and
+    priced, and a `next_cursor` token to fetch the following ones with the
+    same filters.
     """
 
     try:
@@ -97,26 +164,118 @@ def search_loads(
             max_rate=normalized_max_rate,
             min_miles=normalized_min_miles,
             max_miles=normalized_max_miles,
+            match_mode=settings.LOAD_TEXT_MATCH_MODE,
         )
 
-        # --- Business logic: retrieve best load ---
-        best_load = get_best_load(db, filters)
-
         logger.debug(f"[LOAD SEARCH] Constructed LoadFilter: {filters}")
 
-        # --- Business logic: retrieve best load ---
-        best_load = get_best_load(db, filters)
+        if cache is None:
+            return await _search(db, filters, limit, cursor, load_index)
 
-        if not best_load:
-            logger.info("[LOAD SEARCH - OUTPUT] No matching loads found.")
-            return {"message": constants.NO_LOADS_FOUND_MSG}
+        # --- Repeated searches are served from the cache until invalidated ---
+        cache_key = LoadSearchCache.key(filters, limit, cursor)
+        generation = cache.generation
+        cached, response = cache.get(cache_key)
+        if cached:
+            logger.info("[LOAD SEARCH - OUTPUT] Served from the search cache.")
+            return response
 
-        logger.info(f"[LOAD SEARCH - OUTPUT] Best load found: {best_load}")
-        return best_load
+        response = await _search(db, filters, limit, cursor, load_index)
+        cache.put(cache_key, response, generation)
+        return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"[LOAD SEARCH - ERROR] {str(e)}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error searching loads.",
         )
+
+
+def _import_spooled_file(
+    spooled: IO[bytes], import_format: LoadImportFormat
+) -> LoadImportReport:
+    """Run the (blocking) import of an uploaded file with a sync session."""
+    spooled.seek(0)
+    source = io.TextIOWrapper(spooled, encoding="utf-8-sig", newline="")
+    with SessionLocal() as db:
+        return import_loads(db, read_load_records(source, import_format))
+
+
+@router.post(
+    path="/import",
+    name="Import Loads",
+    summary="Bulk import the load catalog from CSV or NDJSON",
+    response_model=LoadImportReport,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Unknown format: pass `format` or a CSV/NDJSON Content-Type."
+        },
+    },
+)
+async def import_loads_endpoint(
+    request: Request,
+    token: APIKeyDep,
+    cache: LoadSearchCacheDep,
+    import_format: Optional[LoadImportFormat] = Query(
+        None,
+        alias="format",
+        description="csv or ndjson; defaults to the request Content-Type",
+    ),
+) -> LoadImportReport:
+    """
+    Upsert loads (by `load_id`) from a CSV or NDJSON request body.
+
+    The body is streamed to a temporary file and imported chunk by chunk,
+    so memory stays flat for multi-GB uploads. Origins and destinations are
+    normalized, invalid rows are counted and the first ones reported with
+    their line number.
+    """
+    content_type = request.headers.get("content-type", "")
+    if import_format is None:
+        if "csv" in content_type:
+            import_format = LoadImportFormat.CSV
+        elif "ndjson" in content_type:
+            import_format = LoadImportFormat.NDJSON
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Pass `format` (csv or ndjson) or a matching Content-Type.",
+            )
+
+    # Disk writes run in the threadpool, a few chunks at a time
+    spooled = await run_in_threadpool(tempfile.TemporaryFile)
+    try:
+        pending = bytearray()
+        async for chunk in request.stream():
+            pending += chunk
+            if len(pending) >= constants.LOAD_IMPORT_SPOOL_BYTES:
+                await run_in_threadpool(spooled.write, bytes(pending))
+                pending.clear()
+        if pending:
+            await run_in_threadpool(spooled.write, bytes(pending))
+
+        try:
+            report = await run_in_threadpool(
+                _import_spooled_file, spooled, import_format
+            )
+        except Exception as e:
+            logger.error(f"[LOAD IMPORT - ERROR] {str(e)}", exc_info=True)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Error importing loads.",
+            )
+    finally:
+        await run_in_threadpool(spooled.close)
+
+    if cache is not None and report.upserted:
+        cache.invalidate()
+
+    logger.info(
+        f"[LOAD IMPORT - OUTPUT] {report.upserted} loads upserted, "
+        f"{report.rejected} rejected, {report.rows_per_sec:.0f} rows/s"
+    )
+    return report
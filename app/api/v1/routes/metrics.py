@@ -1,25 +1,48 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Optional, Union
 
-from app.database_engine.session import get_db
-from app.schemas.metrics import MetricsResponse
-from app.business.metrics import calculate_metrics
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.instrumentation import runtime_metrics
+from app.database_engine.session import get_async_db
+from app.schemas.metrics import MetricsBucket, MetricsResponse, MetricsSeriesResponse
+from app.business.metrics import (
+    calculate_metrics_async,
+    calculate_metrics_series_async,
+    calculate_window_metrics_async,
+)
+from app.utils.parsing import to_naive_utc
 
 router = APIRouter(tags=["Metrics"])
 
 
 @router.get(
     "/metrics",
-    response_model=MetricsResponse,
+    response_model=Union[MetricsSeriesResponse, MetricsResponse],
     status_code=status.HTTP_200_OK,
     summary="Get system metrics",
     description=(
         "Returns detailed KPI metrics about load availability, call summaries, "
-        "negotiation outcomes, sentiment trends, and user satisfaction."
+        "negotiation outcomes, sentiment trends, and user satisfaction. "
+        "With `from`/`to` the call KPIs are restricted to that window; with "
+        "`bucket` they are returned as a time series (hour, day or week)."
     ),
     response_description="Metrics data successfully retrieved.",
 )
-def get_metrics(db: Session = Depends(get_db)) -> MetricsResponse:
+async def get_metrics(
+    db: AsyncSession = Depends(get_async_db),
+    from_: Optional[datetime] = Query(
+        None, alias="from", description="Inclusive window start (UTC if naive)"
+    ),
+    to: Optional[datetime] = Query(
+        None, description="Exclusive window end (UTC if naive)"
+    ),
+    bucket: Optional[MetricsBucket] = Query(
+        None, description="Return a time series with this granularity"
+    ),
+) -> Union[MetricsSeriesResponse, MetricsResponse]:
     """
     Retrieve key performance indicators and analytics on calls and loads.
 
@@ -28,5 +51,43 @@ def get_metrics(db: Session = Depends(get_db)) -> MetricsResponse:
     - Total and categorized call outcomes
     - Average prices, attempts, durations
     - Sentiment and satisfaction breakdowns
+
+    Windows and buckets are served from the hourly metrics rollup, so window
+    bounds are aligned to whole hours.
+    """
+    start, end = to_naive_utc(from_), to_naive_utc(to)
+    if start is not None and end is not None and start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="`from` must be earlier than `to`.",
+        )
+
+    if bucket is not None:
+        return await calculate_metrics_series_async(db, bucket, start, end)
+    if start is not None or end is not None:
+        return await calculate_window_metrics_async(db, start, end)
+    return await calculate_metrics_async(db)
+
+
+@router.get(
+    "/metrics/runtime",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get runtime latency histograms",
+    description=(
+        "Returns this worker's latency histograms per route, per business "
+        "stage and per SQL statement kind, plus SQL statements and time per "
+        "request, in the Prometheus text exposition format."
+    ),
+    response_description="Histograms in the Prometheus text format.",
+)
+def get_runtime_metrics() -> PlainTextResponse:
+    """
+    Expose the runtime histograms for a scraper.
+
+    Values are cumulative since the worker started; with several workers,
+    each scrape reaches one of them.
     """
-    return calculate_metrics(db)
+    return PlainTextResponse(
+        runtime_metrics.render(), media_type="text/plain; version=0.0.4"
+    )
@@ -1,10 +1,18 @@
 import logging
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, status
 
-from app.database_engine.session import get_db
-from app.schemas.negotiations import CounterOfferRequest, CounterOfferResponse
-from app.business.negotiation import evaluate_counter_offer
+from app.api.dependencies import APIKeyDep
+from app.core.config import constants
+from app.schemas.negotiations import (
+    CounterOfferBatchRequest,
+    CounterOfferBatchResponse,
+    CounterOfferRequest,
+    CounterOfferResponse,
+)
+from app.business.negotiation import (
+    evaluate_counter_offer,
+    evaluate_counter_offer_batch,
+)
 
 router = APIRouter(tags=["Negotiations"])
 
@@ -12,10 +20,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/counteroffer", response_model=CounterOfferResponse)
-def counteroffer_endpoint(
-    req: CounterOfferRequest,
-    db: Session = Depends(get_db),
-):
+async def counteroffer_endpoint(req: CounterOfferRequest):
     """
     Process a carrier's counteroffer and return an appropriate business response.
 
@@ -28,3 +33,52 @@ def counteroffer_endpoint(
     logger.info(f"[NEGOTIATION - OUTPUT] Evaluation result: {response}")
 
     return response
+
+
+@router.post(
+    "/counteroffer/batch",
+    response_model=CounterOfferBatchResponse,
+    summary="Evaluate arrays of counteroffers, optionally with other strategies",
+    description=(
+        "Evaluate many counteroffers in one vectorized pass, e.g. to replay "
+        "historical negotiations. Element `i` of each result array is what "
+        "`POST /counteroffer` answers for offer `i` (without the message), or "
+        "null when its round is beyond the strategy's limit. Named "
+        "`strategies` with other constants are evaluated on the same offers and "
+        "returned next to `current`, the live constants. Arrays hold at most "
+        f"{constants.NEGOTIATION_BATCH_MAX_SIZE} offers."
+    ),
+    responses={
+        status.HTTP_400_BAD_REQUEST: {
+            "description": "Arrays of different lengths, a reserved strategy "
+            "name or rounds beyond the limit of every strategy."
+        },
+    },
+)
+def counteroffer_batch_endpoint(
+    batch: CounterOfferBatchRequest, token: APIKeyDep
+) -> CounterOfferBatchResponse:
+    """
+    Evaluate a batch of counteroffers with every requested strategy.
+
+    Args:
+        batch (CounterOfferBatchRequest): Offer arrays and strategies.
+        token (APIKeyDep): Secured API access.
+
+    Raises:
+        HTTPException: If the batch cannot be evaluated.
+
+    Returns:
+        CounterOfferBatchResponse: Status, suggestion and rounds left arrays
+        per strategy.
+    """
+    try:
+        response = evaluate_counter_offer_batch(batch)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    logger.info(
+        f"[NEGOTIATION - BATCH] {len(batch.carrier_offers)} offers evaluated with "
+        f"{len(response.results)} strategies"
+    )
+    return response
@@ -0,0 +1,172 @@
+import json
+import logging
+import time
+from typing import List, Sequence, Set, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import constants
+from app.crud.call_summary import (
+    bulk_create_call_summaries,
+    bulk_create_call_summaries_async,
+)
+from app.crud.load import get_existing_load_ids, get_existing_load_ids_async
+from app.schemas.call_summary import (
+    CallSummaryBulkError,
+    CallSummaryBulkResponse,
+    CallSummaryCreate,
+)
+from app.utils.parsing import format_validation_errors
+
+logger = logging.getLogger(__name__)
+
+IndexedPayloads = List[Tuple[int, CallSummaryCreate]]
+
+
+def _json_array_items(body: bytes) -> List[Tuple[int, object]]:
+    try:
+        items = json.loads(body)
+    except ValueError as e:
+        raise ValueError(f"Body is not valid JSON: {e}")
+    if not isinstance(items, list):
+        raise ValueError("Body must be a JSON array of call summaries.")
+    return list(enumerate(items))
+
+
+def _ndjson_items(body: bytes) -> List[Tuple[int, bytes]]:
+    # Lines are kept raw: pydantic parses and validates each one in a single
+    # pass, and a malformed line is reported like any other invalid item.
+    return [
+        (index, line) for index, line in enumerate(body.splitlines()) if line.strip()
+    ]
+
+
+def validate_bulk_body(
+    body: bytes, ndjson: bool
+) -> Tuple[int, IndexedPayloads, List[CallSummaryBulkError]]:
+    """
+    Decode and validate every item of a bulk call summary request.
+
+    Args:
+        body (bytes): Raw request body, a JSON array or NDJSON.
+        ndjson (bool): Whether the body is newline-delimited JSON.
+
+    Raises:
+        ValueError: If a JSON array body is malformed or the request holds
+            more than `CALL_SUMMARY_BULK_MAX_ITEMS` items.
+
+    Returns:
+        Tuple[int, IndexedPayloads, List[CallSummaryBulkError]]: Number of
+        items received, valid payloads with their index and the errors of
+        the rejected items. NDJSON items are indexed by line number.
+    """
+    items = _ndjson_items(body) if ndjson else _json_array_items(body)
+    if len(items) > constants.CALL_SUMMARY_BULK_MAX_ITEMS:
+        raise ValueError(
+            f"At most {constants.CALL_SUMMARY_BULK_MAX_ITEMS} call summaries "
+            f"per request, got {len(items)}."
+        )
+
+    validate = (
+        CallSummaryCreate.model_validate_json
+        if ndjson
+        else CallSummaryCreate.model_validate
+    )
+    valid, errors = [], []
+    for index, item in items:
+        try:
+            valid.append((index, validate(item)))
+        except ValidationError as e:
+            errors.append(CallSummaryBulkError(index=index, errors=format_validation_errors(e)))
+    return len(items), valid, errors
+
+
+def _drop_unknown_loads(
+    valid: IndexedPayloads, existing: Set[UUID], errors: List[CallSummaryBulkError]
+) -> List[CallSummaryCreate]:
+    # Rejecting unknown loads up front keeps one bad item from aborting the
+    # whole transaction on the foreign key.
+    payloads = []
+    for index, payload in valid:
+        if payload.load_id in existing:
+            payloads.append(payload)
+        else:
+            errors.append(
+                CallSummaryBulkError(
+                    index=index, errors=[f"load_id: load {payload.load_id} not found"]
+                )
+            )
+    errors.sort(key=lambda error: error.index)
+    return payloads
+
+
+def _bulk_response(
+    received: int,
+    inserted: Sequence[int],
+    errors: List[CallSummaryBulkError],
+    started: float,
+) -> CallSummaryBulkResponse:
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"[CALL SUMMARY - BULK] Stored {len(inserted)}/{received} summaries "
+        f"in {elapsed:.2f}s ({len(inserted) / max(elapsed, 1e-9):.0f} rows/s), "
+        f"{len(errors)} rejected"
+    )
+    return CallSummaryBulkResponse(
+        received=received, inserted=len(inserted), errors=errors
+    )
+
+
+def ingest_call_summaries(
+    db: Session, body: bytes, ndjson: bool
+) -> CallSummaryBulkResponse:
+    """
+    Validate a bulk request and store its valid items in one transaction.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        body (bytes): Raw request body, a JSON array or NDJSON.
+        ndjson (bool): Whether the body is newline-delimited JSON.
+
+    Raises:
+        ValueError: If the body as a whole cannot be accepted.
+
+    Returns:
+        CallSummaryBulkResponse: Counts and the per-item errors.
+    """
+    started = time.perf_counter()
+    received, valid, errors = validate_bulk_body(body, ndjson)
+    existing = get_existing_load_ids(db, (payload.load_id for _, payload in valid))
+    payloads = _drop_unknown_loads(valid, existing, errors)
+    inserted = bulk_create_call_summaries(db, payloads) if payloads else []
+    return _bulk_response(received, inserted, errors, started)
+
+
+async def ingest_call_summaries_async(
+    db: AsyncSession, body: bytes, ndjson: bool
+) -> CallSummaryBulkResponse:
+    """
+    Async counterpart of `ingest_call_summaries`, used by the API handlers.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        body (bytes): Raw request body, a JSON array or NDJSON.
+        ndjson (bool): Whether the body is newline-delimited JSON.
+
+    Raises:
+        ValueError: If the body as a whole cannot be accepted.
+
+    Returns:
+        CallSummaryBulkResponse: Counts and the per-item errors.
+    """
+    started = time.perf_counter()
+    received, valid, errors = validate_bulk_body(body, ndjson)
+    existing = await get_existing_load_ids_async(
+        db, (payload.load_id for _, payload in valid)
+    )
+    payloads = _drop_unknown_loads(valid, existing, errors)
+    inserted = (
+        await bulk_create_call_summaries_async(db, payloads) if payloads else []
+    )
+    return _bulk_response(received, inserted, errors, started)
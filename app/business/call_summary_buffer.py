@@ -0,0 +1,464 @@
+"""
+Write-behind buffer for call summaries.
+
+When `CALL_SUMMARY_WRITE_BEHIND` is enabled, `POST /call-summary` appends
+the validated payload to a local spill file, queues it in memory and
+answers 202 without touching the database. A background task stores the
+queue in batches, once `CALL_SUMMARY_FLUSH_BATCH` summaries are waiting or
+`CALL_SUMMARY_FLUSH_INTERVAL` seconds after the first one arrived.
+
+The spill file is an append-only NDJSON log with one `{"seq", "summary"}`
+record per queued payload and a `{"committed": seq}` marker after every
+stored batch. On start-up, payloads without a marker (left by a crash of
+this or another worker) are stored before new ones are accepted, so
+delivery is at-least-once: a crash between a commit and its marker
+re-inserts that batch. With `CALL_SUMMARY_SPILL_FSYNC`, the enqueues
+waiting at the same time share one fsync (group commit), run in a thread.
+
+Connection problems and pool timeouts are retried until the database is
+back. Summaries the database rejects (or whose load does not exist) cannot
+be stored by retrying: they are appended to the dead-letter file of the
+spill directory with the reason, and the rest of their batch is stored.
+Any other failure of a batch is logged and the batch retried, so the
+background task keeps running; `stats()` (shown by `/health`) reports
+whether it is alive.
+"""
+
+import asyncio
+import fcntl
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import Awaitable, BinaryIO, Callable, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.call_summary import bulk_create_call_summaries_async
+from app.crud.load import get_existing_load_ids_async
+from app.schemas.call_summary import CallSummaryCreate
+
+logger = logging.getLogger(__name__)
+
+SPILL_FILE_PATTERN = "call-summaries-*.ndjson"
+# Shared by the workers; not matched by SPILL_FILE_PATTERN
+DEAD_LETTER_FILE = "call-summaries.dead-letter.ndjson"
+
+# Errors worth retrying the same batch for: the database may come back, or
+# the connection pool (exhausted at peak load) may free a connection
+TRANSIENT_ERRORS = (OperationalError, InterfaceError, PoolTimeoutError, OSError)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether retrying the same statement later may succeed."""
+    if isinstance(error, TRANSIENT_ERRORS):
+        return True
+    return isinstance(error, DBAPIError) and error.connection_invalidated
+
+
+class BufferFullError(Exception):
+    """Raised when the buffer stays full for longer than the enqueue timeout."""
+
+
+def _read_pending(spill: BinaryIO) -> Tuple[List[CallSummaryCreate], int]:
+    """
+    Return the payloads of a spill file that were never marked as committed,
+    and the highest sequence number the file used.
+
+    A truncated last line (crash during a write) is ignored: its request was
+    never acknowledged.
+    """
+    pending: Dict[int, dict] = {}
+    last_seq = 0
+    spill.seek(0)
+    for line in spill:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        last_seq = max(last_seq, record.get("seq", 0))
+        if "committed" in record:
+            # Batches are stored in queue order, so every lower seq is stored too
+            pending = {
+                seq: summary
+                for seq, summary in pending.items()
+                if seq > record["committed"]
+            }
+        else:
+            pending[record["seq"]] = record["summary"]
+    payloads = [
+        CallSummaryCreate.model_validate(summary)
+        for _, summary in sorted(pending.items())
+    ]
+    return payloads, last_seq
+
+
+class CallSummaryBuffer:
+    """
+    In-process queue of call summaries stored in the background in batches.
+
+    Args:
+        session_factory (Callable[[], AsyncSession]): Creates the sessions
+            used to store batches.
+        spill_dir (str): Directory holding one spill file per process.
+        max_size (int): Queued summaries above which `enqueue` waits.
+        batch_size (int): Summaries stored per transaction.
+        flush_interval (float): Longest wait (seconds) before a partial batch
+            is stored.
+        enqueue_timeout (float): How long `enqueue` waits for room in a full
+            queue before raising `BufferFullError`.
+        fsync (bool): Sync the spill file to disk before an enqueue returns,
+            so an OS crash loses nothing either (concurrent enqueues share
+            one fsync); otherwise it is synced per batch.
+        retry_delay (float): Pause (seconds) before retrying a batch after a
+            transient error.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        spill_dir: str,
+        max_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        enqueue_timeout: float = 2.0,
+        fsync: bool = True,
+        retry_delay: float = 1.0,
+    ):
+        self._session_factory = session_factory
+        self._spill_dir = Path(spill_dir)
+        self._spill_path = self._spill_dir / f"call-summaries-{os.getpid()}.ndjson"
+        self._dead_letter_path = self._spill_dir / DEAD_LETTER_FILE
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._enqueue_timeout = enqueue_timeout
+        self._fsync = fsync
+        self._retry_delay = retry_delay
+
+        self._pending: Deque[Tuple[int, CallSummaryCreate]] = deque()
+        self._arrived = asyncio.Event()
+        self._space = asyncio.Event()
+        self._seq = 0
+        self._synced_seq = 0
+        self._sync_task: Optional[asyncio.Task] = None
+        self._spill: Optional[BinaryIO] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.stored = 0
+        self.dropped = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_settings(
+        cls, session_factory: Callable[[], AsyncSession]
+    ) -> "CallSummaryBuffer":
+        """Build a buffer configured by the `CALL_SUMMARY_*` settings."""
+        return cls(
+            session_factory,
+            spill_dir=settings.CALL_SUMMARY_SPILL_DIR,
+            max_size=settings.CALL_SUMMARY_BUFFER_SIZE,
+            batch_size=settings.CALL_SUMMARY_FLUSH_BATCH,
+            flush_interval=settings.CALL_SUMMARY_FLUSH_INTERVAL,
+            enqueue_timeout=settings.CALL_SUMMARY_ENQUEUE_TIMEOUT,
+            fsync=settings.CALL_SUMMARY_SPILL_FSYNC,
+        )
+
+    async def start(self) -> None:
+        """
+        Store payloads left in spill files by previous runs, then start the
+        background flush task.
+        """
+        recovered = await asyncio.to_thread(self._open_spill)
+        for start in range(0, len(recovered), self._batch_size):
+            await self._store(recovered[start : start + self._batch_size])
+        if recovered:
+            logger.info(
+                f"[CALL SUMMARY BUFFER] Recovered {len(recovered)} summaries "
+                "from spill files"
+            )
+        await asyncio.to_thread(self._truncate_spill)
+        self._synced_seq = self._seq
+
+        self._task = asyncio.create_task(self._run())
+        self._task.add_done_callback(self._flusher_done)
+
+    def _open_spill(self) -> List[CallSummaryCreate]:
+        """Open and lock our spill file; return what it and orphans still hold."""
+        self._spill_dir.mkdir(parents=True, exist_ok=True)
+        self._spill = open(self._spill_path, "a+b")
+        # Held for the life of the process: unlocked spill files are orphans
+        fcntl.flock(self._spill.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        recovered, self._seq = _read_pending(self._spill)
+        for path in sorted(self._spill_dir.glob(SPILL_FILE_PATTERN)):
+            if path != self._spill_path:
+                recovered.extend(self._claim_orphan(path))
+        return recovered
+
+    def _claim_orphan(self, path: Path) -> List[CallSummaryCreate]:
+        with open(path, "rb") as orphan:
+            try:
+                fcntl.flock(orphan.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return []  # Spill file of a live worker
+            pending, _ = _read_pending(orphan)
+            # Re-log the payloads in our own spill file before the orphan goes
+            for payload in pending:
+                self._append_to_spill(payload)
+            if pending:
+                os.fsync(self._spill.fileno())
+            path.unlink()
+        return pending
+
+    def _append_to_spill(self, payload: CallSummaryCreate) -> int:
+        self._seq += 1
+        record = {"seq": self._seq, "summary": payload.model_dump(mode="json")}
+        self._spill.write(json.dumps(record).encode() + b"\n")
+        self._spill.flush()
+        return self._seq
+
+    async def _sync_spill(self, seq: int) -> None:
+        """Wait until the spill file is synced up to `seq` (group commit)."""
+        while self._synced_seq < seq:
+            if self._sync_task is None:
+                self._sync_task = asyncio.create_task(self._fsync_spill())
+            # Shielded: a cancelled request must not cancel the others' sync
+            await asyncio.shield(self._sync_task)
+
+    async def _fsync_spill(self) -> None:
+        try:
+            # Every line written so far is covered by this fsync
+            seq = self._seq
+            await asyncio.to_thread(os.fsync, self._spill.fileno())
+            self._synced_seq = max(self._synced_seq, seq)
+        finally:
+            self._sync_task = None
+
+    def _truncate_spill(self) -> None:
+        self._spill.seek(0)
+        self._spill.truncate()
+
+    async def enqueue(self, payload: CallSummaryCreate) -> None:
+        """
+        Durably queue a call summary for background storage.
+
+        Args:
+            payload (CallSummaryCreate): Validated call summary.
+
+        Raises:
+            BufferFullError: If the queue is still full after the enqueue
+                timeout (the database is not keeping up).
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._enqueue_timeout
+        while len(self._pending) >= self._max_size:
+            self._space.clear()
+            try:
+                await asyncio.wait_for(
+                    self._space.wait(), max(deadline - loop.time(), 0)
+                )
+            except asyncio.TimeoutError:
+                raise BufferFullError(
+                    f"{len(self._pending)} call summaries are waiting to be stored."
+                )
+
+        # No await from here on: the flusher cannot commit this payload before
+        # it is in the spill file.
+        seq = self._append_to_spill(payload)
+        self._pending.append((seq, payload))
+        self._arrived.set()
+        if self._fsync:
+            await self._sync_spill(seq)
+
+    async def _next_batch(self) -> List[Tuple[int, CallSummaryCreate]]:
+        loop = asyncio.get_running_loop()
+        while not self._pending:
+            if self._stopping:
+                return []
+            self._arrived.clear()
+            await self._arrived.wait()
+
+        deadline = loop.time() + self._flush_interval
+        while len(self._pending) < self._batch_size and not self._stopping:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            self._arrived.clear()
+            try:
+                await asyncio.wait_for(self._arrived.wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+
+        return [
+            self._pending.popleft()
+            for _ in range(min(self._batch_size, len(self._pending)))
+        ]
+
+    async def _run(self) -> None:
+        while self._pending or not self._stopping:
+            batch = await self._next_batch()
+            if not batch:
+                break
+            self._space.set()
+            await self._retry_until_done(
+                lambda: self._store([payload for _, payload in batch]), len(batch)
+            )
+            await self._retry_until_done(
+                lambda: self._mark_committed(batch[-1][0]), len(batch)
+            )
+
+    async def _retry_until_done(
+        self, step: Callable[[], Awaitable[None]], count: int
+    ) -> None:
+        """
+        Run a step of a batch until it succeeds: an unexpected error (e.g. a
+        full disk) must not end the flusher while requests are still queued.
+        A retried store may insert part of its batch twice (at-least-once).
+        """
+        while True:
+            try:
+                await step()
+                return
+            except Exception as e:
+                logger.error(
+                    f"[CALL SUMMARY BUFFER] Batch of {count} summaries failed, "
+                    f"retrying in {self._retry_delay}s: {e!r}",
+                    exc_info=True,
+                )
+                await asyncio.sleep(self._retry_delay)
+
+    def _flusher_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "[CALL SUMMARY BUFFER] Flusher stopped, summaries are no longer stored",
+                exc_info=task.exception(),
+            )
+
+    async def _store(self, payloads: List[CallSummaryCreate]) -> None:
+        """
+        Store one batch, retrying transient errors until the database is
+        back. Summaries of unknown loads and summaries the database rejects
+        are dead-lettered; the others are stored.
+        """
+        while True:
+            try:
+                async with self._session_factory() as db:
+                    existing = await get_existing_load_ids_async(
+                        db, (payload.load_id for payload in payloads)
+                    )
+                break
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                await self._wait_before_retry(len(payloads), e)
+
+        known = [p for p in payloads if p.load_id in existing]
+        unknown = [p for p in payloads if p.load_id not in existing]
+        if unknown:
+            self.dropped += len(unknown)
+            logger.error(
+                f"[CALL SUMMARY BUFFER] {len(unknown)} summaries reference "
+                f"unknown loads, moved to {self._dead_letter_path}"
+            )
+            await self._dead_letter(unknown, "unknown load_id")
+        if known:
+            await self._insert(known)
+
+    async def _insert(self, payloads: List[CallSummaryCreate]) -> None:
+        """Insert summaries; a rejected batch is split to isolate bad rows."""
+        while True:
+            try:
+                async with self._session_factory() as db:
+                    await bulk_create_call_summaries_async(db, payloads)
+                self.stored += len(payloads)
+                return
+            except Exception as e:
+                if _is_transient(e):
+                    await self._wait_before_retry(len(payloads), e)
+                    continue
+                if len(payloads) == 1:
+                    self.rejected += 1
+                    logger.error(
+                        f"[CALL SUMMARY BUFFER] Summary rejected by the "
+                        f"database, moved to {self._dead_letter_path}: {e}"
+                    )
+                    await self._dead_letter(payloads, str(e))
+                    return
+                middle = len(payloads) // 2
+                await self._insert(payloads[:middle])
+                await self._insert(payloads[middle:])
+                return
+
+    async def _wait_before_retry(self, count: int, error: Exception) -> None:
+        logger.error(
+            f"[CALL SUMMARY BUFFER] Storing {count} summaries failed, "
+            f"retrying in {self._retry_delay}s: {error}"
+        )
+        await asyncio.sleep(self._retry_delay)
+
+    async def _dead_letter(
+        self, payloads: List[CallSummaryCreate], reason: str
+    ) -> None:
+        lines = b"".join(
+            json.dumps(
+                {"error": reason, "summary": payload.model_dump(mode="json")}
+            ).encode()
+            + b"\n"
+            for payload in payloads
+        )
+
+        def append() -> None:
+            with open(self._dead_letter_path, "ab") as dead_letter:
+                dead_letter.write(lines)
+                dead_letter.flush()
+                os.fsync(dead_letter.fileno())
+
+        await asyncio.to_thread(append)
+
+    async def _mark_committed(self, seq: int) -> None:
+        if not self._pending:
+            # Everything logged so far is stored: start the file over
+            self._truncate_spill()
+            return
+        self._spill.write(json.dumps({"committed": seq}).encode() + b"\n")
+        self._spill.flush()
+        await asyncio.to_thread(os.fsync, self._spill.fileno())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Store what is still queued and close the spill file.
+
+        Payloads not stored within `timeout` stay in the spill file and are
+        recovered on the next start.
+        """
+        self._stopping = True
+        self._arrived.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout)
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"[CALL SUMMARY BUFFER] {len(self._pending)} summaries left "
+                    f"in {self._spill_path} for the next start"
+                )
+        if self._spill is not None:
+            empty = self._spill.tell() == 0
+            self._spill.close()
+            if empty:
+                self._spill_path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, object]:
+        """Flusher state, queue depth and counters, for health and monitoring."""
+        return {
+            "flusher_alive": self._task is not None and not self._task.done(),
+            "queued": len(self._pending),
+            "capacity": self._max_size,
+            "stored": self.stored,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,131 @@
+import asyncio
+import logging
+from typing import AsyncIterator, List
+
+from app.business.fmcsa_client import (
+    FMCSAClient,
+    FMCSARequestError,
+    FMCSAUnavailableError,
+)
+from app.schemas.carrier import (
+    CarrierVerification,
+    CarrierVerificationSource,
+    VerifyMCResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+MC_NUMBER_MIN_LENGTH = 5
+MC_NUMBER_MAX_LENGTH = 8
+
+
+def authorization_status(mc_number: str) -> VerifyMCResponse:
+    """
+    FMCSA-style authorization status of a carrier, by local rule.
+
+    - Starts with '5' → authorized.
+    - Others → non-authorized.
+
+    Args:
+        mc_number (str): Motor Carrier number.
+
+    Returns:
+        VerifyMCResponse: Authorization status, carrier name and operation.
+    """
+    if mc_number.startswith("5"):
+        return VerifyMCResponse(
+            status="authorized",
+            carrier_name=f"Carrier MC-{mc_number}",
+            operation="Interstate",
+        )
+    return VerifyMCResponse(
+        status="non-authorized",
+        carrier_name="None",
+        operation="None",
+    )
+
+
+async def _verify(
+    index: int,
+    mc_number: str,
+    source: CarrierVerificationSource,
+    fmcsa: FMCSAClient,
+) -> CarrierVerification:
+    mc_number = mc_number.strip()
+    if not MC_NUMBER_MIN_LENGTH <= len(mc_number) <= MC_NUMBER_MAX_LENGTH:
+        return CarrierVerification(
+            index=index,
+            mc_number=mc_number,
+            error=(
+                f"MC number must have {MC_NUMBER_MIN_LENGTH} to "
+                f"{MC_NUMBER_MAX_LENGTH} characters"
+            ),
+        )
+    if source == CarrierVerificationSource.LOCAL:
+        return CarrierVerification(
+            index=index,
+            mc_number=mc_number,
+            source="local",
+            result=authorization_status(mc_number).model_dump(),
+        )
+
+    try:
+        lookup = await fmcsa.batch_lookup(mc_number)
+    except (FMCSAUnavailableError, FMCSARequestError) as e:
+        return CarrierVerification(index=index, mc_number=mc_number, error=str(e))
+    except Exception as e:
+        # One bad answer must not stop the other verifications
+        logger.error(f"[CARRIER BATCH] MC {mc_number}: {e}", exc_info=True)
+        return CarrierVerification(
+            index=index, mc_number=mc_number, error="Unexpected FMCSA answer"
+        )
+    return CarrierVerification(
+        index=index, mc_number=mc_number, source=lookup.source, result=lookup.payload
+    )
+
+
+async def verify_carriers(
+    mc_numbers: List[str],
+    source: CarrierVerificationSource,
+    fmcsa: FMCSAClient,
+    concurrency: int,
+) -> AsyncIterator[CarrierVerification]:
+    """
+    Verify MC numbers concurrently and yield each result as soon as it is known.
+
+    At most `concurrency` lookups of this batch are in flight. FMCSA lookups
+    go through the shared client, so cached MC numbers are answered without
+    a request, duplicates share one request and an open circuit fails them
+    fast instead of adding load on FMCSA. The client also caps batch
+    lookups across concurrent batches (`batch_concurrency`), so live-call
+    lookups are not queued behind them however many batches run.
+
+    Args:
+        mc_numbers (List[str]): MC numbers to verify, duplicates allowed.
+        source (CarrierVerificationSource): FMCSA API or the local rule.
+        fmcsa (FMCSAClient): Shared FMCSA client.
+        concurrency (int): Maximum lookups of this batch in flight.
+
+    Yields:
+        CarrierVerification: One result per MC number, in completion order;
+        `index` is the position of the MC number in `mc_numbers`.
+    """
+    # Bounded, so slow readers hold back the lookups instead of buffering
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    pending = iter(enumerate(mc_numbers))
+
+    async def worker() -> None:
+        # The shared iterator hands each MC number to exactly one worker
+        for index, mc_number in pending:
+            await results.put(await _verify(index, mc_number, source, fmcsa))
+
+    workers = [
+        asyncio.create_task(worker()) for _ in range(min(concurrency, len(mc_numbers)))
+    ]
+    try:
+        for _ in range(len(mc_numbers)):
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,303 @@
+"""
+Shared client for the FMCSA carrier lookup API.
+
+Carrier verification happens during live calls, so one application-lifetime
+client keeps FMCSA latency and outages off that path:
+
+- a pooled `httpx.AsyncClient` keeps connections alive between lookups;
+- answers are cached per MC number for `FMCSA_CACHE_TTL` seconds (a
+  carrier's authority rarely changes within a day);
+- concurrent lookups of the same MC number share one upstream request;
+- after `FMCSA_BREAKER_FAILURES` consecutive failures (timeouts, connection
+  errors, 5xx) the circuit opens for `FMCSA_BREAKER_RESET` seconds and
+  lookups are not sent upstream; a single trial request then decides
+  whether it closes again;
+- while FMCSA fails, cached answers up to `FMCSA_STALE_TTL` seconds old
+  are served instead of an error;
+- batch lookups share `CARRIER_BATCH_CONCURRENCY` slots across the process,
+  so concurrent batches leave connections free for live-call lookups.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple, Optional
+
+import httpx
+
+from app.core.config import constants, settings
+from app.core.instrumentation import stage
+
+logger = logging.getLogger(__name__)
+
+
+class FMCSAUnavailableError(Exception):
+    """Raised when FMCSA cannot answer and no cached answer is available."""
+
+
+class FMCSARequestError(Exception):
+    """Raised when FMCSA rejects a lookup (4xx), e.g. an invalid web key."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"FMCSA answered {status_code}")
+        self.status_code = status_code
+
+
+class CarrierLookup(NamedTuple):
+    """FMCSA answer and where it came from: `hit`, `miss` or `stale`."""
+
+    payload: dict
+    source: str
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Closed: every request is allowed. Open: requests are refused for
+    `reset_timeout` seconds. Half-open: one trial request is allowed; its
+    success closes the circuit, its failure opens it again.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open.
+        clock (Callable[[], float]): Monotonic time source.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial = False
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._trial or self._clock() - self._opened_at >= self._reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now (claims the half-open trial)."""
+        if self._opened_at is None:
+            return True
+        if self._trial or self._clock() - self._opened_at < self._reset_timeout:
+            return False
+        self._trial = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._trial = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._trial = False
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            if self._opened_at is None:
+                self.opened += 1
+            self._opened_at = self._clock()
+
+
+class _CachedCarrier(NamedTuple):
+    payload: dict
+    fetched_at: float
+
+
+class FMCSAClient:
+    """
+    Pooled, cached and coalescing FMCSA lookups with a circuit breaker.
+
+    Meant to be used from a single event loop; create it at start-up and
+    `aclose` it on shutdown.
+
+    Args:
+        url_template (str): Lookup URL with `{mc_number}` and `{web_key}`.
+        web_key (str): FMCSA web key.
+        cache_ttl (float): Seconds an answer is served without asking FMCSA.
+        stale_ttl (float): Seconds an answer may be served while FMCSA fails.
+        timeout (float): Seconds before an upstream request fails.
+        max_connections (int): Size of the connection pool.
+        batch_concurrency (int): Batch lookups in flight across all batches.
+        breaker (Optional[CircuitBreaker]): Breaker guarding the upstream.
+        clock (Callable[[], float]): Monotonic time source.
+    """
+
+    def __init__(
+        self,
+        url_template: str,
+        web_key: str,
+        cache_ttl: float = 21600.0,
+        stale_ttl: float = 604800.0,
+        timeout: float = 5.0,
+        max_connections: int = 20,
+        batch_concurrency: int = 16,
+        breaker: Optional[CircuitBreaker] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._url_template = url_template
+        self._web_key = web_key
+        self._cache_ttl = cache_ttl
+        self._stale_ttl = stale_ttl
+        self._clock = clock
+        self._breaker = breaker or CircuitBreaker(clock=clock)
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._cache: "OrderedDict[str, _CachedCarrier]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._batch_slots = asyncio.Semaphore(batch_concurrency)
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.stale_served = 0
+        self.upstream_errors = 0
+
+    @classmethod
+    def from_settings(cls) -> "FMCSAClient":
+        """Build a client configured by the `FMCSA_*` settings."""
+        return cls(
+            settings.FMCSA_URL,
+            settings.WEB_KEY,
+            cache_ttl=settings.FMCSA_CACHE_TTL,
+            stale_ttl=settings.FMCSA_STALE_TTL,
+            timeout=settings.FMCSA_TIMEOUT,
+            max_connections=settings.FMCSA_MAX_CONNECTIONS,
+            batch_concurrency=settings.CARRIER_BATCH_CONCURRENCY,
+            breaker=CircuitBreaker(
+                failure_threshold=settings.FMCSA_BREAKER_FAILURES,
+                reset_timeout=settings.FMCSA_BREAKER_RESET,
+            ),
+        )
+
+    async def lookup(self, mc_number: str) -> CarrierLookup:
+        """
+        Carrier details for an MC number, from the cache or FMCSA.
+
+        Args:
+            mc_number (str): Motor Carrier number.
+
+        Raises:
+            FMCSAUnavailableError: If FMCSA failed (or the circuit is open)
+                and no answer younger than `stale_ttl` is cached.
+            FMCSARequestError: If FMCSA rejected the request.
+
+        Returns:
+            CarrierLookup: The FMCSA answer and whether it was cached.
+        """
+        cached = self._cache.get(mc_number)
+        if cached is not None and self._clock() - cached.fetched_at < self._cache_ttl:
+            self._cache.move_to_end(mc_number)
+            self.hits += 1
+            return CarrierLookup(cached.payload, "hit")
+
+        request = self._inflight.get(mc_number)
+        if request is not None:
+            self.coalesced += 1
+        elif not self._breaker.allow():
+            return self._stale_or_raise(mc_number, "circuit open")
+        else:
+            self.misses += 1
+            request = asyncio.ensure_future(self._fetch(mc_number))
+            self._inflight[mc_number] = request
+            request.add_done_callback(lambda done: self._finish(mc_number, done))
+
+        try:
+            # Shielded: a caller that goes away does not cancel the others
+            payload = await asyncio.shield(request)
+        except FMCSAUnavailableError as e:
+            return self._stale_or_raise(mc_number, str(e))
+        return CarrierLookup(payload, "miss")
+
+    async def batch_lookup(self, mc_number: str) -> CarrierLookup:
+        """
+        `lookup` for batch verification, limited to `batch_concurrency`
+        lookups in flight across every batch of the process.
+
+        Args:
+            mc_number (str): Motor Carrier number.
+
+        Raises:
+            FMCSAUnavailableError: As `lookup`.
+            FMCSARequestError: As `lookup`.
+
+        Returns:
+            CarrierLookup: The FMCSA answer and whether it was cached.
+        """
+        async with self._batch_slots:
+            return await self.lookup(mc_number)
+
+    async def _fetch(self, mc_number: str) -> dict:
+        url = self._url_template.format(mc_number=mc_number, web_key=self._web_key)
+        try:
+            with stage("fmcsa.request"):
+                response = await self._client.get(url)
+        except httpx.HTTPError as e:
+            self._record_failure()
+            raise FMCSAUnavailableError(f"FMCSA request failed: {e!r}") from e
+        if response.status_code >= 500:
+            self._record_failure()
+            raise FMCSAUnavailableError(f"FMCSA answered {response.status_code}")
+
+        self._breaker.record_success()
+        if response.status_code >= 400:
+            raise FMCSARequestError(response.status_code)
+        payload = response.json()
+        self._cache[mc_number] = _CachedCarrier(payload, self._clock())
+        self._cache.move_to_end(mc_number)
+        while len(self._cache) > constants.FMCSA_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return payload
+
+    def _finish(self, mc_number: str, request: asyncio.Future) -> None:
+        self._inflight.pop(mc_number, None)
+        if not request.cancelled():
+            request.exception()  # Retrieved here when every caller went away
+
+    def _record_failure(self) -> None:
+        self.upstream_errors += 1
+        self._breaker.record_failure()
+
+    def _stale_or_raise(self, mc_number: str, reason: str) -> CarrierLookup:
+        cached = self._cache.get(mc_number)
+        if cached is None or self._clock() - cached.fetched_at >= self._stale_ttl:
+            raise FMCSAUnavailableError(reason)
+        self.stale_served += 1
+        logger.warning(f"[FMCSA] Serving cached MC {mc_number}: {reason}")
+        return CarrierLookup(cached.payload, "stale")
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._client.aclose()
+
+    def stats(self) -> Dict[str, object]:
+        """Cache, coalescing and breaker counters, for health and monitoring."""
+        return {
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "stale_served": self.stale_served,
+            "upstream_errors": self.upstream_errors,
+            "circuit": self._breaker.state,
+            "circuit_opened": self._breaker.opened,
+        }
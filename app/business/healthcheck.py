@@ -1,3 +1,12 @@
+from typing import Optional
+
+from app.business.call_summary_buffer import CallSummaryBuffer
+from app.business.fmcsa_client import FMCSAClient
+from app.business.load_search_cache import LoadSearchCache
+from app.core.request_capture import RequestCapture
+from app.database_engine.session import get_pool_status
+
+
 class HealthcheckManager:
     """
     Manages the system health status for the API.
@@ -5,11 +14,40 @@ class HealthcheckManager:
     This class is used to check whether the application is running and responsive.
     """
 
-    def status(self) -> dict:
+    def status(
+        self,
+        load_search_cache: Optional[LoadSearchCache] = None,
+        fmcsa_client: Optional[FMCSAClient] = None,
+        request_capture: Optional[RequestCapture] = None,
+        call_summary_buffer: Optional[CallSummaryBuffer] = None,
+    ) -> dict:
         """
         Returns the current health status of the system.
 
+        Includes the live connection pool counters of this worker (checked
+        out, idle and overflow connections) to help size the pools, the
+        load search cache counters when the cache is enabled, the FMCSA
+        cache and circuit breaker state and, when requests are captured or
+        call summaries written behind, whether their background writers are
+        alive and how many records they lost.
+
+        Args:
+            load_search_cache (Optional[LoadSearchCache]): The worker's cache.
+            fmcsa_client (Optional[FMCSAClient]): The worker's FMCSA client.
+            request_capture (Optional[RequestCapture]): The worker's capture.
+            call_summary_buffer (Optional[CallSummaryBuffer]): The worker's
+                write-behind buffer.
+
         Returns:
             dict: A dictionary indicating the system is operational.
         """
-        return {"status": "ok"}
+        status = {"status": "ok", "database_pools": get_pool_status()}
+        if load_search_cache is not None:
+            status["load_search_cache"] = load_search_cache.stats()
+        if fmcsa_client is not None:
+            status["fmcsa"] = fmcsa_client.stats()
+        if request_capture is not None:
+            status["request_capture"] = request_capture.stats()
+        if call_summary_buffer is not None:
+            status["call_summary_buffer"] = call_summary_buffer.stats()
+        return status
@@ -1,46 +1,273 @@
-from typing import Optional, List
+import base64
+import hashlib
+import itertools
+from typing import (
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+)
+import numpy as np
+from numpy.typing import ArrayLike
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.schemas.load import LoadFilter, LoadResponse
-from app.crud.load import filter_loads_from_db
+from app.models.load import Load
+from app.schemas.load import (
+    LoadFilter,
+    LoadResponse,
+    LoadSearchCursor,
+    LoadSearchPage,
+    MatchTier,
+)
+from app.business.load_index import LoadIndex
+from app.crud.load import get_tiered_ranked_loads, get_tiered_ranked_loads_async
 from app.core.config import constants
+from app.core.instrumentation import stage
 
 
-def get_best_load(db: Session, filters: LoadFilter) -> Optional[LoadResponse]:
+def get_best_load(
+    db: Session, filters: LoadFilter, load_index: Optional[LoadIndex] = None
+) -> Optional[LoadResponse]:
     """
     Retrieve the most relevant load based on filtering criteria and business rules.
 
     Steps:
     1. Apply strict filtering based on all provided fields.
-    2. If no results, retry with relaxed filters (e.g., ignore time/miles).
-    3. Prioritize loads with urgency and earlier delivery.
-    4. Enrich the top load with calculated pricing data.
+    2. Fall back to relaxed filters (e.g., ignore time/miles) when nothing
+       matches strictly. Both tiers are evaluated in a single query and
+       strict matches always win.
+    3. Prioritize loads with urgency and earlier delivery (ranked in SQL,
+       see `prioritize_loads` for the reference ordering).
+    4. Enrich the top load with calculated pricing data and the matched tier.
 
     Args:
         db (Session): SQLAlchemy database session.
         filters (LoadFilter): Filtering constraints provided by the user.
+        load_index (Optional[LoadIndex]): In-memory index answering the
+            search instead of the database when it supports the filters.
 
     Returns:
         Optional[LoadResponse]: The top prioritized load with pricing info,
                                 or None if no loads matched.
     """
-    strict_results = filter_loads_from_db(db, filters)
+    relaxed_filters = filters.copy(update=constants.RELAXED_FILTER_FIELDS)
+    if load_index is not None and load_index.supports(filters):
+        with stage("rank_loads.index"):
+            ranked = load_index.tiered_ranked_loads(filters, relaxed_filters, limit=1)
+    else:
+        with stage("rank_loads.db"):
+            ranked = get_tiered_ranked_loads(db, filters, relaxed_filters, limit=1)
 
-    if not strict_results:
-        relaxed_filters = filters.copy(update=constants.RELAXED_FILTER_FIELDS)
-        strict_results = filter_loads_from_db(db, relaxed_filters)
+    if not ranked:
+        return None
+
+    top_load, match_tier = ranked[0]
+    with stage("pricing"):
+        return enrich_with_pricing(top_load, match_tier=match_tier)
+
+
+async def get_best_load_async(
+    db: AsyncSession, filters: LoadFilter, load_index: Optional[LoadIndex] = None
+) -> Optional[LoadResponse]:
+    """
+    Async counterpart of `get_best_load`, used by the API handlers.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        filters (LoadFilter): Filtering constraints provided by the user.
+        load_index (Optional[LoadIndex]): In-memory index answering the
+            search instead of the database when it supports the filters.
+
+    Returns:
+        Optional[LoadResponse]: The top prioritized load with pricing info,
+                                or None if no loads matched.
+    """
+    relaxed_filters = filters.copy(update=constants.RELAXED_FILTER_FIELDS)
+    if load_index is not None and load_index.supports(filters):
+        with stage("rank_loads.index"):
+            ranked = load_index.tiered_ranked_loads(filters, relaxed_filters, limit=1)
+    else:
+        with stage("rank_loads.db"):
+            ranked = await get_tiered_ranked_loads_async(
+                db, filters, relaxed_filters, limit=1
+            )
 
-    if not strict_results:
+    if not ranked:
         return None
 
-    prioritized = prioritize_loads(strict_results)
-    top_load = prioritized[0]
-    return enrich_with_pricing(top_load)
+    top_load, match_tier = ranked[0]
+    with stage("pricing"):
+        return enrich_with_pricing(top_load, match_tier=match_tier)
+
+
+def _filters_digest(filters: LoadFilter) -> str:
+    return hashlib.sha256(filters.model_dump_json().encode()).hexdigest()[:16]
+
+
+def encode_load_cursor(cursor: LoadSearchCursor) -> str:
+    """
+    Serialize a search cursor into the opaque, URL-safe continuation token.
+
+    Args:
+        cursor (LoadSearchCursor): Position of the last load of a page.
+
+    Returns:
+        str: Token to pass back as `cursor`.
+    """
+    payload = cursor.model_dump_json().encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_load_cursor(token: str, filters: LoadFilter) -> LoadSearchCursor:
+    """
+    Parse a continuation token issued for the same filters.
+
+    Args:
+        token (str): Token returned as `next_cursor` by a previous page.
+        filters (LoadFilter): Filters of the current search.
+
+    Raises:
+        ValueError: If the token is malformed or was issued for other filters.
+
+    Returns:
+        LoadSearchCursor: Position to resume the search after.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        cursor = LoadSearchCursor.model_validate_json(payload)
+    except ValueError:  # binascii.Error, ValidationError
+        raise ValueError("Invalid cursor.")
+    if cursor.filters_digest != _filters_digest(filters):
+        raise ValueError("Cursor was issued for different filters.")
+    return cursor
+
+
+def _load_page_request(
+    filters: LoadFilter, limit: Optional[int], cursor: Optional[str]
+) -> Tuple[LoadFilter, Optional[LoadSearchCursor], int]:
+    relaxed_filters = filters.copy(update=constants.RELAXED_FILTER_FIELDS)
+    after = decode_load_cursor(cursor, filters) if cursor else None
+    return relaxed_filters, after, limit or (after.limit if after else 1)
+
+
+def _load_page(
+    ranked: List[Tuple[Load, MatchTier]], limit: int, filters: LoadFilter
+) -> LoadSearchPage:
+    """Price the first `limit` ranked loads; a further one means more pages."""
+    with stage("pricing"):
+        items = [
+            enrich_with_pricing(load, match_tier=tier) for load, tier in ranked[:limit]
+        ]
+    next_cursor = None
+    if len(ranked) > limit:
+        last = items[-1]
+        next_cursor = encode_load_cursor(
+            LoadSearchCursor(
+                match_tier=last.match_tier,
+                urgent=constants.URGENT_KEYWORD in (last.notes or "").lower(),
+                delivery_datetime=last.delivery_datetime,
+                load_id=last.load_id,
+                limit=limit,
+                filters_digest=_filters_digest(filters),
+            )
+        )
+    return LoadSearchPage(items=items, next_cursor=next_cursor)
+
+
+def get_load_page(
+    db: Session,
+    filters: LoadFilter,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    load_index: Optional[LoadIndex] = None,
+) -> LoadSearchPage:
+    """
+    Retrieve the top `limit` loads of a search, ranked and priced.
+
+    Same tiers and ranking as `get_best_load`, but a whole page is returned
+    at once. The continuation token records the last load of the page, so
+    the next page is a keyset query (or index scan) starting right after it
+    instead of ranking the earlier loads again.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        filters (LoadFilter): Filtering constraints provided by the user.
+        limit (Optional[int]): Page size; defaults to the page size of
+            `cursor`, else 1.
+        cursor (Optional[str]): `next_cursor` of the previous page.
+        load_index (Optional[LoadIndex]): In-memory index answering the
+            search instead of the database when it supports the filters.
+
+    Raises:
+        ValueError: If `cursor` is invalid for these filters.
+
+    Returns:
+        LoadSearchPage: Priced loads and the token of the next page.
+    """
+    relaxed_filters, after, limit = _load_page_request(filters, limit, cursor)
+    if load_index is not None and load_index.supports(filters):
+        with stage("rank_loads.index"):
+            ranked = load_index.tiered_ranked_loads(
+                filters, relaxed_filters, limit + 1, after
+            )
+    else:
+        with stage("rank_loads.db"):
+            ranked = get_tiered_ranked_loads(
+                db, filters, relaxed_filters, limit + 1, after
+            )
+    return _load_page(ranked, limit, filters)
+
+
+async def get_load_page_async(
+    db: AsyncSession,
+    filters: LoadFilter,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    load_index: Optional[LoadIndex] = None,
+) -> LoadSearchPage:
+    """
+    Async counterpart of `get_load_page`, used by the API handlers.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        filters (LoadFilter): Filtering constraints provided by the user.
+        limit (Optional[int]): Page size; defaults to the page size of
+            `cursor`, else 1.
+        cursor (Optional[str]): `next_cursor` of the previous page.
+        load_index (Optional[LoadIndex]): In-memory index answering the
+            search instead of the database when it supports the filters.
+
+    Raises:
+        ValueError: If `cursor` is invalid for these filters.
+
+    Returns:
+        LoadSearchPage: Priced loads and the token of the next page.
+    """
+    relaxed_filters, after, limit = _load_page_request(filters, limit, cursor)
+    if load_index is not None and load_index.supports(filters):
+        with stage("rank_loads.index"):
+            ranked = load_index.tiered_ranked_loads(
+                filters, relaxed_filters, limit + 1, after
+            )
+    else:
+        with stage("rank_loads.db"):
+            ranked = await get_tiered_ranked_loads_async(
+                db, filters, relaxed_filters, limit + 1, after
+            )
+    return _load_page(ranked, limit, filters)
 
 
 def prioritize_loads(loads: List) -> List:
     """
     Rank loads based on urgency and delivery date.
 
+    This is the in-memory reference implementation of the ordering that
+    `app.crud.load.load_priority_ordering` evaluates in the database.
+
     Prioritization rules:
     - Loads containing the keyword defined in URGENT_KEYWORD (e.g., "urgent")
       in the `notes` field are ranked first.
@@ -61,13 +288,16 @@ def prioritize_loads(loads: List) -> List:
     )
 
 
-def enrich_with_pricing(load) -> LoadResponse:
+def enrich_with_pricing(
+    load, match_tier: Optional[MatchTier] = None
+) -> LoadResponse:
     """
     Adds calculated pricing metadata (first_offer, max_rate, rate_per_mile)
     to the given load and returns it as a LoadResponse.
 
     Args:
         load: SQLAlchemy load object from the DB.
+        match_tier (Optional[MatchTier]): Filter tier the load matched with.
 
     Returns:
         LoadResponse: Load enriched with pricing details.
@@ -87,6 +317,7 @@ def enrich_with_pricing(load) -> LoadResponse:
         first_offer=pricing["first_offer"],
         max_rate=pricing["max_rate"],
         rate_per_mile=pricing["rate_per_mile"],
+        match_tier=match_tier,
     )
 
 
@@ -138,3 +369,122 @@ def _calculate_load_offer(
         "max_rate": max_rate,
         "rate_per_mile": round(rate_per_mile, 2),
     }
+
+
+class PricingRates(NamedTuple):
+    """
+    Rates applied by the load pricing rules.
+
+    `from_constants` returns the live rates; other values allow what-if
+    repricing with `calculate_load_offers`.
+    """
+
+    base_rate_per_mile: float
+    equipment_premium: float
+    urgency_premium: float
+    medical_premium: float
+    discount_rate: float
+    min_margin: float
+
+    @classmethod
+    def from_constants(cls) -> "PricingRates":
+        return cls(
+            base_rate_per_mile=constants.BASE_RATE_PER_MILE,
+            equipment_premium=constants.EQUIPMENT_PREMIUM,
+            urgency_premium=constants.URGENCY_PREMIUM,
+            medical_premium=constants.MEDICAL_PREMIUM,
+            discount_rate=constants.DISCOUNT_RATE,
+            min_margin=constants.MIN_MARGIN,
+        )
+
+
+def _pricing_flags(
+    values: Union[Sequence[Optional[str]], np.ndarray],
+    rule: Callable[[Optional[str]], bool],
+) -> np.ndarray:
+    """Apply `rule` once per distinct value; boolean arrays are taken as is."""
+    if isinstance(values, np.ndarray) and values.dtype == bool:
+        return values
+    cache: Dict[Optional[str], bool] = {}
+
+    def flag(value: Optional[str]) -> bool:
+        hit = cache.get(value)
+        if hit is None:
+            hit = cache[value] = bool(rule(value))
+        return hit
+
+    return np.fromiter(map(flag, values), dtype=bool, count=len(values))
+
+
+def _rate_per_mile(
+    rates: PricingRates, premium_equipment: bool, urgent: bool, medical: bool
+) -> float:
+    # Same additions, in the same order, as `_calculate_load_offer`
+    rate_per_mile = rates.base_rate_per_mile
+    if premium_equipment:
+        rate_per_mile += rates.equipment_premium
+    if urgent:
+        rate_per_mile += rates.urgency_premium
+    if medical:
+        rate_per_mile += rates.medical_premium
+    return round(rate_per_mile, 2)
+
+
+def calculate_load_offers(
+    miles: ArrayLike,
+    equipment_types: Union[Sequence[str], np.ndarray],
+    notes: Union[Sequence[Optional[str]], np.ndarray],
+    commodity_types: Union[Sequence[Optional[str]], np.ndarray],
+    loadboard_rates: ArrayLike,
+    rates: Optional[PricingRates] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized `_calculate_load_offer` for whole lists of loads.
+
+    Element `i` of each result array equals what `_calculate_load_offer`
+    returns for load `i`. The string rules are evaluated once per distinct
+    value. Callers that already know them can pass boolean arrays instead
+    (premium equipment, urgent notes, medical commodity).
+
+    Args:
+        miles (ArrayLike): Distance per load (not used by the current rules).
+        equipment_types (Union[Sequence[str], np.ndarray]): Equipment per
+            load, or premium-equipment flags.
+        notes (Union[Sequence[Optional[str]], np.ndarray]): Notes per load,
+            or urgency flags.
+        commodity_types (Union[Sequence[Optional[str]], np.ndarray]):
+            Commodity per load, or medical flags.
+        loadboard_rates (ArrayLike): Listed rate per load.
+        rates (Optional[PricingRates]): Rates to price with; defaults to the
+            live `Constants`.
+
+    Returns:
+        Dict[str, np.ndarray]: `first_offer`, `max_rate` and `rate_per_mile`
+        arrays, aligned with the inputs.
+    """
+    rates = rates or PricingRates.from_constants()
+    premium_equipment = _pricing_flags(
+        equipment_types, lambda value: value.lower() in ["reefer", "flatbed"]
+    )
+    urgent = _pricing_flags(notes, lambda value: value and "urgent" in value.lower())
+    medical = _pricing_flags(
+        commodity_types, lambda value: value and "medical" in value.lower()
+    )
+
+    # Only 8 rates per mile exist: compute each like the scalar function
+    rate_table = np.array(
+        [
+            _rate_per_mile(rates, *combination)
+            for combination in itertools.product((False, True), repeat=3)
+        ]
+    )
+    rate_per_mile = rate_table[premium_equipment * 4 + urgent * 2 + medical * 1]
+
+    loadboard_rates = np.asarray(loadboard_rates, dtype=np.float64)
+    first_offer = loadboard_rates * (1 - rates.discount_rate)
+    return {
+        # np.rint rounds half to even, like the built-in round()
+        "first_offer": np.rint(first_offer),
+        "max_rate": np.maximum(loadboard_rates, first_offer + rates.min_margin),
+        "rate_per_mile": rate_per_mile,
+    }
@@ -0,0 +1,155 @@
+import csv
+import json
+import logging
+import time
+import uuid
+from typing import IO, Dict, Iterable, Iterator, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+from app.core.config import constants
+from app.crud.load import upsert_loads
+from app.schemas.load import (
+    LoadImport,
+    LoadImportError,
+    LoadImportFormat,
+    LoadImportReport,
+)
+from app.utils.normalization import normalize_location
+from app.utils.parsing import format_validation_errors
+
+logger = logging.getLogger(__name__)
+
+
+def read_load_records(
+    source: IO[str], import_format: LoadImportFormat
+) -> Iterator[Tuple[int, object]]:
+    """
+    Lazily read load records from a CSV or NDJSON text stream.
+
+    CSV needs a header row with the `LoadImport` field names; empty cells
+    are read as missing values. NDJSON lines that are not valid JSON are
+    yielded as the decoding error so they can be reported per row.
+
+    Args:
+        source (IO[str]): Text stream, opened with `newline=""` for CSV.
+        import_format (LoadImportFormat): Format of the stream.
+
+    Yields:
+        Tuple[int, object]: Source line number and the decoded record.
+    """
+    if import_format == LoadImportFormat.CSV:
+        reader = csv.DictReader(source)
+        for record in reader:
+            yield reader.line_num, {
+                key: value.strip() or None if isinstance(value, str) else value
+                for key, value in record.items()
+                if key is not None
+            }
+        return
+
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError as e:
+            yield line_number, e
+
+
+def to_load_row(record: object) -> dict:
+    """
+    Validate one import record and turn it into `loads` column values.
+
+    Args:
+        record (object): Decoded CSV row or JSON object.
+
+    Raises:
+        ValidationError: If the record does not match `LoadImport`.
+        ValueError: If origin or destination is empty after normalization.
+
+    Returns:
+        dict: Column values, with a generated `load_id` when missing.
+    """
+    row = LoadImport.model_validate(record).model_dump()
+    if row["load_id"] is None:
+        row["load_id"] = uuid.uuid4()
+    for field in ("origin", "destination"):
+        row[field] = normalize_location(row[field])
+        if row[field] is None:
+            raise ValueError(f"{field}: empty location")
+    return row
+
+
+def _reject(report: LoadImportReport, line: int, error: ValueError) -> None:
+    report.rejected += 1
+    if len(report.errors) >= constants.LOAD_IMPORT_MAX_ERRORS:
+        return
+    if isinstance(error, ValidationError):
+        messages = format_validation_errors(error)
+    elif isinstance(error, json.JSONDecodeError):
+        messages = [f"invalid JSON: {error}"]
+    else:
+        messages = [str(error)]
+    report.errors.append(LoadImportError(line=line, errors=messages))
+
+
+def _finish(report: LoadImportReport, started: float) -> LoadImportReport:
+    report.elapsed_sec = round(time.perf_counter() - started, 3)
+    report.rows_per_sec = round(report.upserted / max(report.elapsed_sec, 1e-9), 1)
+    return report
+
+
+def import_loads(
+    db: Session,
+    records: Iterable[Tuple[int, object]],
+    chunk_size: int = constants.LOAD_IMPORT_CHUNK,
+) -> LoadImportReport:
+    """
+    Validate, normalize and upsert load records chunk by chunk.
+
+    Each chunk is committed on its own, so memory stays flat whatever the
+    size of the source and a failure keeps the chunks already imported.
+    Within a chunk the last row for a `load_id` wins.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        records (Iterable[Tuple[int, object]]): `(line, record)` pairs, e.g.
+            from `read_load_records`.
+        chunk_size (int): Rows upserted per transaction.
+
+    Returns:
+        LoadImportReport: Counts, first rejected rows and throughput.
+    """
+    report = LoadImportReport()
+    started = time.perf_counter()
+    chunk: Dict[UUID, dict] = {}
+
+    for line, record in records:
+        report.received += 1
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            row = to_load_row(record)
+        except ValueError as e:
+            _reject(report, line, e)
+            continue
+
+        chunk[row["load_id"]] = row
+        if len(chunk) >= chunk_size:
+            report.upserted += upsert_loads(db, list(chunk.values()))
+            chunk.clear()
+            _finish(report, started)
+            logger.info(
+                f"[LOAD IMPORT] {report.upserted} loads upserted "
+                f"({report.rows_per_sec:.0f} rows/s), {report.rejected} rejected"
+            )
+
+    report.upserted += upsert_loads(db, list(chunk.values()))
+    _finish(report, started)
+    logger.info(
+        f"[LOAD IMPORT] Done: {report.upserted}/{report.received} loads upserted "
+        f"in {report.elapsed_sec:.2f}s ({report.rows_per_sec:.0f} rows/s), "
+        f"{report.rejected} rejected"
+    )
+    return report
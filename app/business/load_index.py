@@ -0,0 +1,687 @@
+"""
+In-memory index of the load catalog.
+
+When `LOAD_INDEX_ENABLED` is set, every worker keeps a columnar copy of the
+loads table and answers load searches without a database round trip:
+
+- rate, weight, miles and pickup time are NumPy arrays, so the range
+  filters are vectorized comparisons;
+- origin, destination, equipment and commodity have an inverted map from
+  the lowercased value to the sorted positions holding it, so a text
+  filter scans the distinct values instead of the rows.
+
+Results match `filter_loads_from_db` and `load_priority_ordering` in the
+substring match mode; fuzzy (pg_trgm) searches still go to the database.
+
+Every `LOAD_INDEX_REFRESH_INTERVAL` seconds the rows whose `updated_at`
+moved are read again and applied. Deleted loads are only dropped by the
+full reload every `LOAD_INDEX_RELOAD_INTERVAL` seconds. A refresh builds a
+new immutable snapshot and swaps it in, so searches never take a lock.
+"""
+
+import asyncio
+import copy
+import logging
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import Select, String, cast, func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import constants, settings
+from app.models.load import Load
+from app.schemas.load import LoadFilter, LoadSearchCursor, MatchTier, TextMatchMode
+from app.utils.parsing import to_naive_utc
+
+logger = logging.getLogger(__name__)
+
+# String columns with an inverted map, filtered like `build_load_conditions`
+TEXT_FILTER_COLUMNS = ("origin", "destination", "equipment_type", "commodity_type")
+STRING_COLUMNS = TEXT_FILTER_COLUMNS + ("notes", "dimensions")
+NUMERIC_COLUMNS = ("loadboard_rate", "weight", "miles", "num_of_pieces")
+DATETIME_COLUMNS = ("pickup_datetime", "delivery_datetime")
+INDEXED_COLUMNS = ("load_id",) + STRING_COLUMNS + NUMERIC_COLUMNS + DATETIME_COLUMNS
+
+# Inclusive range filters of LoadFilter: field -> (column, is a lower bound)
+RANGE_FILTERS = {
+    "pickup_datetime_from": ("pickup_datetime", True),
+    "pickup_datetime_to": ("pickup_datetime", False),
+    "min_weight": ("weight", True),
+    "max_weight": ("weight", False),
+    "min_rate": ("loadboard_rate", True),
+    "max_rate": ("loadboard_rate", False),
+    "min_miles": ("miles", True),
+    "max_miles": ("miles", False),
+}
+
+# Priority key of a load: delivery time in microseconds (below 2**58 in
+# magnitude), missing deliveries after every date, non-urgent loads after
+# every urgent one. Ties are broken by load_id, as in SQL.
+_NO_DELIVERY_KEY = 2**61
+_NOT_URGENT_OFFSET = 2**62
+
+_NO_POSITIONS = np.empty(0, dtype=np.int64)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NAT = np.iinfo(np.int64).min
+
+
+def _like_matcher(term: str) -> Callable[[str], bool]:
+    """
+    Python equivalent of `value ILIKE '%term%'` for lowercased values.
+
+    `%` and `_` in the term are wildcards and `\\` escapes them, as in
+    PostgreSQL.
+    """
+    term = term.lower()
+    if not any(char in term for char in "%_\\"):
+        return lambda value: term in value
+
+    pattern = []
+    chars = iter(term)
+    for char in chars:
+        if char == "\\":
+            pattern.append(re.escape(next(chars, "\\")))
+        elif char == "%":
+            pattern.append(".*")
+        elif char == "_":
+            pattern.append(".")
+        else:
+            pattern.append(re.escape(char))
+    regex = re.compile("".join(pattern), re.DOTALL)
+    return lambda value: regex.search(value) is not None
+
+
+def _same_values(current: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """Element-wise equality where two missing values (NaN/NaT) are equal."""
+    same = current == new
+    if current.dtype.kind == "f":
+        same |= np.isnan(current) & np.isnan(new)
+    elif current.dtype.kind == "M":
+        same |= np.isnat(current) & np.isnat(new)
+    return same
+
+
+class _Vocabulary:
+    """Distinct values of a string column; rows store the value's code."""
+
+    def __init__(self):
+        self.values: List[Optional[str]] = []
+        self.keys: List[Optional[str]] = []  # Lowercased values
+        self.codes: Dict[Optional[str], int] = {}
+
+    def copy(self) -> "_Vocabulary":
+        vocabulary = _Vocabulary()
+        vocabulary.values = list(self.values)
+        vocabulary.keys = list(self.keys)
+        vocabulary.codes = dict(self.codes)
+        return vocabulary
+
+    def encode(self, values: Sequence[Optional[str]]) -> np.ndarray:
+        """Codes of `values`, adding the unseen ones to the vocabulary."""
+        encoded = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.values)
+                self.values.append(value)
+                self.keys.append(None if value is None else value.lower())
+            encoded[i] = code
+        return encoded
+
+
+def _encode_rows(
+    rows: Sequence[Sequence], vocabularies: Dict[str, _Vocabulary]
+) -> Dict[str, np.ndarray]:
+    """
+    Turn rows of `INDEXED_COLUMNS` into column arrays (NULL -> NaN/NaT).
+
+    `load_id` is read as text (see `_columns_statement`): parsing the hex
+    is much cheaper than building UUID objects.
+    """
+    by_column = dict(zip(INDEXED_COLUMNS, zip(*rows)))
+    columns = {
+        "load_id": np.array(
+            [
+                bytes.fromhex(load_id.replace("-", ""))
+                for load_id in by_column.get("load_id", ())
+            ],
+            dtype="S16",
+        )
+    }
+    for name in STRING_COLUMNS:
+        columns[name] = vocabularies[name].encode(by_column.get(name, ()))
+    for name in NUMERIC_COLUMNS:
+        columns[name] = np.array(by_column.get(name, ()), dtype=np.float64)
+    for name in DATETIME_COLUMNS:
+        moments = by_column.get(name, ())
+        columns[name] = np.fromiter(
+            (
+                _NAT if moment is None else (moment - _EPOCH) // _MICROSECOND
+                for moment in moments
+            ),
+            dtype=np.int64,
+            count=len(moments),
+        ).view("datetime64[us]")
+    return columns
+
+
+def _priority_keys(
+    notes: np.ndarray, vocabulary: _Vocabulary, delivery: np.ndarray
+) -> np.ndarray:
+    """Sort keys equivalent to `load_priority_ordering` (without load_id)."""
+    urgent_codes = np.array(
+        [constants.URGENT_KEYWORD in (key or "") for key in vocabulary.keys],
+        dtype=bool,
+    )
+    keys = np.where(np.isnat(delivery), _NO_DELIVERY_KEY, delivery.astype(np.int64))
+    return keys + np.where(urgent_codes[notes], 0, _NOT_URGENT_OFFSET)
+
+
+def _cursor_priority_key(cursor: LoadSearchCursor) -> int:
+    """Priority key of the load a search cursor points at."""
+    delivery = cursor.delivery_datetime
+    key = _NO_DELIVERY_KEY if delivery is None else (delivery - _EPOCH) // _MICROSECOND
+    return key + (0 if cursor.urgent else _NOT_URGENT_OFFSET)
+
+
+def _build_postings(
+    codes: np.ndarray, vocabulary: _Vocabulary
+) -> Dict[str, np.ndarray]:
+    """Inverted map: lowercased value -> sorted positions of the rows holding it."""
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(vocabulary.keys) + 1))
+    grouped: Dict[str, List[np.ndarray]] = {}
+    for code, key in enumerate(vocabulary.keys):
+        if key is not None and bounds[code] < bounds[code + 1]:
+            grouped.setdefault(key, []).append(order[bounds[code] : bounds[code + 1]])
+    return {
+        key: parts[0] if len(parts) == 1 else np.sort(np.concatenate(parts))
+        for key, parts in grouped.items()
+    }
+
+
+def _update_postings(
+    postings: Dict[str, np.ndarray],
+    vocabulary: _Vocabulary,
+    old_codes: np.ndarray,
+    new_codes: np.ndarray,
+    positions: np.ndarray,
+    size: int,
+) -> Dict[str, np.ndarray]:
+    """
+    Move the rows at `positions` from their old keys to their new ones.
+
+    `old_codes` holds -1 for appended rows. Lists of untouched keys are
+    shared with the previous snapshot.
+    """
+    moved = np.zeros(size, dtype=bool)
+    moved[positions] = True
+    touched = {vocabulary.keys[code] for code in old_codes if code >= 0}
+    added: Dict[str, List[int]] = {}
+    for position, code in zip(positions.tolist(), new_codes.tolist()):
+        key = vocabulary.keys[code]
+        if key is not None:
+            added.setdefault(key, []).append(position)
+            touched.add(key)
+
+    updated = dict(postings)
+    for key in touched - {None}:
+        kept = postings.get(key, _NO_POSITIONS)
+        merged = np.union1d(kept[~moved[kept]], added.get(key, _NO_POSITIONS))
+        if len(merged):
+            updated[key] = merged
+        else:
+            updated.pop(key, None)
+    return updated
+
+
+class _Snapshot:
+    """Immutable columnar copy of the loads table at one point in time."""
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        vocabularies: Dict[str, _Vocabulary],
+        postings: Dict[str, Dict[str, np.ndarray]],
+        id_order: np.ndarray,
+        read_at: datetime,
+    ):
+        self.columns = columns
+        self.vocabularies = vocabularies
+        self.postings = postings
+        self.id_order = id_order  # Positions sorted by load_id
+        self.read_at = read_at  # Database clock when the rows were read
+        self.size = len(columns["load_id"])
+
+    @classmethod
+    def build(
+        cls, partitions: Iterable[Sequence[Sequence]], read_at: datetime
+    ) -> "_Snapshot":
+        """Build a snapshot from batches of `INDEXED_COLUMNS` rows."""
+        vocabularies = {name: _Vocabulary() for name in STRING_COLUMNS}
+        chunks = [_encode_rows(rows, vocabularies) for rows in partitions]
+        chunks = chunks or [_encode_rows([], vocabularies)]
+        columns = {
+            name: np.concatenate([chunk[name] for chunk in chunks])
+            for name in INDEXED_COLUMNS
+        }
+        columns["priority"] = _priority_keys(
+            columns["notes"], vocabularies["notes"], columns["delivery_datetime"]
+        )
+        postings = {
+            name: _build_postings(columns[name], vocabularies[name])
+            for name in TEXT_FILTER_COLUMNS
+        }
+        id_order = np.argsort(columns["load_id"], kind="stable")
+        return cls(columns, vocabularies, postings, id_order, read_at)
+
+    def _positions_of(self, load_ids: np.ndarray) -> np.ndarray:
+        """Positions of the given IDs, -1 for the ones not indexed yet."""
+        if not self.size:
+            return np.full(len(load_ids), -1, dtype=np.int64)
+        sorted_ids = self.columns["load_id"][self.id_order]
+        slots = np.minimum(np.searchsorted(sorted_ids, load_ids), self.size - 1)
+        return np.where(sorted_ids[slots] == load_ids, self.id_order[slots], -1)
+
+    def apply(self, rows: Sequence[Sequence], read_at: datetime) -> "_Snapshot":
+        """
+        Return a snapshot with the given rows inserted or updated.
+
+        Rows identical to the indexed ones are skipped, so re-reading
+        unchanged rows (see `LOAD_INDEX_REFRESH_OVERLAP`) costs nothing.
+        """
+        latest = list({row[0]: row for row in rows}.values())
+        vocabularies = {name: self.vocabularies[name].copy() for name in STRING_COLUMNS}
+        changed = _encode_rows(latest, vocabularies)
+        positions = self._positions_of(changed["load_id"])
+
+        found = np.flatnonzero(positions >= 0)
+        unchanged = np.ones(len(found), dtype=bool)
+        for name in INDEXED_COLUMNS[1:]:
+            unchanged &= _same_values(
+                self.columns[name][positions[found]], changed[name][found]
+            )
+        keep = np.ones(len(positions), dtype=bool)
+        keep[found[unchanged]] = False
+        if not keep.any():
+            snapshot = copy.copy(self)
+            snapshot.read_at = read_at
+            return snapshot
+
+        changed = {name: values[keep] for name, values in changed.items()}
+        positions = positions[keep]
+        is_new = positions < 0
+        size = self.size + int(is_new.sum())
+        positions[is_new] = np.arange(self.size, size)
+
+        columns = {}
+        for name in INDEXED_COLUMNS:
+            column = np.concatenate((self.columns[name], changed[name][is_new]))
+            column[positions] = changed[name]
+            columns[name] = column
+        columns["priority"] = _priority_keys(
+            columns["notes"], vocabularies["notes"], columns["delivery_datetime"]
+        )
+
+        postings = {}
+        for name in TEXT_FILTER_COLUMNS:
+            old_codes = np.full(len(positions), -1, dtype=np.int64)
+            old_codes[~is_new] = self.columns[name][positions[~is_new]]
+            postings[name] = _update_postings(
+                self.postings[name],
+                vocabularies[name],
+                old_codes,
+                changed[name],
+                positions,
+                size,
+            )
+
+        id_order = self.id_order
+        if is_new.any():
+            new_ids = changed["load_id"][is_new]
+            order = np.argsort(new_ids, kind="stable")
+            slots = np.searchsorted(self.columns["load_id"][id_order], new_ids[order])
+            id_order = np.insert(id_order, slots, positions[is_new][order])
+
+        return _Snapshot(columns, vocabularies, postings, id_order, read_at)
+
+    def match(self, filters: LoadFilter) -> np.ndarray:
+        """Sorted positions of the loads matching `filters` (substring mode)."""
+        text_filters = []
+        for name in TEXT_FILTER_COLUMNS:
+            term = getattr(filters, name)
+            if not term:
+                continue
+            matches = _like_matcher(term)
+            keys = [key for key in self.postings[name] if matches(key)]
+            if not keys:
+                return _NO_POSITIONS
+            matched = sum(len(self.postings[name][key]) for key in keys)
+            text_filters.append((matched, name, keys))
+
+        # Rows of the most selective text filter, checked against the others
+        candidates = None
+        for _, name, keys in sorted(text_filters):
+            if candidates is None:
+                parts = [self.postings[name][key] for key in keys]
+                candidates = (
+                    parts[0] if len(parts) == 1 else np.sort(np.concatenate(parts))
+                )
+                continue
+            keys = set(keys)
+            codes = [
+                code
+                for code, key in enumerate(self.vocabularies[name].keys)
+                if key in keys
+            ]
+            candidates = candidates[np.isin(self.columns[name][candidates], codes)]
+
+        mask = None
+        for field, (name, is_lower_bound) in RANGE_FILTERS.items():
+            bound = getattr(filters, field)
+            if bound is None:
+                continue
+            if isinstance(bound, datetime):
+                bound = np.datetime64(to_naive_utc(bound), "us")
+            column = self.columns[name]
+            if candidates is not None:
+                column = column[candidates]
+            hits = column >= bound if is_lower_bound else column <= bound
+            mask = hits if mask is None else mask & hits
+
+        if candidates is None:
+            return np.arange(self.size) if mask is None else np.flatnonzero(mask)
+        return candidates if mask is None else candidates[mask]
+
+    def top(self, positions: np.ndarray, limit: int) -> np.ndarray:
+        """The `limit` highest-priority positions, in priority order."""
+        if limit <= 0:
+            return _NO_POSITIONS
+        keys = self.columns["priority"][positions]
+        if len(positions) > limit:
+            # Keep only the rows that can make the top, ties included
+            within = keys <= np.partition(keys, limit - 1)[limit - 1]
+            positions, keys = positions[within], keys[within]
+        order = np.lexsort((self.columns["load_id"][positions], keys))
+        return positions[order[:limit]]
+
+    def after(self, positions: np.ndarray, cursor: LoadSearchCursor) -> np.ndarray:
+        """The positions ranked after `cursor`, like `after_priority_position`."""
+        key = _cursor_priority_key(cursor)
+        keys = self.columns["priority"][positions]
+        later = keys > key
+        ties = keys == key
+        if ties.any():
+            load_ids = self.columns["load_id"][positions[ties]]
+            later[ties] = load_ids > np.bytes_(cursor.load_id.bytes)
+        return positions[later]
+
+    def load(self, position: int) -> Load:
+        """Materialize the row at `position` as a (transient) Load."""
+        load_id = bytes(self.columns["load_id"][position]).ljust(16, b"\0")
+        values = {"load_id": UUID(bytes=load_id)}
+        for name in STRING_COLUMNS:
+            values[name] = self.vocabularies[name].values[self.columns[name][position]]
+        for name in NUMERIC_COLUMNS:
+            number = float(self.columns[name][position])
+            values[name] = None if np.isnan(number) else number
+        for name in DATETIME_COLUMNS:
+            moment = self.columns[name][position]
+            values[name] = None if np.isnat(moment) else moment.item()
+        if values["num_of_pieces"] is not None:
+            values["num_of_pieces"] = int(values["num_of_pieces"])
+        return Load(**values)
+
+
+def _database_now(db: Session) -> datetime:
+    """
+    Database clock, in the time domain `updated_at` is stored in.
+
+    On PostgreSQL, `TIMESTAMP DEFAULT NOW()` stores the local time of the
+    session `TimeZone`, so the clock is read as `LOCALTIMESTAMP`: the naive
+    UTC of `now()` would be off by the offset of any other time zone, and
+    refreshes would miss changed rows (west of UTC) or re-read hours of
+    them (east of UTC). SQLite's `CURRENT_TIMESTAMP` is already naive UTC.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return db.scalar(select(func.localtimestamp()))
+    return to_naive_utc(db.scalar(select(func.now())))
+
+
+def _columns_statement() -> Select:
+    columns = [Load.__table__.c[name] for name in INDEXED_COLUMNS]
+    columns[0] = cast(Load.load_id, String).label("load_id")
+    return select(*columns)
+
+
+class LoadIndex:
+    """
+    Worker-local columnar index of the loads table, refreshed in the background.
+
+    Searches must check `supports` first and fall back to the database
+    otherwise (index not loaded yet, fuzzy matching).
+
+    Args:
+        session_factory (Callable[[], Session]): Creates the sync sessions
+            used to read the loads table (in a worker thread).
+        refresh_interval (float): Seconds between incremental refreshes.
+        reload_interval (float): Seconds between full reloads, which also
+            drop deleted loads.
+        on_change (Optional[Callable[[], None]]): Called after a reload, or
+            after a refresh that changed indexed loads (e.g. to invalidate
+            cached search results).
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        refresh_interval: float = 5.0,
+        reload_interval: float = 900.0,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
+        self._session_factory = session_factory
+        self._refresh_interval = refresh_interval
+        self._reload_interval = reload_interval
+        self._on_change = on_change
+        self._snapshot: Optional[_Snapshot] = None
+        self._task: Optional[asyncio.Task] = None
+        self.refreshed_at: Optional[datetime] = None
+
+    @classmethod
+    def from_settings(
+        cls,
+        session_factory: Callable[[], Session],
+        on_change: Optional[Callable[[], None]] = None,
+    ) -> "LoadIndex":
+        """Build an index configured by the `LOAD_INDEX_*` settings."""
+        return cls(
+            session_factory,
+            refresh_interval=settings.LOAD_INDEX_REFRESH_INTERVAL,
+            reload_interval=settings.LOAD_INDEX_RELOAD_INTERVAL,
+            on_change=on_change,
+        )
+
+    def supports(self, filters: LoadFilter) -> bool:
+        """Whether the index is loaded and can evaluate these filters."""
+        return (
+            self._snapshot is not None and filters.match_mode == TextMatchMode.SUBSTRING
+        )
+
+    def reload(self) -> int:
+        """
+        Read the whole loads table into a new snapshot (blocking).
+
+        Returns:
+            int: Number of loads indexed.
+        """
+        started = time.perf_counter()
+        with self._session_factory() as db:
+            read_at = _database_now(db)
+            result = db.execute(
+                _columns_statement().execution_options(
+                    yield_per=constants.LOAD_INDEX_FETCH_BATCH
+                )
+            )
+            snapshot = _Snapshot.build(result.partitions(), read_at)
+        self._snapshot = snapshot
+        self.refreshed_at = datetime.now(timezone.utc)
+        if self._on_change is not None:
+            self._on_change()
+        logger.info(
+            f"[LOAD INDEX] Loaded {snapshot.size} loads in "
+            f"{time.perf_counter() - started:.2f}s"
+        )
+        return snapshot.size
+
+    def refresh(self) -> int:
+        """
+        Apply the loads inserted or updated since the last read (blocking).
+
+        Rows with an `updated_at` up to `LOAD_INDEX_REFRESH_OVERLAP` seconds
+        before the previous read are read again, so changes committed by
+        transactions that were already running then are not missed.
+
+        Returns:
+            int: Number of rows read.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.reload()
+
+        since = snapshot.read_at - timedelta(
+            seconds=constants.LOAD_INDEX_REFRESH_OVERLAP
+        )
+        with self._session_factory() as db:
+            read_at = _database_now(db)
+            rows = db.execute(
+                _columns_statement().where(Load.updated_at >= since)
+            ).all()
+
+        self._snapshot = snapshot.apply(rows, read_at)
+        self.refreshed_at = datetime.now(timezone.utc)
+        # Unchanged rows give a snapshot sharing the previous columns
+        changed = self._snapshot.columns is not snapshot.columns
+        if changed and self._on_change is not None:
+            self._on_change()
+        if self._snapshot.size != snapshot.size:
+            logger.info(f"[LOAD INDEX] {self._snapshot.size} loads indexed")
+        return len(rows)
+
+    async def start(self) -> None:
+        """Load the index and start the background refresh task."""
+        try:
+            await asyncio.to_thread(self.reload)
+        except Exception as e:
+            # Searches use the database until a later refresh succeeds
+            logger.error(f"[LOAD INDEX] Initial load failed: {e}", exc_info=True)
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        reloaded_at = loop.time()
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                if loop.time() - reloaded_at >= self._reload_interval:
+                    await asyncio.to_thread(self.reload)
+                    reloaded_at = loop.time()
+                else:
+                    await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logger.error(f"[LOAD INDEX] Refresh failed: {e}", exc_info=True)
+
+    async def stop(self) -> None:
+        """Stop the background refresh task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def filter_loads(self, filters: LoadFilter) -> List[Load]:
+        """
+        In-memory counterpart of `filter_loads_from_db`.
+
+        Args:
+            filters (LoadFilter): Filtering criteria (substring match mode).
+
+        Returns:
+            List[Load]: All loads matching the given filters
+        """
+        snapshot = self._snapshot
+        return [snapshot.load(position) for position in snapshot.match(filters)]
+
+    def ranked_loads(self, filters: LoadFilter, limit: int = 1) -> List[Load]:
+        """
+        In-memory counterpart of `get_ranked_loads`.
+
+        Args:
+            filters (LoadFilter): Filtering criteria (substring match mode).
+            limit (int): Maximum number of loads to return
+
+        Returns:
+            List[Load]: Matching loads from most to least priority
+        """
+        snapshot = self._snapshot
+        positions = snapshot.top(snapshot.match(filters), limit)
+        return [snapshot.load(position) for position in positions]
+
+    def tiered_ranked_loads(
+        self,
+        filters: LoadFilter,
+        relaxed_filters: LoadFilter,
+        limit: int = 1,
+        after: Optional[LoadSearchCursor] = None,
+    ) -> List[Tuple[Load, MatchTier]]:
+        """
+        In-memory counterpart of `get_tiered_ranked_loads`.
+
+        Args:
+            filters (LoadFilter): Strict filtering criteria
+            relaxed_filters (LoadFilter): Fallback criteria used when nothing
+                matches strictly
+            limit (int): Maximum number of loads to return
+            after (Optional[LoadSearchCursor]): Last load of the previous page
+
+        Returns:
+            List[Tuple[Load, MatchTier]]: Ranked loads with the tier they matched
+        """
+        snapshot = self._snapshot
+        strict = snapshot.match(filters)
+        strict_after = strict
+        if after is not None:
+            strict_after = (
+                snapshot.after(strict, after)
+                if after.match_tier == MatchTier.STRICT
+                else _NO_POSITIONS
+            )
+        ranked = [
+            (position, MatchTier.STRICT)
+            for position in snapshot.top(strict_after, limit)
+        ]
+        if len(ranked) < limit and relaxed_filters != filters:
+            relaxed = np.setdiff1d(
+                snapshot.match(relaxed_filters), strict, assume_unique=True
+            )
+            if after is not None and after.match_tier == MatchTier.RELAXED:
+                relaxed = snapshot.after(relaxed, after)
+            ranked += [
+                (position, MatchTier.RELAXED)
+                for position in snapshot.top(relaxed, limit - len(ranked))
+            ]
+        return [(snapshot.load(position), tier) for position, tier in ranked]
+
+    def stats(self) -> Dict[str, object]:
+        """Indexed loads and the time of the last refresh, for monitoring."""
+        snapshot = self._snapshot
+        return {
+            "loads": 0 if snapshot is None else snapshot.size,
+            "refreshed_at": self.refreshed_at,
+        }
@@ -0,0 +1,151 @@
+"""
+Short-lived cache of load search results.
+
+During a call the agent often repeats the same `/loads` search. When
+`LOAD_SEARCH_CACHE_ENABLED` is set, each worker keeps the results of the
+last `LOAD_SEARCH_CACHE_SIZE` searches for `LOAD_SEARCH_CACHE_TTL` seconds,
+keyed by a canonical hash of the normalized `LoadFilter` (and page
+parameters).
+
+The cache is emptied when this worker imports loads and whenever the load
+index applies changed rows, which covers writes made by other processes.
+Without the load index, the TTL bounds how long such writes go unseen.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+from app.schemas.load import LoadFilter
+
+logger = logging.getLogger(__name__)
+
+
+class LoadSearchCache:
+    """
+    Thread-safe LRU cache of search results with a time to live.
+
+    Results are stored with the generation they were computed in, and
+    `put` drops them when an invalidation happened meanwhile, so a search
+    racing with an import cannot cache rows read before it.
+
+    Args:
+        max_entries (int): Results kept before the least recently used is
+            evicted.
+        ttl (float): Seconds a result is served for.
+        clock (Callable[[], float]): Monotonic time source.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_settings(cls) -> "LoadSearchCache":
+        """Build a cache configured by the `LOAD_SEARCH_CACHE_*` settings."""
+        return cls(
+            max_entries=settings.LOAD_SEARCH_CACHE_SIZE,
+            ttl=settings.LOAD_SEARCH_CACHE_TTL,
+        )
+
+    @staticmethod
+    def key(filters: LoadFilter, *params: Hashable) -> str:
+        """
+        Canonical key of a search.
+
+        Args:
+            filters (LoadFilter): Normalized filters of the search.
+            *params (Hashable): Other parameters shaping the result (page
+                size, continuation token...).
+
+        Returns:
+            str: SHA-256 of the filters and parameters, as JSON with sorted keys.
+        """
+        payload = json.dumps(
+            [filters.model_dump(mode="json"), list(params)],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Tuple[bool, object]:
+        """
+        Look up a result and mark it as recently used.
+
+        Args:
+            key (str): Key from `LoadSearchCache.key`.
+
+        Returns:
+            Tuple[bool, object]: Whether the key was cached (and not
+            expired), and its result. Results can be None (no loads found).
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: str, value: object, generation: Optional[int] = None) -> None:
+        """
+        Store a result, evicting the least recently used ones beyond capacity.
+
+        Args:
+            key (str): Key from `LoadSearchCache.key`.
+            value (object): Result to serve; must not be mutated afterwards.
+            generation (Optional[int]): `generation` read before computing the
+                result; the result is dropped if the cache was invalidated since.
+        """
+        expires_at = self._clock() + self._ttl
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        """Drop every cached result, e.g. after loads were inserted or updated."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            self.invalidations += 1
+        logger.debug("[LOAD SEARCH CACHE] Invalidated")
+
+    def stats(self) -> Dict[str, int]:
+        """Size and lifetime counters, for health and monitoring."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "capacity": self._max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
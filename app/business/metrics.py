@@ -1,20 +1,71 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Mapping, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.models.call_summary import CallSummary
+from sqlalchemy import Select, func, select
+from app.crud.metrics_rollup import (
+    AVERAGED_FIELDS,
+    ROLLUP_COUNTERS,
+    floor_to_hour,
+    hourly_table,
+    rollup_aggregates,
+    rollup_totals_columns,
+)
+from app.models.call_summary import CallOutcomeEnum, CallSummary
 from app.models.load import Load
 from app.schemas.metrics import (
+    MetricsBucket,
+    MetricsPoint,
     MetricsResponse,
+    MetricsSeriesResponse,
     SentimentSummary,
     SatisfactionStats,
 )
 
 
+def _total_loads():
+    return select(func.count()).select_from(Load).scalar_subquery().label("total_loads")
+
+
+def metrics_statement() -> Select:
+    """
+    Build the query behind `calculate_metrics`.
+
+    Reads the incrementally maintained `call_metrics_rollup` table, so the
+    cost does not grow with the number of call summaries: it sums a fixed
+    number of shard rows. `total_loads` is a scalar subquery over the loads
+    table.
+
+    Returns:
+        Select: Statement yielding one row with a column per rollup counter.
+    """
+    return select(_total_loads(), *rollup_totals_columns())
+
+
+def live_metrics_statement() -> Select:
+    """
+    Same row as `metrics_statement`, aggregated from the raw call summaries.
+
+    Every counter is a conditional aggregate (`count(*) FILTER (WHERE ...)`),
+    so `call_summaries` is scanned once. Used as the reference for the
+    rollup consistency check.
+
+    Returns:
+        Select: Statement yielding one row with a column per rollup counter.
+    """
+    return select(_total_loads(), *rollup_aggregates().values()).select_from(
+        CallSummary
+    )
+
+
 def calculate_metrics(db: Session) -> MetricsResponse:
     """
     Calculate operational metrics from the database.
 
     This function aggregates key statistics from the `Load` and `CallSummary`
     tables to generate insights into system usage and carrier negotiations.
+    Call statistics come from the metrics rollup, see `metrics_statement`.
 
     Args:
         db (Session): SQLAlchemy database session.
@@ -29,78 +80,267 @@ def calculate_metrics(db: Session) -> MetricsResponse:
             - sentiment breakdown
             - satisfaction statistics
     """
+    row = db.execute(metrics_statement()).mappings().one()
+    return build_metrics_response(row)
 
-    # Aggregate general counts
-    total_loads = db.query(Load).count()
-    total_calls = db.query(CallSummary).count()
 
-    # Count different negotiation outcomes
-    accepted = db.query(CallSummary).filter(CallSummary.outcome == "accepted").count()
-    rejected = db.query(CallSummary).filter(CallSummary.outcome == "rejected").count()
-    failed_negotiation = (
-        db.query(CallSummary)
-        .filter(CallSummary.outcome == "failed_negotiation")
-        .count()
-    )
-    no_response = (
-        db.query(CallSummary).filter(CallSummary.outcome == "no_response").count()
-    )
-    follow_ups = (
-        db.query(CallSummary)
-        .filter(CallSummary.outcome == "interested_follow_up")
-        .count()
+async def calculate_metrics_async(db: AsyncSession) -> MetricsResponse:
+    """
+    Async counterpart of `calculate_metrics`, used by the API handlers.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+
+    Returns:
+        MetricsResponse: Same metrics as `calculate_metrics`.
+    """
+    result = await db.execute(metrics_statement())
+    return build_metrics_response(result.mappings().one())
+
+
+def _window_conditions(start: Optional[datetime], end: Optional[datetime]) -> List:
+    # Windows are aligned to the hourly buckets: `start` is floored to the
+    # hour and every bucket starting before `end` is included.
+    conditions = []
+    if start is not None:
+        conditions.append(hourly_table.c.bucket_start >= floor_to_hour(start))
+    if end is not None:
+        conditions.append(hourly_table.c.bucket_start < end)
+    return conditions
+
+
+def window_metrics_statement(
+    start: Optional[datetime], end: Optional[datetime]
+) -> Select:
+    """
+    Build the query behind `calculate_window_metrics`.
+
+    Args:
+        start (Optional[datetime]): Inclusive start of the window (UTC).
+        end (Optional[datetime]): Exclusive end of the window (UTC).
+
+    Returns:
+        Select: Statement yielding one row with `total_loads` and the rollup
+        counters added up over the hourly buckets of the window.
+    """
+    return select(_total_loads(), *rollup_totals_columns(hourly_table)).where(
+        *_window_conditions(start, end)
     )
 
-    # Compute average agreed price
-    prices = (
-        db.query(CallSummary.agreed_price)
-        .filter(CallSummary.agreed_price.isnot(None))
-        .all()
+
+def hourly_series_statement(
+    start: Optional[datetime], end: Optional[datetime]
+) -> Select:
+    """
+    Build the query returning one row per non-empty hour of the window.
+
+    Args:
+        start (Optional[datetime]): Inclusive start of the window (UTC).
+        end (Optional[datetime]): Exclusive end of the window (UTC).
+
+    Returns:
+        Select: Statement yielding `bucket_start`, `total_loads` and the
+        rollup counters summed over the shards of each hour.
+    """
+    return (
+        select(
+            hourly_table.c.bucket_start,
+            _total_loads(),
+            *rollup_totals_columns(hourly_table),
+        )
+        .where(*_window_conditions(start, end))
+        .group_by(hourly_table.c.bucket_start)
+        .order_by(hourly_table.c.bucket_start)
     )
-    avg_price = round(sum(p[0] for p in prices) / len(prices), 2) if prices else 0
 
-    # Compute averages
-    avg_duration = db.query(func.avg(CallSummary.call_duration_sec)).scalar() or 0
-    avg_attempts = db.query(func.avg(CallSummary.attempts)).scalar() or 0
-    avg_counter_offers = db.query(func.avg(CallSummary.counter_offers)).scalar() or 0
 
-    # Satisfaction counts
-    satisfied = db.query(CallSummary).filter(CallSummary.satisfaction.is_(True)).count()
-    unsatisfied = (
-        db.query(CallSummary).filter(CallSummary.satisfaction.is_(False)).count()
+def bucket_start_of(moment: datetime, bucket: MetricsBucket) -> datetime:
+    """
+    Start of the hour, day or ISO week (Monday) containing `moment`.
+
+    Args:
+        moment (datetime): Point in time (UTC).
+        bucket (MetricsBucket): Granularity of the series.
+
+    Returns:
+        datetime: Start of the bucket.
+    """
+    start = floor_to_hour(moment)
+    if bucket == MetricsBucket.HOUR:
+        return start
+    start = start.replace(hour=0)
+    if bucket == MetricsBucket.DAY:
+        return start
+    return start - timedelta(days=start.weekday())
+
+
+def build_metrics_series(
+    rows: Iterable[Mapping],
+    bucket: MetricsBucket,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> MetricsSeriesResponse:
+    """
+    Add up hourly rows into hour, day or week points.
+
+    Args:
+        rows (Iterable[Mapping]): Rows of `hourly_series_statement`.
+        bucket (MetricsBucket): Granularity of the series.
+        start (Optional[datetime]): Start of the requested window.
+        end (Optional[datetime]): End of the requested window.
+
+    Returns:
+        MetricsSeriesResponse: One point per non-empty bucket.
+    """
+    totals: Dict[datetime, Dict[str, float]] = defaultdict(
+        lambda: defaultdict(int)
     )
-    unknown_satisfaction = total_calls - satisfied - unsatisfied
-
-    # Sentiment breakdown
-    sentiment_summary = SentimentSummary(
-        positive=db.query(CallSummary)
-        .filter(CallSummary.sentiment == "positive")
-        .count(),
-        neutral=db.query(CallSummary)
-        .filter(CallSummary.sentiment == "neutral")
-        .count(),
-        negative=db.query(CallSummary)
-        .filter(CallSummary.sentiment == "negative")
-        .count(),
+    total_loads = 0
+    for row in rows:
+        total_loads = row["total_loads"]
+        point = totals[bucket_start_of(row["bucket_start"], bucket)]
+        for name in ROLLUP_COUNTERS:
+            point[name] += row[name]
+
+    return MetricsSeriesResponse(
+        bucket=bucket,
+        from_=start,
+        to=end,
+        points=[
+            MetricsPoint(
+                bucket_start=bucket_start,
+                metrics=build_metrics_response(
+                    {"total_loads": total_loads, **counters}
+                ),
+            )
+            for bucket_start, counters in sorted(totals.items())
+        ],
     )
 
-    # Construct and return full metrics response
+
+def calculate_window_metrics(
+    db: Session, start: Optional[datetime], end: Optional[datetime]
+) -> MetricsResponse:
+    """
+    Calculate the operational metrics of the calls logged within a window.
+
+    Served from the hourly rollup, so the cost depends on the number of
+    hours in the window, not on the number of call summaries.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        start (Optional[datetime]): Inclusive start of the window (UTC).
+        end (Optional[datetime]): Exclusive end of the window (UTC).
+
+    Returns:
+        MetricsResponse: Metrics of the window; `total_loads` is the
+        current number of loads.
+    """
+    row = db.execute(window_metrics_statement(start, end)).mappings().one()
+    return build_metrics_response(row)
+
+
+async def calculate_window_metrics_async(
+    db: AsyncSession, start: Optional[datetime], end: Optional[datetime]
+) -> MetricsResponse:
+    """
+    Async counterpart of `calculate_window_metrics`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        start (Optional[datetime]): Inclusive start of the window (UTC).
+        end (Optional[datetime]): Exclusive end of the window (UTC).
+
+    Returns:
+        MetricsResponse: Same metrics as `calculate_window_metrics`.
+    """
+    result = await db.execute(window_metrics_statement(start, end))
+    return build_metrics_response(result.mappings().one())
+
+
+def calculate_metrics_series(
+    db: Session,
+    bucket: MetricsBucket,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> MetricsSeriesResponse:
+    """
+    Calculate the operational metrics per hour, day or week.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        bucket (MetricsBucket): Granularity of the series.
+        start (Optional[datetime]): Inclusive start of the window (UTC).
+        end (Optional[datetime]): Exclusive end of the window (UTC).
+
+    Returns:
+        MetricsSeriesResponse: One point per non-empty bucket.
+    """
+    rows = db.execute(hourly_series_statement(start, end)).mappings()
+    return build_metrics_series(rows, bucket, start, end)
+
+
+async def calculate_metrics_series_async(
+    db: AsyncSession,
+    bucket: MetricsBucket,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> MetricsSeriesResponse:
+    """
+    Async counterpart of `calculate_metrics_series`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        bucket (MetricsBucket): Granularity of the series.
+        start (Optional[datetime]): Inclusive start of the window (UTC).
+        end (Optional[datetime]): Exclusive end of the window (UTC).
+
+    Returns:
+        MetricsSeriesResponse: Same series as `calculate_metrics_series`.
+    """
+    result = await db.execute(hourly_series_statement(start, end))
+    return build_metrics_series(result.mappings(), bucket, start, end)
+
+
+def build_metrics_response(row: Mapping) -> MetricsResponse:
+    """
+    Map a row of rollup counters to the response schema.
+
+    Args:
+        row (Mapping): `total_loads` plus every rollup counter, e.g. a row
+            returned by `metrics_statement` or `live_metrics_statement`.
+
+    Returns:
+        MetricsResponse: Computed metrics.
+    """
+    averages = {}
+    for field in AVERAGED_FIELDS:
+        count = row[f"{field}_count"]
+        # No values means an average of 0 (AVG over an empty set is NULL)
+        averages[field] = round(float(row[f"{field}_sum"]) / count, 2) if count else 0
+
+    total_calls = row["total_calls"]
+
     return MetricsResponse(
-        total_loads=total_loads,
+        total_loads=row["total_loads"],
         total_calls=total_calls,
-        accepted=accepted,
-        rejected=rejected,
-        failed_negotiation=failed_negotiation,
-        no_response=no_response,
-        interested_follow_up=follow_ups,
-        avg_agreed_price=avg_price,
-        avg_call_duration_sec=round(avg_duration, 2),
-        avg_attempts=round(avg_attempts, 2),
-        avg_counter_offers=round(avg_counter_offers, 2),
-        sentiment_summary=sentiment_summary,
+        accepted=row[CallOutcomeEnum.accepted.value],
+        rejected=row[CallOutcomeEnum.rejected.value],
+        failed_negotiation=row[CallOutcomeEnum.failed_negotiation.value],
+        no_response=row[CallOutcomeEnum.no_response.value],
+        interested_follow_up=row[CallOutcomeEnum.interested_follow_up.value],
+        avg_agreed_price=averages["agreed_price"],
+        avg_call_duration_sec=averages["call_duration_sec"],
+        avg_attempts=averages["attempts"],
+        avg_counter_offers=averages["counter_offers"],
+        sentiment_summary=SentimentSummary(
+            positive=row["sentiment_positive"],
+            neutral=row["sentiment_neutral"],
+            negative=row["sentiment_negative"],
+        ),
         satisfaction_summary=SatisfactionStats(
-            satisfied=satisfied,
-            unsatisfied=unsatisfied,
-            unknown=unknown_satisfaction,
+            satisfied=row["satisfied"],
+            unsatisfied=row["unsatisfied"],
+            unknown=total_calls - row["satisfied"] - row["unsatisfied"],
         ),
     )
@@ -1,4 +1,12 @@
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
 from app.schemas.negotiations import (
+    CounterOfferBatchRequest,
+    CounterOfferBatchResponse,
+    CounterOfferBatchResult,
     CounterOfferRequest,
     CounterOfferResponse,
     FinalStatus,
@@ -6,6 +14,11 @@ from app.schemas.negotiations import (
 
 from app.core.config import constants
 
+# Name of the live `Constants` strategy in batch evaluations
+CURRENT_STRATEGY = "current"
+# `status_counts` key of the offers in rounds beyond a strategy's limit
+OUT_OF_RANGE = "out_of_range"
+
 
 def evaluate_counter_offer(req: CounterOfferRequest) -> CounterOfferResponse:
     """
@@ -68,3 +81,169 @@ def evaluate_counter_offer(req: CounterOfferRequest) -> CounterOfferResponse:
         rounds_left=constants.MAX_NEGOTIATION_ROUNDS - round_num,
         message=f"Thanks — I can do ${next_offer:.2f}. What do you think?",
     )
+
+
+class NegotiationRules(NamedTuple):
+    """
+    Constants applied by the negotiation rules.
+
+    `from_constants` returns the live rules; other values allow evaluating
+    alternative strategies with `evaluate_counter_offers`.
+    """
+
+    max_negotiation_rounds: int
+    rounding_step: float
+
+    @classmethod
+    def from_constants(cls) -> "NegotiationRules":
+        return cls(
+            max_negotiation_rounds=constants.MAX_NEGOTIATION_ROUNDS,
+            rounding_step=constants.ROUNDING_STEP,
+        )
+
+
+def evaluate_counter_offers(
+    carrier_offers: ArrayLike,
+    last_offers: ArrayLike,
+    negotiation_rounds: ArrayLike,
+    max_rates: ArrayLike,
+    rules: Optional[NegotiationRules] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized `evaluate_counter_offer` for whole arrays of offers.
+
+    Element `i` of each result array equals the `final_status`,
+    `counter_suggestion` and `rounds_left` that `evaluate_counter_offer`
+    returns for offer `i` (messages are not built).
+
+    Args:
+        carrier_offers (ArrayLike): Offer of the carrier per negotiation.
+        last_offers (ArrayLike): Our previous proposal per negotiation.
+        negotiation_rounds (ArrayLike): Current round per negotiation.
+        max_rates (ArrayLike): Maximum allowable rate per negotiation.
+        rules (Optional[NegotiationRules]): Rules to evaluate with; defaults
+            to the live `Constants`.
+
+    Raises:
+        ValueError: If the arrays do not have the same length.
+
+    Returns:
+        Dict[str, np.ndarray]: `final_status` (strings), `counter_suggestion`
+        (NaN when there is none) and `rounds_left` arrays, aligned with the
+        inputs.
+    """
+    rules = rules or NegotiationRules.from_constants()
+    carrier_offers = np.asarray(carrier_offers, dtype=np.float64)
+    last_offers = np.asarray(last_offers, dtype=np.float64)
+    negotiation_rounds = np.asarray(negotiation_rounds, dtype=np.int64)
+    max_rates = np.asarray(max_rates, dtype=np.float64)
+    if not (
+        carrier_offers.shape
+        == last_offers.shape
+        == negotiation_rounds.shape
+        == max_rates.shape
+    ):
+        raise ValueError("All offer arrays must have the same length.")
+
+    # The branches of `evaluate_counter_offer`, in the same order
+    above_max = carrier_offers > max_rates
+    accepted = ~above_max & (carrier_offers >= last_offers)
+    limit_reached = (
+        ~above_max & ~accepted & (negotiation_rounds >= rules.max_negotiation_rounds)
+    )
+    counter = ~(accepted | limit_reached)
+
+    # np.floor_divide follows the float semantics of the built-in //
+    step = rules.rounding_step
+    above_gap = carrier_offers - max_rates
+    above_suggestion = max_rates - (above_gap // 2) // step * step
+    gap = max_rates - carrier_offers
+    next_offer = np.minimum(carrier_offers + (gap // 2) // step * step, max_rates)
+    counter_suggestion = np.where(
+        above_max, above_suggestion, np.where(counter, next_offer, np.nan)
+    )
+
+    rounds_left = rules.max_negotiation_rounds - negotiation_rounds
+    rounds_left = np.where(accepted, np.maximum(rounds_left, 0), rounds_left)
+    rounds_left = np.where(limit_reached, 0, rounds_left)
+
+    final_status = np.select(
+        [accepted, limit_reached],
+        [FinalStatus.ACCEPTED.value, FinalStatus.LIMIT_REACHED.value],
+        FinalStatus.COUNTER.value,
+    )
+    return {
+        "final_status": final_status,
+        "counter_suggestion": counter_suggestion,
+        "rounds_left": rounds_left,
+    }
+
+
+def evaluate_counter_offer_batch(
+    batch: CounterOfferBatchRequest,
+) -> CounterOfferBatchResponse:
+    """
+    Evaluate a batch of offers with the live rules and each alternative
+    strategy of the request.
+
+    Offers in a round beyond a strategy's `max_negotiation_rounds` are not
+    evaluated with it (`evaluate_counter_offer` would not accept them):
+    their status, suggestion and rounds left are None, and they are counted
+    as `out_of_range` in its `status_counts`.
+
+    Args:
+        batch (CounterOfferBatchRequest): Offer arrays and strategies.
+
+    Raises:
+        ValueError: If the arrays do not have the same length, a strategy
+            is named like the live one or a round is beyond the limit of
+            every strategy.
+
+    Returns:
+        CounterOfferBatchResponse: Results per strategy, `current` first.
+    """
+    if CURRENT_STRATEGY in batch.strategies:
+        raise ValueError(f"Strategy name '{CURRENT_STRATEGY}' is reserved.")
+    strategies = {CURRENT_STRATEGY: NegotiationRules.from_constants()}
+    for name, strategy in batch.strategies.items():
+        strategies[name] = NegotiationRules(
+            strategy.max_negotiation_rounds, strategy.rounding_step
+        )
+    max_rounds = max(rules.max_negotiation_rounds for rules in strategies.values())
+    if max(batch.negotiation_rounds, default=0) > max_rounds:
+        raise ValueError(
+            f"Negotiation rounds must be at most {max_rounds}, the most rounds "
+            "allowed by a strategy."
+        )
+
+    rounds = np.asarray(batch.negotiation_rounds, dtype=np.int64)
+    results = {}
+    for name, rules in strategies.items():
+        evaluated = evaluate_counter_offers(
+            batch.carrier_offers,
+            batch.last_offers,
+            rounds,
+            batch.max_rates,
+            rules,
+        )
+        out_of_range = rounds > rules.max_negotiation_rounds
+        final_status = evaluated["final_status"].astype(object)
+        final_status[out_of_range] = None
+        rounds_left = evaluated["rounds_left"].astype(object)
+        rounds_left[out_of_range] = None
+        suggestions = evaluated["counter_suggestion"]
+        statuses, counts = np.unique(
+            evaluated["final_status"][~out_of_range], return_counts=True
+        )
+        status_counts = dict(zip(statuses.tolist(), counts.tolist()))
+        if out_of_range.any():
+            status_counts[OUT_OF_RANGE] = int(out_of_range.sum())
+        results[name] = CounterOfferBatchResult(
+            final_status=final_status.tolist(),
+            counter_suggestion=np.where(
+                np.isnan(suggestions) | out_of_range, None, suggestions
+            ).tolist(),
+            rounds_left=rounds_left.tolist(),
+            status_counts=status_counts,
+        )
+    return CounterOfferBatchResponse(results=results)
@@ -0,0 +1,185 @@
+"""
+Run EXPLAIN on representative load searches and flag sequential scans.
+
+The statements are exactly the ones `get_best_load` sends (strict and
+relaxed tiers in one query), built from the filter sets the voice agent
+typically produces:
+
+    python -m app.cli.explain_loads            # plan only
+    python -m app.cli.explain_loads --analyze  # plan + execution time
+
+On a small development database the planner rightly prefers sequential
+scans; `--force-index` disables them to check that an index *can* serve
+every search. Exits with status 1 when a sequential scan on `loads` is
+found or, with `--analyze`, when a search exceeds the latency budget.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime
+from typing import Dict, Iterator, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.config import constants
+from app.crud.load import tiered_loads_statement
+from app.database_engine.session import engine
+from app.schemas.load import LoadFilter
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUDGET_MS = 20.0
+
+REPRESENTATIVE_FILTERS: Dict[str, LoadFilter] = {
+    "origin + equipment + pickup window": LoadFilter(
+        origin="chicago",
+        equipment_type="dry van",
+        pickup_datetime_from=datetime(2025, 8, 10),
+        pickup_datetime_to=datetime(2025, 8, 11),
+    ),
+    "lane + pickup window + miles": LoadFilter(
+        origin="dallas",
+        destination="atlanta",
+        pickup_datetime_from=datetime(2025, 8, 10),
+        pickup_datetime_to=datetime(2025, 8, 12),
+        max_miles=1000,
+    ),
+    "pickup window + rate + weight": LoadFilter(
+        pickup_datetime_from=datetime(2025, 8, 10),
+        pickup_datetime_to=datetime(2025, 8, 10, 23, 59),
+        min_rate=1500,
+        max_weight=20000,
+    ),
+    "equipment + commodity + rate": LoadFilter(
+        equipment_type="reefer",
+        commodity_type="dairy",
+        min_rate=1200,
+    ),
+    "miles range": LoadFilter(min_miles=200, max_miles=400),
+}
+
+
+class Explain(Executable, ClauseElement):
+    """EXPLAIN wrapper compiled with the statement's own bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement, options: str):
+        self.statement = statement
+        self.options = options
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return f"EXPLAIN ({element.options}) {compiler.process(element.statement, **kw)}"
+
+
+def _walk(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _walk(child)
+
+
+def explain_filters(
+    conn: Connection, filters: LoadFilter, analyze: bool = False
+) -> dict:
+    """
+    EXPLAIN the tiered load search for the given filters.
+
+    Args:
+        conn (Connection): Open database connection.
+        filters (LoadFilter): Strict filters; relaxed ones are derived from
+            RELAXED_FILTER_FIELDS exactly like `get_best_load` does.
+        analyze (bool): Execute the statement (EXPLAIN ANALYZE).
+
+    Returns:
+        dict: Top-level EXPLAIN (FORMAT JSON) document.
+    """
+    relaxed_filters = filters.copy(update=constants.RELAXED_FILTER_FIELDS)
+    statement = tiered_loads_statement(filters, relaxed_filters, limit=1)
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    raw = conn.execute(Explain(statement, options)).scalar()
+    document = raw if isinstance(raw, list) else json.loads(raw)
+    return document[0]
+
+
+def sequential_scans(document: dict) -> List[str]:
+    """Relations read with a sequential scan anywhere in the plan."""
+    return [
+        node.get("Relation Name", "?")
+        for node in _walk(document["Plan"])
+        if node["Node Type"] == "Seq Scan"
+    ]
+
+
+def index_names(document: dict) -> List[str]:
+    """Indexes used anywhere in the plan."""
+    return sorted(
+        {node["Index Name"] for node in _walk(document["Plan"]) if "Index Name" in node}
+    )
+
+
+def run(bind: Engine, analyze: bool, force_index: bool) -> bool:
+    """
+    Explain every representative search and log a one-line verdict for each.
+
+    Returns:
+        bool: True when no search regressed.
+    """
+    healthy = True
+    with bind.connect() as conn:
+        if force_index:
+            conn.execute(text("SET enable_seqscan = off"))
+
+        for name, filters in REPRESENTATIVE_FILTERS.items():
+            document = explain_filters(conn, filters, analyze=analyze)
+            scans = [rel for rel in sequential_scans(document) if rel == "loads"]
+            indexes = ", ".join(index_names(document)) or "none"
+            timing = ""
+            over_budget = False
+            if analyze:
+                elapsed = document["Planning Time"] + document["Execution Time"]
+                over_budget = elapsed > LATENCY_BUDGET_MS
+                timing = f" | {elapsed:.2f} ms"
+
+            if scans or over_budget:
+                healthy = False
+                logger.warning(
+                    f"[EXPLAIN LOADS] {name}: SEQ SCAN on loads={bool(scans)}"
+                    f" | indexes: {indexes}{timing}"
+                )
+            else:
+                logger.info(f"[EXPLAIN LOADS] {name}: indexes: {indexes}{timing}")
+            logger.debug(json.dumps(document, indent=2))
+
+        conn.rollback()
+    return healthy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--analyze",
+        action="store_true",
+        help=f"Execute the searches and enforce the {LATENCY_BUDGET_MS:.0f} ms budget.",
+    )
+    parser.add_argument(
+        "--force-index",
+        action="store_true",
+        help="Disable sequential scans to check indexes can serve every search.",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Print full plans.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    if not run(engine, analyze=args.analyze, force_index=args.force_index):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
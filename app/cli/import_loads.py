@@ -0,0 +1,74 @@
+"""
+Import the load catalog from a CSV or NDJSON file.
+
+Rows are upserted on `load_id` in chunks, so re-running an export of the
+TMS updates existing loads and adds new ones:
+
+    python -m app.cli.import_loads loads.csv
+    python -m app.cli.import_loads loads.ndjson --chunk-size 10000
+
+The format is taken from the file extension unless `--format` is given.
+Exits with status 1 when any row was rejected.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from app.business.load_import import import_loads, read_load_records
+from app.core.config import constants
+from app.database_engine.session import engine
+from app.schemas.load import LoadImportFormat, LoadImportReport
+
+logger = logging.getLogger(__name__)
+
+
+def import_file(
+    path: Path,
+    import_format: LoadImportFormat,
+    chunk_size: int = constants.LOAD_IMPORT_CHUNK,
+) -> LoadImportReport:
+    """
+    Stream one file into the loads table.
+
+    Args:
+        path (Path): CSV or NDJSON file.
+        import_format (LoadImportFormat): Format of the file.
+        chunk_size (int): Rows upserted per transaction.
+
+    Returns:
+        LoadImportReport: Counts, first rejected rows and throughput.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as source, Session(engine) as db:
+        return import_loads(db, read_load_records(source, import_format), chunk_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        choices=[import_format.value for import_format in LoadImportFormat],
+        help="File format (default: from the file extension).",
+    )
+    parser.add_argument("--chunk-size", type=int, default=constants.LOAD_IMPORT_CHUNK)
+    args = parser.parse_args()
+
+    extension = args.path.suffix.lstrip(".").lower()
+    import_format = LoadImportFormat(
+        args.format or ("ndjson" if extension in {"ndjson", "jsonl"} else "csv")
+    )
+
+    logging.basicConfig(level=logging.INFO)
+    report = import_file(args.path, import_format, args.chunk_size)
+    for error in report.errors:
+        logger.error(f"[LOAD IMPORT] line {error.line}: {'; '.join(error.errors)}")
+    if report.rejected:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Rebuild or check the call metrics rollups behind `/metrics`.
+
+The all-time and hourly rollups are maintained incrementally on every call summary insert.
+Rebuild it from the raw rows after upgrading an existing database or after
+editing `call_summaries` by hand, and use `check` to compare it with the
+live aggregate:
+
+    python -m app.cli.metrics_rollup rebuild
+    python -m app.cli.metrics_rollup check
+
+`check` exits with status 1 when any counter differs.
+"""
+
+import argparse
+import logging
+import sys
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.crud.metrics_rollup import check_rollup, rebuild_rollup
+from app.database_engine.session import engine
+from app.models.metrics_rollup import CallMetricsHourly, CallMetricsRollup
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild(bind: Engine) -> int:
+    """
+    Create the rollup tables if needed and recompute them from raw rows.
+
+    Args:
+        bind (Engine): Engine connected to the target database.
+
+    Returns:
+        int: Number of all-time shard rows written.
+    """
+    CallMetricsRollup.__table__.create(bind, checkfirst=True)
+    CallMetricsHourly.__table__.create(bind, checkfirst=True)
+    with Session(bind) as db, db.begin():
+        return rebuild_rollup(db)
+
+
+def check(bind: Engine) -> bool:
+    """
+    Log every rollup counter that differs from the live aggregate.
+
+    Args:
+        bind (Engine): Engine connected to the target database.
+
+    Returns:
+        bool: True when the rollup is consistent.
+    """
+    with Session(bind) as db:
+        mismatches = check_rollup(db)
+
+    for name, (live, rollup) in mismatches.items():
+        logger.error(f"[METRICS ROLLUP] {name}: live={live} rollup={rollup}")
+    return not mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("command", choices=["rebuild", "check"])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == "rebuild":
+        shards = rebuild(engine)
+        logger.info(f"[METRICS ROLLUP] Rebuilt {shards} shard rows.")
+    elif check(engine):
+        logger.info("[METRICS ROLLUP] Rollup matches the live aggregate.")
+    else:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Create the database extensions, columns and indexes declared on the models.
+
+`init.sql` only runs when the Postgres volume is first created, so existing
+databases need this command after schema changes are pulled:
+
+    python -m app.cli.sync_indexes
+
+Only columns that can be added to a populated table (nullable or with a
+server default) are created. Indexes are built with CREATE INDEX
+CONCURRENTLY so the loads table stays writable while they are created.
+"""
+
+import argparse
+import logging
+from typing import List
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateColumn
+
+from app.database_engine.session import engine
+from app.models.call_summary import CallSummary
+from app.models.load import Load
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_EXTENSIONS = ["uuid-ossp", "pg_trgm"]
+INDEXED_TABLES = [Load.__table__, CallSummary.__table__]
+
+
+def _add_missing_columns(conn: Connection, dry_run: bool) -> List[str]:
+    missing = []
+    inspector = inspect(conn)
+    for table in INDEXED_TABLES:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            missing.append(f"{table.name}.{column.name}")
+            if dry_run:
+                continue
+            if not column.nullable and column.server_default is None:
+                raise RuntimeError(
+                    f"Cannot add {table.name}.{column.name}: NOT NULL without "
+                    "a server default"
+                )
+            logger.info(f"[SYNC INDEXES] Adding column {table.name}.{column.name}")
+            ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+    return missing
+
+
+def sync_indexes(bind: Engine, dry_run: bool = False) -> List[str]:
+    """
+    Create every model column and index missing from the database.
+
+    Args:
+        bind (Engine): Engine connected to the target database.
+        dry_run (bool): Only report missing objects without creating them.
+
+    Returns:
+        List[str]: Columns (`table.column`) and index names that were (or
+            would be) created.
+    """
+    with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if not dry_run:
+            for extension in REQUIRED_EXTENSIONS:
+                conn.execute(text(f'CREATE EXTENSION IF NOT EXISTS "{extension}"'))
+
+        # Columns first: new indexes may cover them
+        missing = _add_missing_columns(conn, dry_run)
+        inspector = inspect(conn)
+        for table in INDEXED_TABLES:
+            existing = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in sorted(table.indexes, key=lambda index: index.name):
+                if index.name in existing:
+                    continue
+                missing.append(index.name)
+                if dry_run:
+                    continue
+                logger.info(f"[SYNC INDEXES] Creating {index.name}")
+                index.dialect_options["postgresql"]["concurrently"] = True
+                index.create(conn)
+
+    return missing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="List missing columns and indexes without creating them.",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    missing = sync_indexes(engine, dry_run=args.dry_run)
+    if not missing:
+        logger.info("[SYNC INDEXES] All columns and indexes are up to date.")
+    elif args.dry_run:
+        logger.info(f"[SYNC INDEXES] Missing: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
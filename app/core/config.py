@@ -1,9 +1,11 @@
 from datetime import datetime
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import Dict, List
 from pydantic import validator
 import json
 
+from app.schemas.load import TextMatchMode
+
 
 class Settings(BaseSettings):
     # Core
@@ -19,11 +21,71 @@ class Settings(BaseSettings):
     # External APIs
     FMCSA_API_KEY: str
     DATABASE_URL: str
+
+    # Database connection pool (per engine and per worker process)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Request logging: fraction of requests logged per path prefix (JSON),
+    # e.g. {"/api/v1/health": 0.01}; unlisted paths are always logged
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+
+    # Capture of sampled API requests to NDJSON traffic files for replay
+    # (`{pid}` in the path is replaced so each worker writes its own file)
+    REQUEST_CAPTURE_ENABLED: bool = False
+    REQUEST_CAPTURE_PATH: str = "captures/requests-{pid}.jsonl"
+    REQUEST_CAPTURE_SAMPLE_RATE: float = 1.0
+    REQUEST_CAPTURE_MAX_BYTES: int = 100_000_000
+    REQUEST_CAPTURE_BACKUPS: int = 5
+
+    # Runtime latency histograms exported on GET /metrics/runtime
+    RUNTIME_METRICS_ENABLED: bool = True
+
+    # SQL profiling per request (warnings for slow statements, N+1, budget)
+    QUERY_PROFILER_ENABLED: bool = False
+    QUERY_PROFILER_SLOW_MS: float = 100.0
+    QUERY_PROFILER_BUDGET: int = 10
+    QUERY_PROFILER_REPEAT_THRESHOLD: int = 5
+
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = []
     FMCSA_URL: str
     WEB_KEY: str
 
+    # Load search
+    LOAD_TEXT_MATCH_MODE: TextMatchMode = TextMatchMode.SUBSTRING
+
+    # In-memory load index (GET /loads answered without a DB round trip)
+    LOAD_INDEX_ENABLED: bool = False
+    LOAD_INDEX_REFRESH_INTERVAL: float = 5.0
+    LOAD_INDEX_RELOAD_INTERVAL: float = 900.0
+
+    # FMCSA carrier lookups (shared pooled client, see app.business.fmcsa_client)
+    FMCSA_TIMEOUT: float = 5.0
+    FMCSA_MAX_CONNECTIONS: int = 20
+    FMCSA_CACHE_TTL: float = 21600.0
+    FMCSA_STALE_TTL: float = 604800.0
+    FMCSA_BREAKER_FAILURES: int = 5
+    FMCSA_BREAKER_RESET: float = 30.0
+    # FMCSA lookups in flight across all batch verifications (below the pool size)
+    CARRIER_BATCH_CONCURRENCY: int = 16
+
+    # Cache of identical load searches (per worker, emptied on load changes)
+    LOAD_SEARCH_CACHE_ENABLED: bool = False
+    LOAD_SEARCH_CACHE_TTL: float = 30.0
+    LOAD_SEARCH_CACHE_SIZE: int = 1024
+
+    # Call summary write-behind (POST /call-summary answers 202, stored in batches)
+    CALL_SUMMARY_WRITE_BEHIND: bool = False
+    CALL_SUMMARY_SPILL_DIR: str = "spill"
+    CALL_SUMMARY_BUFFER_SIZE: int = 10_000
+    CALL_SUMMARY_FLUSH_BATCH: int = 500
+    CALL_SUMMARY_FLUSH_INTERVAL: float = 1.0
+    CALL_SUMMARY_ENQUEUE_TIMEOUT: float = 2.0
+    CALL_SUMMARY_SPILL_FSYNC: bool = True
 
     @validator("BACKEND_CORS_ORIGINS", pre=True)
     def parse_cors(cls, value):
@@ -65,6 +127,54 @@ class Constants:
     # Default delivery date fallback if missing
     FALLBACK_DELIVERY_DATETIME: datetime = datetime.max
     MAX_NEGOTIATION_ROUNDS = 3
+    # Offers accepted by one batch evaluation request (POST /counteroffer/batch),
+    # a few MB of JSON; larger replays are split across requests
+    NEGOTIATION_BATCH_MAX_SIZE = 100_000
+
+    # === FMCSA lookups ===
+    # MC numbers whose answer is kept (least recently used evicted first)
+    FMCSA_CACHE_SIZE = 100_000
+    # MC numbers accepted by one batch verification request
+    CARRIER_BATCH_MAX_SIZE = 10_000
+
+    # === SQL query profiler ===
+    # Slow SELECT statements explained per profiled request
+    QUERY_PROFILER_MAX_EXPLAINS = 3
+
+    # === Request capture ===
+    # Requests waiting for the writer thread; more are dropped, not awaited
+    REQUEST_CAPTURE_QUEUE_SIZE = 10_000
+    # Larger request bodies are not captured
+    REQUEST_CAPTURE_MAX_BODY_BYTES = 65_536
+
+    # === Load search pages (`limit` / `cursor` on GET /loads) ===
+    LOAD_SEARCH_MAX_LIMIT = 50
+
+    # === Load catalog import ===
+    # Rows validated and upserted per transaction
+    LOAD_IMPORT_CHUNK = 5000
+    # Rejected rows listed in an import report (all are counted)
+    LOAD_IMPORT_MAX_ERRORS = 100
+    # Upload bytes buffered in memory between writes to the spool file
+    LOAD_IMPORT_SPOOL_BYTES = 1 << 20
+
+    # === In-memory load index ===
+    # Rows read per round trip when the whole index is (re)loaded
+    LOAD_INDEX_FETCH_BATCH = 10_000
+    # Seconds of updates re-read before the previous refresh, covering
+    # transactions that were running (not yet committed) during it
+    LOAD_INDEX_REFRESH_OVERLAP = 10.0
+
+    # === Call summary listing ===
+    CALL_SUMMARY_PAGE_SIZE = 100
+    CALL_SUMMARY_MAX_PAGE_SIZE = 1000
+    # Rows fetched per round trip by the NDJSON export's server-side cursor
+    CALL_SUMMARY_STREAM_BATCH = 1000
+
+    # === Call summary bulk ingestion ===
+    CALL_SUMMARY_BULK_MAX_ITEMS = 100_000
+    # Rows per executemany round; rollup deltas are applied once per batch
+    CALL_SUMMARY_BULK_BATCH = 5000
     ROUNDING_STEP = 10
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
@@ -0,0 +1,274 @@
+"""
+In-process latency histograms, exported in the Prometheus text format.
+
+Three sources feed them:
+
+- `RuntimeMetricsMiddleware` times every request per route template and
+  records how many statements it ran and how long it spent in them;
+- `stage` times a step of the business logic (load ranking, pricing,
+  FMCSA lookups...) wherever it runs;
+- `instrument_engine` hooks SQLAlchemy cursor events, timing each
+  statement and adding it to the current request.
+
+Histograms have fixed buckets and are updated under a lock: recording a
+value costs a bisect and two additions, so instrumentation stays on in
+production (`RUNTIME_METRICS_ENABLED`). Values are per worker process and
+cumulative since start-up; `GET /metrics/runtime` exposes them.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+# Seconds, from a cached lookup to a slow FMCSA answer
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Series:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed buckets, one series per label values.
+
+    Args:
+        name (str): Metric name.
+        description (str): `# HELP` text.
+        buckets (Sequence[float]): Increasing upper bounds; `+Inf` is implied.
+        labelnames (Sequence[str]): Label names, in `observe` order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self.labelnames = tuple(labelnames)
+        self._series: Dict[Tuple[str, ...], _Series] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        Record a value.
+
+        Args:
+            value (float): Observed value (seconds for latencies).
+            *labels (str): One value per label name.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = _Series(len(self.buckets) + 1)
+            series.counts[index] += 1
+            series.sum += value
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Tuple[List[int], float]]:
+        """Per label values, the (non-cumulative) bucket counts and the sum."""
+        with self._lock:
+            return {
+                labels: (list(series.counts), series.sum)
+                for labels, series in self._series.items()
+            }
+
+    def render(self) -> List[str]:
+        """Lines of the Prometheus text exposition of this histogram."""
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for labels, (counts, total) in sorted(self.snapshot().items()):
+            pairs = [
+                f'{name}="{_escape(value)}"'
+                for name, value in zip(self.labelnames, labels)
+            ]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                bucket_labels = ",".join(pairs + [f'le="{le}"'])
+                lines.append(f"{self.name}_bucket{{{bucket_labels}}} {cumulative}")
+            suffix = f"{{{','.join(pairs)}}}" if pairs else ""
+            lines.append(f"{self.name}_sum{suffix} {_number(total)}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+class RuntimeMetrics:
+    """
+    Registry of the histograms exported by this worker.
+
+    Args:
+        enabled (bool): Whether `stage` and the engine hooks record anything.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._histograms: List[Histogram] = []
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        labelnames: Sequence[str] = (),
+    ) -> Histogram:
+        """Create and register a histogram (see `Histogram`)."""
+        histogram = Histogram(name, description, buckets, labelnames)
+        self._histograms.append(histogram)
+        return histogram
+
+    def render(self) -> str:
+        """Every registered histogram, in the Prometheus text format."""
+        lines: List[str] = []
+        for histogram in self._histograms:
+            lines.extend(histogram.render())
+        return "\n".join(lines) + "\n"
+
+
+runtime_metrics = RuntimeMetrics(enabled=settings.RUNTIME_METRICS_ENABLED)
+
+REQUEST_DURATION = runtime_metrics.histogram(
+    "http_request_duration_seconds",
+    "Time to the last response byte, per route template.",
+    labelnames=("method", "route", "status"),
+)
+REQUEST_DB_QUERIES = runtime_metrics.histogram(
+    "http_request_db_queries",
+    "SQL statements run by a request.",
+    buckets=QUERY_COUNT_BUCKETS,
+    labelnames=("method", "route"),
+)
+REQUEST_DB_DURATION = runtime_metrics.histogram(
+    "http_request_db_duration_seconds",
+    "Time a request spent running SQL statements.",
+    labelnames=("method", "route"),
+)
+STAGE_DURATION = runtime_metrics.histogram(
+    "stage_duration_seconds",
+    "Time spent in a step of the business logic.",
+    labelnames=("stage",),
+)
+DB_QUERY_DURATION = runtime_metrics.histogram(
+    "db_query_duration_seconds",
+    "Time to run one SQL statement, per statement kind.",
+    labelnames=("operation",),
+)
+
+
+class RequestDBUsage:
+    """SQL statements run so far by the current request, and their time."""
+
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# Set by the middleware; copied into threadpool calls and SQLAlchemy greenlets
+_request_db_usage: ContextVar[Optional[RequestDBUsage]] = ContextVar(
+    "request_db_usage", default=None
+)
+
+
+@contextmanager
+def track_request_db_usage() -> Iterator[RequestDBUsage]:
+    """Count the statements run within the block (e.g. one request)."""
+    usage = RequestDBUsage()
+    token = _request_db_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _request_db_usage.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    Time a step of the business logic into `stage_duration_seconds`.
+
+    Args:
+        name (str): Stage label, e.g. "rank_loads.db" or "fmcsa_lookup".
+    """
+    if not runtime_metrics.enabled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_DURATION.observe(time.perf_counter() - started, name)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    DB_QUERY_DURATION.observe(elapsed, operation)
+    usage = _request_db_usage.get()
+    if usage is not None:
+        usage.queries += 1
+        usage.seconds += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement of an engine and add it to the current request.
+
+    Args:
+        engine (Engine): Sync engine (`AsyncEngine.sync_engine` for async).
+    """
+    if not runtime_metrics.enabled:
+        return
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,302 @@
+"""
+Per-request SQL profiling: statement counts, slow statements and N+1 hints.
+
+A `QueryProfile` collects the statements run while it is active:
+
+- `profile_queries()` activates one for the current request (or block),
+  through a context variable; `QueryProfilerMiddleware` does so for every
+  request when `QUERY_PROFILER_ENABLED` is set, and logs a warning when a
+  request runs more than `QUERY_PROFILER_BUDGET` statements, repeats one
+  statement `QUERY_PROFILER_REPEAT_THRESHOLD` times (a likely N+1) or runs
+  statements slower than `QUERY_PROFILER_SLOW_MS`;
+- `profile_engine(engine)` records every statement of one engine, whatever
+  the task or thread running it. Tests use it to pin the number of
+  statements of a route, e.g. `profile.assert_within(1)`.
+
+Slow SELECT statements are explained right away on the same connection
+(`EXPLAIN`, or `EXPLAIN QUERY PLAN` on SQLite), at most
+`QUERY_PROFILER_MAX_EXPLAINS` per profile, so the plan matches the data
+and parameters that made them slow. The EXPLAIN runs in a savepoint, so a
+failing one leaves the request's transaction usable.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import constants, settings
+
+logger = logging.getLogger(__name__)
+
+_EXPLAIN_SAVEPOINT = "query_profiler_explain"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by `QueryProfile.assert_within` when too many statements ran."""
+
+
+class SlowStatement(NamedTuple):
+    """A statement over the slow threshold, and its plan when explained."""
+
+    statement: str
+    duration: float
+    plan: Optional[str]
+
+
+def _explain(conn: Connection, statement: str, parameters) -> str:
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    error = conn.dialect.loaded_dbapi.Error
+    # A separate DBAPI cursor: the statement's own results are still unread
+    cursor = conn.connection.cursor()
+    try:
+        # In a savepoint: on PostgreSQL a failed statement aborts the whole
+        # transaction, and this one belongs to the request being profiled
+        cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            # One plan line per row: the last column on SQLite, the only one on PostgreSQL
+            plan = "\n".join(str(row[-1]) for row in cursor.fetchall())
+        except error:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            raise
+        finally:
+            cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        return plan
+    except error as e:
+        return f"EXPLAIN failed: {e!r}"
+    finally:
+        cursor.close()
+
+
+class QueryProfile:
+    """
+    Statements run while the profile is active.
+
+    Args:
+        slow_threshold (Optional[float]): Seconds over which a statement is
+            kept as slow; defaults to `QUERY_PROFILER_SLOW_MS`.
+        max_explains (Optional[int]): Slow statements explained; defaults
+            to `QUERY_PROFILER_MAX_EXPLAINS`.
+    """
+
+    def __init__(
+        self,
+        slow_threshold: Optional[float] = None,
+        max_explains: Optional[int] = None,
+    ):
+        self.slow_threshold = (
+            settings.QUERY_PROFILER_SLOW_MS / 1000
+            if slow_threshold is None
+            else slow_threshold
+        )
+        self.max_explains = (
+            constants.QUERY_PROFILER_MAX_EXPLAINS
+            if max_explains is None
+            else max_explains
+        )
+        self.queries = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+        self.slow: List[SlowStatement] = []
+
+    def record(
+        self,
+        conn: Connection,
+        statement: str,
+        parameters,
+        elapsed: float,
+        executemany: bool = False,
+    ) -> None:
+        """Add a statement that took `elapsed` seconds (cursor event hook)."""
+        self.queries += 1
+        self.duration += elapsed
+        self.statements[statement] += 1
+        if elapsed < self.slow_threshold:
+            return
+        plan = None
+        explained = sum(1 for slow in self.slow if slow.plan is not None)
+        if (
+            not executemany
+            and explained < self.max_explains
+            and statement.split(None, 1)[0].upper() in ("SELECT", "WITH")
+        ):
+            plan = _explain(conn, statement, parameters)
+        self.slow.append(SlowStatement(statement, elapsed, plan))
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """
+        Statements run at least `threshold` times, most repeated first.
+
+        The same SQL text run again and again (with other parameters) is the
+        signature of an N+1: one query per row of a previous result.
+        """
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+    def problems(self, budget: int, repeat_threshold: int) -> List[str]:
+        """
+        Human-readable findings: over budget, repeated and slow statements.
+
+        Args:
+            budget (int): Statements allowed.
+            repeat_threshold (int): Runs of one statement flagged as N+1.
+
+        Returns:
+            List[str]: One line per finding, empty when nothing stands out.
+        """
+        findings = []
+        if self.queries > budget:
+            findings.append(
+                f"{self.queries} statements (budget {budget}), "
+                f"{self.duration * 1000:.1f}ms in SQL"
+            )
+        for statement, count in self.repeated(repeat_threshold):
+            findings.append(f"possible N+1, run {count} times: {_short(statement)}")
+        for slow in sorted(self.slow, key=lambda slow: slow.duration, reverse=True):
+            line = f"slow statement ({slow.duration * 1000:.1f}ms): {_short(slow.statement)}"
+            if slow.plan:
+                line += "\n" + slow.plan
+            findings.append(line)
+        return findings
+
+    def assert_within(self, max_queries: int) -> None:
+        """
+        Fail (e.g. a test) when more than `max_queries` statements ran.
+
+        Raises:
+            QueryBudgetExceeded: With the statements that ran, most repeated
+                first.
+        """
+        if self.queries <= max_queries:
+            return
+        listing = "\n".join(
+            f"  {count}x {_short(statement)}"
+            for statement, count in self.statements.most_common()
+        )
+        raise QueryBudgetExceeded(
+            f"{self.queries} statements ran, at most {max_queries} expected:\n{listing}"
+        )
+
+
+def _short(statement: str, length: int = 200) -> str:
+    statement = " ".join(statement.split())
+    return statement if len(statement) <= length else statement[:length] + "..."
+
+
+# Set by `profile_queries`; copied into threadpool calls and SQLAlchemy greenlets
+_active_profile: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "active_query_profile", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._profiler_started = time.perf_counter()
+
+
+def _elapsed(context) -> Optional[float]:
+    started = getattr(context, "_profiler_started", None)
+    return None if started is None else time.perf_counter() - started
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _active_profile.get()
+    if profile is None:
+        return
+    elapsed = _elapsed(context)
+    if elapsed is not None:
+        profile.record(conn, statement, parameters, elapsed, executemany)
+
+
+def _listen_before(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def attach_query_profiler(engine: Engine) -> None:
+    """
+    Record the statements of an engine into the active `profile_queries`.
+
+    Args:
+        engine (Engine): Sync engine (`AsyncEngine.sync_engine` for async).
+    """
+    _listen_before(engine)
+    if not event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def profile_queries(profile: Optional[QueryProfile] = None) -> Iterator[QueryProfile]:
+    """
+    Profile the statements run within the block by attached engines.
+
+    Args:
+        profile (Optional[QueryProfile]): Profile to fill; a default one
+            otherwise.
+
+    Yields:
+        QueryProfile: The profile, complete once the block exits.
+    """
+    profile = profile or QueryProfile()
+    token = _active_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _active_profile.reset(token)
+
+
+@contextmanager
+def profile_engine(
+    engine: Engine, profile: Optional[QueryProfile] = None
+) -> Iterator[QueryProfile]:
+    """
+    Profile every statement an engine runs within the block.
+
+    Unlike `profile_queries`, this does not depend on the running task, so
+    it also sees statements of requests served by a `TestClient` thread.
+
+    Args:
+        engine (Engine): Sync engine (`AsyncEngine.sync_engine` for async).
+        profile (Optional[QueryProfile]): Profile to fill; a default one
+            otherwise.
+
+    Yields:
+        QueryProfile: The profile, complete once the block exits.
+    """
+    profile = profile or QueryProfile()
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = _elapsed(context)
+        if elapsed is not None:
+            profile.record(conn, statement, parameters, elapsed, executemany)
+
+    _listen_before(engine)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    try:
+        yield profile
+    finally:
+        event.remove(engine, "after_cursor_execute", after_cursor_execute)
+
+
+def report_problems(label: str, profile: QueryProfile) -> None:
+    """
+    Log a warning for a profile over the configured budget or thresholds.
+
+    Args:
+        label (str): What was profiled, e.g. "GET /api/v1/loads".
+        profile (QueryProfile): Completed profile.
+    """
+    findings = profile.problems(
+        settings.QUERY_PROFILER_BUDGET, settings.QUERY_PROFILER_REPEAT_THRESHOLD
+    )
+    if findings:
+        logger.warning(f"[QUERY PROFILER] {label}: " + "\n".join(findings))
@@ -0,0 +1,176 @@
+"""
+Capture of sampled API requests to NDJSON traffic files.
+
+With `REQUEST_CAPTURE_ENABLED`, the request logging middleware hands a
+`RecordedRequest` per sampled request (JSON body, status and latency
+included, headers and API key left out) to a `RequestCapture`. A
+background thread writes them to `REQUEST_CAPTURE_PATH`, rotating the file
+once it reaches `REQUEST_CAPTURE_MAX_BYTES` (`requests.jsonl.1` is the most
+recent backup, as with `logging.handlers.RotatingFileHandler`). Requests
+never wait for the disk: when the queue is full, records are dropped and
+counted. A record that cannot be written is counted too, and the file is
+reopened for the next one; `stats()` (shown by `/health`) reports both
+counters and whether the writer is alive.
+
+Offsets are Unix times, so the files of several workers and their backups
+can be replayed together: `python -m benchmarks.traffic replay`.
+"""
+
+import asyncio
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+
+from app.core.config import constants, settings
+from app.schemas.traffic import RecordedRequest
+
+logger = logging.getLogger(__name__)
+
+
+class RequestCapture:
+    """
+    Background writer of captured requests with size based rotation.
+
+    Args:
+        path (str): Traffic file; `{pid}` is replaced by the process id.
+        sample_rate (float): Fraction of requests captured.
+        max_bytes (int): Size at which the file is rotated (0: never).
+        backups (int): Rotated files kept (0: the file is truncated).
+        queue_size (int): Records waiting for the writer before drops.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: float = 1.0,
+        max_bytes: int = 0,
+        backups: int = 0,
+        queue_size: int = 10_000,
+    ):
+        self.path = Path(path.format(pid=os.getpid()))
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.dropped = 0
+        self.write_errors = 0
+        self._queue: "queue.Queue[Optional[RecordedRequest]]" = queue.Queue(queue_size)
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_settings(cls) -> "RequestCapture":
+        """Build a capture configured by the `REQUEST_CAPTURE_*` settings."""
+        return cls(
+            settings.REQUEST_CAPTURE_PATH,
+            sample_rate=settings.REQUEST_CAPTURE_SAMPLE_RATE,
+            max_bytes=settings.REQUEST_CAPTURE_MAX_BYTES,
+            backups=settings.REQUEST_CAPTURE_BACKUPS,
+            queue_size=constants.REQUEST_CAPTURE_QUEUE_SIZE,
+        )
+
+    async def start(self) -> None:
+        """Open the traffic file and start the writer thread."""
+        file = await asyncio.to_thread(self._open)
+        self._thread = threading.Thread(
+            target=self._run, args=(file,), name="request-capture", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[REQUEST CAPTURE] Writing sampled requests to {self.path}")
+
+    async def stop(self) -> None:
+        """Write what is queued, then stop the writer thread."""
+        if self._thread is None:
+            return
+        if self._thread.is_alive():
+            await asyncio.to_thread(self._queue.put, None)
+            await asyncio.to_thread(self._thread.join)
+        self._thread = None
+
+    def submit(self, request: RecordedRequest) -> bool:
+        """
+        Queue a request for writing, without blocking.
+
+        Returns:
+            bool: False if the queue was full and the request was dropped.
+        """
+        try:
+            self._queue.put_nowait(request)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    f"[REQUEST CAPTURE] Writer behind, {self.dropped} requests dropped"
+                )
+            return False
+        return True
+
+    def stats(self) -> Dict[str, object]:
+        """Writer state and lost records, for health and monitoring."""
+        return {
+            "path": str(self.path),
+            "writer_alive": self._thread is not None and self._thread.is_alive(),
+            "queued": self._queue.qsize(),
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+        }
+
+    def _open(self) -> BinaryIO:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return open(self.path, "ab")
+
+    def _run(self, file: Optional[BinaryIO]) -> None:
+        try:
+            while True:
+                request = self._queue.get()
+                if request is None:
+                    break
+                try:
+                    if file is None:
+                        file = self._open()
+                    file = self._write(file, request)
+                except (OSError, ValueError) as e:
+                    # Lose this record only: reopen the file for the next one
+                    self.write_errors += 1
+                    if self.write_errors == 1 or self.write_errors % 1000 == 0:
+                        logger.error(
+                            f"[REQUEST CAPTURE] {self.write_errors} requests not "
+                            f"written: {e!r}"
+                        )
+                    self._close(file)
+                    file = None
+        except Exception as e:
+            logger.error(f"[REQUEST CAPTURE] Writer stopped: {e}", exc_info=True)
+        finally:
+            self._close(file)
+
+    def _write(self, file: BinaryIO, request: RecordedRequest) -> BinaryIO:
+        line = request.model_dump_json().encode() + b"\n"
+        size = file.tell()
+        if self.max_bytes and size and size + len(line) > self.max_bytes:
+            file = self._rotate(file)
+        file.write(line)
+        if self._queue.empty():
+            file.flush()
+        return file
+
+    @staticmethod
+    def _close(file: Optional[BinaryIO]) -> None:
+        if file is None:
+            return
+        try:
+            file.close()
+        except (OSError, ValueError):
+            pass  # Buffered lines are lost with the file
+
+    def _rotate(self, file: BinaryIO) -> BinaryIO:
+        file.close()
+        if self.backups == 0:
+            return open(self.path, "wb")
+        for index in range(self.backups - 1, 0, -1):
+            backup = self.path.with_name(f"{self.path.name}.{index}")
+            if backup.exists():
+                backup.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        return open(self.path, "ab")
@@ -1,13 +1,25 @@
-from typing import List
+from typing import AsyncIterator, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import Select, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import Insert
+from app.crud.metrics_rollup import (
+    ROLLUP_SOURCE_COLUMNS,
+    apply_rollup_deltas,
+    apply_rollup_deltas_async,
+)
 from app.models.call_summary import CallSummary
-from app.schemas.call_summary import CallSummaryCreate
+from app.core.config import constants
+from app.schemas.call_summary import CallSummaryCreate, CallSummaryFilter
 
 
 def create_call_summary(db: Session, summary_data: CallSummaryCreate) -> CallSummary:
     """
     Create and persist a new CallSummary record in the database.
 
+    The metrics rollup is incremented in the same transaction, so `/metrics`
+    never sees a summary without its counters (or the other way around).
+
     Args:
         db (Session): SQLAlchemy database session.
         summary_data (CallSummaryCreate): Pydantic schema containing summary input data.
@@ -17,11 +29,111 @@ def create_call_summary(db: Session, summary_data: CallSummaryCreate) -> CallSum
     """
     summary = CallSummary(**summary_data.dict())
     db.add(summary)
+    db.flush()
+    apply_rollup_deltas(db, [summary])
     db.commit()
     db.refresh(summary)
     return summary
 
 
+async def create_call_summary_async(
+    db: AsyncSession, summary_data: CallSummaryCreate
+) -> CallSummary:
+    """
+    Async counterpart of `create_call_summary`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        summary_data (CallSummaryCreate): Pydantic schema containing summary input data.
+
+    Returns:
+        CallSummary: The created and persisted call summary object.
+    """
+    summary = CallSummary(**summary_data.dict())
+    db.add(summary)
+    await db.flush()
+    await apply_rollup_deltas_async(db, [summary])
+    await db.commit()
+    await db.refresh(summary)
+    return summary
+
+
+def _bulk_insert_statement() -> Insert:
+    # Core INSERT ... RETURNING run as executemany: SQLAlchemy batches it into
+    # multi-row VALUES statements and returns rows in parameter order. Only
+    # the columns the rollup needs are returned.
+    table = CallSummary.__table__
+    returned = [table.c.id, table.c.created_at]
+    returned.extend(table.c[name] for name in ROLLUP_SOURCE_COLUMNS)
+    return insert(table).returning(*returned, sort_by_parameter_order=True)
+
+
+def _bulk_batches(payloads: Sequence[CallSummaryCreate]) -> Iterator[List[dict]]:
+    for start in range(0, len(payloads), constants.CALL_SUMMARY_BULK_BATCH):
+        yield [
+            payload.model_dump()
+            for payload in payloads[start : start + constants.CALL_SUMMARY_BULK_BATCH]
+        ]
+
+
+def bulk_create_call_summaries(
+    db: Session, payloads: Sequence[CallSummaryCreate]
+) -> List[int]:
+    """
+    Insert many call summaries in batches within a single transaction.
+
+    The metrics rollups are incremented per batch in the same transaction,
+    so either every summary and its counters are committed or none are.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        payloads (Sequence[CallSummaryCreate]): Validated summaries whose
+            loads exist.
+
+    Returns:
+        List[int]: IDs of the created summaries, in payload order.
+    """
+    ids = []
+    try:
+        for rows in _bulk_batches(payloads):
+            inserted = db.execute(_bulk_insert_statement(), rows).all()
+            apply_rollup_deltas(db, inserted)
+            ids.extend(row.id for row in inserted)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return ids
+
+
+async def bulk_create_call_summaries_async(
+    db: AsyncSession, payloads: Sequence[CallSummaryCreate]
+) -> List[int]:
+    """
+    Async counterpart of `bulk_create_call_summaries`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        payloads (Sequence[CallSummaryCreate]): Validated summaries whose
+            loads exist.
+
+    Returns:
+        List[int]: IDs of the created summaries, in payload order.
+    """
+    ids = []
+    try:
+        for rows in _bulk_batches(payloads):
+            result = await db.execute(_bulk_insert_statement(), rows)
+            inserted = result.all()
+            await apply_rollup_deltas_async(db, inserted)
+            ids.extend(row.id for row in inserted)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return ids
+
+
 def get_all_call_summaries(db: Session) -> List[CallSummary]:
     """
     Retrieve all CallSummary records from the database.
@@ -33,3 +145,141 @@ def get_all_call_summaries(db: Session) -> List[CallSummary]:
         List[CallSummary]: A list of all stored call summary objects.
     """
     return db.query(CallSummary).all()
+
+
+async def get_all_call_summaries_async(db: AsyncSession) -> List[CallSummary]:
+    """
+    Async counterpart of `get_all_call_summaries`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+
+    Returns:
+        List[CallSummary]: A list of all stored call summary objects.
+    """
+    result = await db.scalars(select(CallSummary))
+    return list(result.all())
+
+
+def call_summaries_statement(
+    filters: CallSummaryFilter, after_id: Optional[int] = None
+) -> Select:
+    """
+    Build the filtered call summary query in keyset (ID) order.
+
+    Args:
+        filters (CallSummaryFilter): Outcome, sentiment and load filters.
+        after_id (Optional[int]): Only return summaries with a greater ID.
+
+    Returns:
+        Select: Statement ordered by ascending ID, without a limit.
+    """
+    statement = select(CallSummary)
+    if filters.outcome is not None:
+        statement = statement.where(CallSummary.outcome == filters.outcome)
+    if filters.sentiment is not None:
+        statement = statement.where(CallSummary.sentiment == filters.sentiment)
+    if filters.load_id is not None:
+        statement = statement.where(CallSummary.load_id == filters.load_id)
+    if after_id is not None:
+        statement = statement.where(CallSummary.id > after_id)
+    return statement.order_by(CallSummary.id)
+
+
+def _split_page(
+    rows: List[CallSummary], limit: int
+) -> Tuple[List[CallSummary], Optional[int]]:
+    # One extra row is fetched to know whether another page exists
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, page[-1].id
+
+
+def get_call_summaries_page(
+    db: Session,
+    filters: CallSummaryFilter,
+    after_id: Optional[int] = None,
+    limit: int = constants.CALL_SUMMARY_PAGE_SIZE,
+) -> Tuple[List[CallSummary], Optional[int]]:
+    """
+    Retrieve one keyset page of call summaries.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        filters (CallSummaryFilter): Outcome, sentiment and load filters.
+        after_id (Optional[int]): Cursor returned with the previous page.
+        limit (int): Maximum number of summaries in the page.
+
+    Returns:
+        Tuple[List[CallSummary], Optional[int]]: The page and the cursor of
+        the next one, or None when this is the last page.
+    """
+    statement = call_summaries_statement(filters, after_id).limit(limit + 1)
+    return _split_page(list(db.scalars(statement)), limit)
+
+
+async def get_call_summaries_page_async(
+    db: AsyncSession,
+    filters: CallSummaryFilter,
+    after_id: Optional[int] = None,
+    limit: int = constants.CALL_SUMMARY_PAGE_SIZE,
+) -> Tuple[List[CallSummary], Optional[int]]:
+    """
+    Async counterpart of `get_call_summaries_page`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        filters (CallSummaryFilter): Outcome, sentiment and load filters.
+        after_id (Optional[int]): Cursor returned with the previous page.
+        limit (int): Maximum number of summaries in the page.
+
+    Returns:
+        Tuple[List[CallSummary], Optional[int]]: The page and the cursor of
+        the next one, or None when this is the last page.
+    """
+    statement = call_summaries_statement(filters, after_id).limit(limit + 1)
+    result = await db.scalars(statement)
+    return _split_page(list(result.all()), limit)
+
+
+def stream_call_summaries(
+    db: Session, filters: CallSummaryFilter
+) -> Iterator[CallSummary]:
+    """
+    Yield every matching call summary through a server-side cursor.
+
+    Rows are fetched `CALL_SUMMARY_STREAM_BATCH` at a time, so memory stays
+    flat regardless of the table size.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        filters (CallSummaryFilter): Outcome, sentiment and load filters.
+
+    Yields:
+        CallSummary: Matching summaries in ascending ID order.
+    """
+    statement = call_summaries_statement(filters).execution_options(
+        yield_per=constants.CALL_SUMMARY_STREAM_BATCH
+    )
+    yield from db.scalars(statement)
+
+
+async def stream_call_summaries_async(
+    db: AsyncSession, filters: CallSummaryFilter
+) -> AsyncIterator[CallSummary]:
+    """
+    Async counterpart of `stream_call_summaries`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        filters (CallSummaryFilter): Outcome, sentiment and load filters.
+
+    Yields:
+        CallSummary: Matching summaries in ascending ID order.
+    """
+    statement = call_summaries_statement(filters).execution_options(
+        yield_per=constants.CALL_SUMMARY_STREAM_BATCH
+    )
+    async for summary in await db.stream_scalars(statement):
+        yield summary
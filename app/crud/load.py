@@ -1,64 +1,460 @@
-from typing import List
-from sqlalchemy.orm import Session
-from app.models.load import Load
-from app.schemas.load import LoadFilter
+from typing import Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+from sqlalchemy import (
+    Select,
+    and_,
+    false,
+    func,
+    literal,
+    not_,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql.dml import Insert
+from app.models.load import Load, urgency_rank
+from app.schemas.load import LoadFilter, LoadSearchCursor, MatchTier, TextMatchMode
 
 
-def filter_loads_from_db(db: Session, filters: LoadFilter) -> List[Load]:
+def _text_condition(column, term: str, match_mode: TextMatchMode):
     """
-    Dynamically builds and applies filters to the Load table using SQLAlchemy.
+    Builds the match condition for a textual column.
+
+    Both modes can be served by the GIN trigram indexes declared on the
+    Load model: ILIKE for substring matching and the pg_trgm `%>` (word
+    similarity) operator for fuzzy matching.
+    """
+    if match_mode == TextMatchMode.FUZZY:
+        return column.op("%>")(term)
+    return column.ilike(f"%{term}%")
+
+
+def build_load_conditions(filters: LoadFilter) -> List:
+    """
+    Translates a LoadFilter into the list of SQLAlchemy WHERE conditions.
 
     Filtering logic includes:
-    - Case-insensitive partial matches for textual fields (e.g., origin,
-    destination)
+    - Case-insensitive partial (or fuzzy, see `LoadFilter.match_mode`)
+    matches for textual fields (e.g., origin, destination)
     - Inclusive range filtering for datetime, weight, rate, and miles
 
     Args:
-        db (Session): SQLAlchemy DB session
         filters (LoadFilter): Filtering criteria received from query params
 
     Returns:
-        List[Load]: All loads matching the given filters
+        List: Conditions to be combined with AND on the Load table
     """
-    query = db.query(Load)
+    conditions = []
+    match_mode = filters.match_mode
 
-    # --- Case-insensitive text filters using ILIKE ---
+    # --- Text filters, backed by trigram indexes ---
     if filters.origin:
-        query = query.filter(Load.origin.ilike(f"%{filters.origin}%"))
+        conditions.append(_text_condition(Load.origin, filters.origin, match_mode))
 
     if filters.destination:
-        query = query.filter(Load.destination.ilike(f"%{filters.destination}%"))
+        conditions.append(
+            _text_condition(Load.destination, filters.destination, match_mode)
+        )
 
     if filters.equipment_type:
-        query = query.filter(Load.equipment_type.ilike(f"%{filters.equipment_type}%"))
+        conditions.append(
+            _text_condition(Load.equipment_type, filters.equipment_type, match_mode)
+        )
 
     if filters.commodity_type:
-        query = query.filter(Load.commodity_type.ilike(f"%{filters.commodity_type}%"))
+        conditions.append(
+            _text_condition(Load.commodity_type, filters.commodity_type, match_mode)
+        )
 
     # --- Datetime range filters ---
     if filters.pickup_datetime_from:
-        query = query.filter(Load.pickup_datetime >= filters.pickup_datetime_from)
+        conditions.append(Load.pickup_datetime >= filters.pickup_datetime_from)
 
     if filters.pickup_datetime_to:
-        query = query.filter(Load.pickup_datetime <= filters.pickup_datetime_to)
+        conditions.append(Load.pickup_datetime <= filters.pickup_datetime_to)
 
     # --- Numeric filters (inclusive ranges) ---
     if filters.min_weight is not None:
-        query = query.filter(Load.weight >= filters.min_weight)
+        conditions.append(Load.weight >= filters.min_weight)
 
     if filters.max_weight is not None:
-        query = query.filter(Load.weight <= filters.max_weight)
+        conditions.append(Load.weight <= filters.max_weight)
 
     if filters.min_rate is not None:
-        query = query.filter(Load.loadboard_rate >= filters.min_rate)
+        conditions.append(Load.loadboard_rate >= filters.min_rate)
 
     if filters.max_rate is not None:
-        query = query.filter(Load.loadboard_rate <= filters.max_rate)
+        conditions.append(Load.loadboard_rate <= filters.max_rate)
 
     if filters.min_miles is not None:
-        query = query.filter(Load.miles >= filters.min_miles)
+        conditions.append(Load.miles >= filters.min_miles)
 
     if filters.max_miles is not None:
-        query = query.filter(Load.miles <= filters.max_miles)
+        conditions.append(Load.miles <= filters.max_miles)
+
+    return conditions
+
+
+def load_priority_ordering(entity=Load) -> List:
+    """
+    SQL equivalent of `app.business.load.prioritize_loads`.
+
+    Loads whose notes contain URGENT_KEYWORD come first, then earliest
+    delivery (missing delivery dates last). `load_id` is used as a final
+    tie-breaker so the ranking is deterministic across executions. The
+    ordering matches the `ix_loads_priority` index.
+
+    Args:
+        entity: Load or an alias of it (e.g. over a subquery)
+
+    Returns:
+        List: ORDER BY clauses for the Load table
+    """
+    return [
+        urgency_rank(entity.notes),
+        entity.delivery_datetime.asc().nulls_last(),
+        entity.load_id,
+    ]
+
+
+def after_priority_position(cursor: LoadSearchCursor, entity=Load):
+    """
+    Condition keeping the loads ranked after `cursor` by `load_priority_ordering`.
+
+    Used as a keyset predicate, so the next page of a search starts where
+    the previous one stopped instead of skipping over the loads already
+    returned. Missing delivery dates sort last, as in the ordering.
+
+    Args:
+        cursor (LoadSearchCursor): Position of the last load already returned
+        entity: Load or an alias of it
+
+    Returns:
+        The WHERE condition
+    """
+    rank = urgency_rank(entity.notes)
+    cursor_rank = 0 if cursor.urgent else 1
+    if cursor.delivery_datetime is None:
+        later_in_rank = and_(
+            entity.delivery_datetime.is_(None), entity.load_id > cursor.load_id
+        )
+    else:
+        later_in_rank = or_(
+            entity.delivery_datetime > cursor.delivery_datetime,
+            entity.delivery_datetime.is_(None),
+            and_(
+                entity.delivery_datetime == cursor.delivery_datetime,
+                entity.load_id > cursor.load_id,
+            ),
+        )
+    return or_(rank > cursor_rank, and_(rank == cursor_rank, later_in_rank))
+
+
+def filter_loads_from_db(db: Session, filters: LoadFilter) -> List[Load]:
+    """
+    Dynamically builds and applies filters to the Load table using SQLAlchemy.
+
+    Args:
+        db (Session): SQLAlchemy DB session
+        filters (LoadFilter): Filtering criteria received from query params
+
+    Returns:
+        List[Load]: All loads matching the given filters
+    """
+    return db.query(Load).filter(*build_load_conditions(filters)).all()
+
+
+async def filter_loads_from_db_async(
+    db: AsyncSession, filters: LoadFilter
+) -> List[Load]:
+    """
+    Async counterpart of `filter_loads_from_db`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async DB session
+        filters (LoadFilter): Filtering criteria received from query params
+
+    Returns:
+        List[Load]: All loads matching the given filters
+    """
+    result = await db.scalars(select(Load).where(*build_load_conditions(filters)))
+    return list(result.all())
+
+
+def ranked_loads_statement(filters: LoadFilter, limit: int = 1) -> Select:
+    """
+    Build the statement returning the top `limit` loads matching the filters.
+
+    Args:
+        filters (LoadFilter): Filtering criteria received from query params
+        limit (int): Maximum number of loads to return
 
-    return query.all()
+    Returns:
+        Select: Statement yielding Load rows from most to least priority
+    """
+    return (
+        select(Load)
+        .where(*build_load_conditions(filters))
+        .order_by(*load_priority_ordering())
+        .limit(limit)
+    )
+
+
+def get_ranked_loads(db: Session, filters: LoadFilter, limit: int = 1) -> List[Load]:
+    """
+    Retrieve only the top `limit` loads matching the filters, ranked in SQL.
+
+    The ordering is evaluated by the database (see `load_priority_ordering`),
+    so only `limit` rows are transferred regardless of how many rows match.
+
+    Args:
+        db (Session): SQLAlchemy DB session
+        filters (LoadFilter): Filtering criteria received from query params
+        limit (int): Maximum number of loads to return
+
+    Returns:
+        List[Load]: Matching loads from most to least priority
+    """
+    return list(db.scalars(ranked_loads_statement(filters, limit)).all())
+
+
+async def get_ranked_loads_async(
+    db: AsyncSession, filters: LoadFilter, limit: int = 1
+) -> List[Load]:
+    """
+    Async counterpart of `get_ranked_loads`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async DB session
+        filters (LoadFilter): Filtering criteria received from query params
+        limit (int): Maximum number of loads to return
+
+    Returns:
+        List[Load]: Matching loads from most to least priority
+    """
+    result = await db.scalars(ranked_loads_statement(filters, limit))
+    return list(result.all())
+
+
+def tiered_loads_statement(
+    filters: LoadFilter,
+    relaxed_filters: LoadFilter,
+    limit: int = 1,
+    after: Optional[LoadSearchCursor] = None,
+) -> Select:
+    """
+    Build the single statement that evaluates strict and relaxed filters.
+
+    Each tier is its own LIMITed branch of a UNION ALL so that it can use the
+    indexes matching its own predicates (the strict branch keeps the pickup
+    window and miles range, the relaxed one does not). The relaxed branch
+    excludes strict matches; the outer query ranks strict rows (`tier_rank`
+    0) ahead of relaxed ones (1), then by the usual priority ordering.
+
+    With `after`, both branches resume after that position: a strict cursor
+    keeps the strict loads ranked after it and every relaxed one, a relaxed
+    cursor means the strict tier is exhausted.
+
+    Args:
+        filters (LoadFilter): Strict filtering criteria
+        relaxed_filters (LoadFilter): Fallback criteria used when nothing
+            matches strictly
+        limit (int): Maximum number of loads to return
+        after (Optional[LoadSearchCursor]): Last load of the previous page
+
+    Returns:
+        Select: Statement yielding `(Load, tier_rank)` rows
+    """
+    strict_conditions = build_load_conditions(filters)
+    relaxed_conditions = build_load_conditions(relaxed_filters)
+    strict_after, relaxed_after = [], []
+    if after is not None and after.match_tier == MatchTier.STRICT:
+        strict_after = [after_priority_position(after)]
+    elif after is not None:
+        strict_after = [false()]
+        relaxed_after = [after_priority_position(after)]
+
+    def _branch(tier_rank: int, *conditions) -> Select:
+        return (
+            select(Load, literal(tier_rank).label("tier_rank"))
+            .where(*conditions)
+            .order_by(*load_priority_ordering())
+            .limit(limit)
+        )
+
+    # Relaxing only drops constraints: same count means nothing was relaxed.
+    if len(relaxed_conditions) == len(strict_conditions):
+        return _branch(0, *strict_conditions, *strict_after)
+
+    strict_match = func.coalesce(and_(*strict_conditions), false())
+    tiers = union_all(
+        select(_branch(0, *strict_conditions, *strict_after).subquery()),
+        select(
+            _branch(
+                1, *relaxed_conditions, not_(strict_match), *relaxed_after
+            ).subquery()
+        ),
+    ).subquery()
+    ranked_load = aliased(Load, tiers)
+
+    return (
+        select(ranked_load, tiers.c.tier_rank)
+        .order_by(tiers.c.tier_rank, *load_priority_ordering(ranked_load))
+        .limit(limit)
+    )
+
+
+def get_tiered_ranked_loads(
+    db: Session,
+    filters: LoadFilter,
+    relaxed_filters: LoadFilter,
+    limit: int = 1,
+    after: Optional[LoadSearchCursor] = None,
+) -> List[Tuple[Load, MatchTier]]:
+    """
+    Evaluate strict and relaxed filters in a single round trip.
+
+    Args:
+        db (Session): SQLAlchemy DB session
+        filters (LoadFilter): Strict filtering criteria
+        relaxed_filters (LoadFilter): Fallback criteria used when nothing
+            matches strictly
+        limit (int): Maximum number of loads to return
+        after (Optional[LoadSearchCursor]): Last load of the previous page
+
+    Returns:
+        List[Tuple[Load, MatchTier]]: Ranked loads with the tier they matched
+    """
+    statement = tiered_loads_statement(filters, relaxed_filters, limit, after)
+    rows = db.execute(statement).all()
+    return _with_match_tier(rows)
+
+
+async def get_tiered_ranked_loads_async(
+    db: AsyncSession,
+    filters: LoadFilter,
+    relaxed_filters: LoadFilter,
+    limit: int = 1,
+    after: Optional[LoadSearchCursor] = None,
+) -> List[Tuple[Load, MatchTier]]:
+    """
+    Async counterpart of `get_tiered_ranked_loads`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async DB session
+        filters (LoadFilter): Strict filtering criteria
+        relaxed_filters (LoadFilter): Fallback criteria used when nothing
+            matches strictly
+        limit (int): Maximum number of loads to return
+        after (Optional[LoadSearchCursor]): Last load of the previous page
+
+    Returns:
+        List[Tuple[Load, MatchTier]]: Ranked loads with the tier they matched
+    """
+    statement = tiered_loads_statement(filters, relaxed_filters, limit, after)
+    result = await db.execute(statement)
+    return _with_match_tier(result.all())
+
+
+def _with_match_tier(rows) -> List[Tuple[Load, MatchTier]]:
+    return [
+        (load, MatchTier.STRICT if rank == 0 else MatchTier.RELAXED)
+        for load, rank in rows
+    ]
+
+
+# Keeps the IN list well below the driver's bind parameter limit
+LOAD_ID_LOOKUP_CHUNK = 5000
+
+
+def _load_id_chunks(load_ids: Iterable[UUID]) -> List[List[UUID]]:
+    unique = list(dict.fromkeys(load_ids))
+    return [
+        unique[start : start + LOAD_ID_LOOKUP_CHUNK]
+        for start in range(0, len(unique), LOAD_ID_LOOKUP_CHUNK)
+    ]
+
+
+def get_existing_load_ids(db: Session, load_ids: Iterable[UUID]) -> Set[UUID]:
+    """
+    Return which of the given load IDs exist.
+
+    Args:
+        db (Session): SQLAlchemy DB session
+        load_ids (Iterable[UUID]): Load IDs to look up (duplicates allowed)
+
+    Returns:
+        Set[UUID]: The subset of `load_ids` present in the loads table
+    """
+    existing = set()
+    for chunk in _load_id_chunks(load_ids):
+        existing.update(db.scalars(select(Load.load_id).where(Load.load_id.in_(chunk))))
+    return existing
+
+
+async def get_existing_load_ids_async(
+    db: AsyncSession, load_ids: Iterable[UUID]
+) -> Set[UUID]:
+    """
+    Async counterpart of `get_existing_load_ids`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async DB session
+        load_ids (Iterable[UUID]): Load IDs to look up (duplicates allowed)
+
+    Returns:
+        Set[UUID]: The subset of `load_ids` present in the loads table
+    """
+    existing = set()
+    for chunk in _load_id_chunks(load_ids):
+        result = await db.scalars(select(Load.load_id).where(Load.load_id.in_(chunk)))
+        existing.update(result.all())
+    return existing
+
+
+def upsert_loads_statement(dialect_name: str) -> Insert:
+    """
+    INSERT ... ON CONFLICT (load_id) DO UPDATE replacing every column.
+
+    Args:
+        dialect_name (str): Name of the bound dialect (postgresql or sqlite).
+
+    Returns:
+        Insert: Statement to execute with a list of load rows.
+    """
+    table = Load.__table__
+    dialect_insert = (
+        postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    )
+    statement = dialect_insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=[table.c.load_id],
+        set_={
+            column.name: statement.excluded[column.name]
+            for column in table.c
+            if not column.primary_key
+        },
+    )
+
+
+def upsert_loads(db: Session, rows: List[dict]) -> int:
+    """
+    Insert or update loads by `load_id` and commit.
+
+    A load ID must appear at most once in `rows`.
+
+    Args:
+        db (Session): SQLAlchemy DB session
+        rows (List[dict]): Load column values, including `load_id`
+
+    Returns:
+        int: Number of loads written
+    """
+    if not rows:
+        return 0
+    db.execute(upsert_loads_statement(db.get_bind().dialect.name), rows)
+    db.commit()
+    return len(rows)
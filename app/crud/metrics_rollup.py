@@ -0,0 +1,378 @@
+import math
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+from sqlalchemy import (
+    DateTime,
+    Select,
+    Table,
+    cast,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    type_coerce,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import Insert
+from app.models.call_summary import CallOutcomeEnum, CallSummary, SentimentEnum
+from app.models.metrics_rollup import (
+    ROLLUP_SHARDS,
+    CallMetricsHourly,
+    CallMetricsRollup,
+)
+
+rollup_table = CallMetricsRollup.__table__
+hourly_table = CallMetricsHourly.__table__
+
+# Every counter column (i.e. all but the primary key of either table)
+ROLLUP_COUNTERS: List[str] = [
+    column.name for column in rollup_table.columns if not column.primary_key
+]
+
+# CallSummary columns whose averages are served from `<field>_sum / <field>_count`
+AVERAGED_FIELDS: Tuple[str, ...] = (
+    "agreed_price",
+    "call_duration_sec",
+    "attempts",
+    "counter_offers",
+)
+# (field, sum column, count column), precomputed for the per-row hot loop
+_AVERAGED_COLUMNS = tuple(
+    (field, f"{field}_sum", f"{field}_count") for field in AVERAGED_FIELDS
+)
+_SENTIMENT_COLUMNS = {
+    sentiment.value: f"sentiment_{sentiment.value}" for sentiment in SentimentEnum
+}
+
+# CallSummary columns read by `add_summary_deltas`, besides `id` and `created_at`
+ROLLUP_SOURCE_COLUMNS: Tuple[str, ...] = (
+    "outcome",
+    "sentiment",
+    "satisfaction",
+    *AVERAGED_FIELDS,
+)
+
+
+class RollupDeltas(NamedTuple):
+    """Increments per all-time shard and per (hour bucket, shard)."""
+
+    totals: Dict[int, Dict[str, float]]
+    hourly: Dict[Tuple[datetime, int], Dict[str, float]]
+
+
+def floor_to_hour(moment: datetime) -> datetime:
+    """Start of the hourly rollup bucket containing `moment`."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def hour_bucket(column, dialect_name: str):
+    """
+    SQL equivalent of `floor_to_hour` for the bound dialect.
+
+    Args:
+        column: DateTime column or expression.
+        dialect_name (str): Name of the bound dialect (postgresql or sqlite).
+
+    Returns:
+        Expression evaluating to the start of the hour, typed as DateTime.
+    """
+    if dialect_name == "postgresql":
+        return func.date_trunc("hour", column)
+    # SQLite stores DateTime as text in SQLAlchemy's default format
+    return type_coerce(func.strftime("%Y-%m-%d %H:00:00.000000", column), DateTime)
+
+
+def rollup_aggregates() -> Dict:
+    """
+    SQL aggregate over `call_summaries` for every rollup counter.
+
+    Summing the rollup rows must give exactly these values; they back both
+    the rebuild and the consistency check.
+
+    Returns:
+        Dict: Labelled aggregate expression per rollup column name.
+    """
+    aggregates = {"total_calls": func.count()}
+    for outcome in CallOutcomeEnum:
+        aggregates[outcome.value] = func.count().filter(
+            CallSummary.outcome == outcome
+        )
+    for sentiment in SentimentEnum:
+        aggregates[f"sentiment_{sentiment.value}"] = func.count().filter(
+            CallSummary.sentiment == sentiment
+        )
+    aggregates["satisfied"] = func.count().filter(CallSummary.satisfaction.is_(True))
+    aggregates["unsatisfied"] = func.count().filter(
+        CallSummary.satisfaction.is_(False)
+    )
+    for field in AVERAGED_FIELDS:
+        column = getattr(CallSummary, field)
+        aggregates[f"{field}_sum"] = func.coalesce(func.sum(column), 0)
+        aggregates[f"{field}_count"] = func.count(column)
+
+    return {name: expression.label(name) for name, expression in aggregates.items()}
+
+
+def add_summary_deltas(deltas: Dict[str, float], summary: CallSummary) -> None:
+    """
+    Add the rollup increments contributed by one call summary to `deltas`.
+
+    Mirrors `rollup_aggregates` row by row. Must be called after the summary
+    was flushed so column defaults (e.g. `attempts`) are populated.
+
+    Args:
+        deltas (Dict[str, float]): Increments keyed by rollup column name,
+            defaulting to 0 for missing names.
+        summary (CallSummary): Persisted call summary.
+    """
+    deltas["total_calls"] += 1
+    if summary.outcome is not None:
+        deltas[getattr(summary.outcome, "value", summary.outcome)] += 1
+    if summary.sentiment is not None:
+        sentiment = getattr(summary.sentiment, "value", summary.sentiment)
+        deltas[_SENTIMENT_COLUMNS[sentiment]] += 1
+    if summary.satisfaction is not None:
+        deltas["satisfied" if summary.satisfaction else "unsatisfied"] += 1
+    for field, sum_column, count_column in _AVERAGED_COLUMNS:
+        value = getattr(summary, field)
+        if value is not None:
+            deltas[sum_column] += value
+            deltas[count_column] += 1
+
+
+def collect_rollup_deltas(summaries: Iterable[CallSummary]) -> RollupDeltas:
+    """
+    Merge the increments of several call summaries per rollup row.
+
+    Args:
+        summaries (Iterable[CallSummary]): Flushed call summaries, or rows
+            exposing the same attributes (e.g. from INSERT ... RETURNING).
+
+    Returns:
+        RollupDeltas: Increments per all-time shard and per hourly bucket.
+    """
+    hourly = defaultdict(lambda: defaultdict(int))
+    for summary in summaries:
+        bucket = (floor_to_hour(summary.created_at), summary.id % ROLLUP_SHARDS)
+        add_summary_deltas(hourly[bucket], summary)
+
+    # Each all-time shard is the sum of its hourly buckets
+    totals = defaultdict(lambda: defaultdict(int))
+    for (_, shard), values in hourly.items():
+        for name, value in values.items():
+            totals[shard][name] += value
+    return RollupDeltas(totals=totals, hourly=hourly)
+
+
+def _increment_statement(dialect_name: str, table: Table) -> Insert:
+    """
+    Upsert adding the inserted counters to a rollup row, creating it on first use.
+
+    Every counter is listed (zero when unchanged), so one compiled statement
+    serves all rows and is executed as a single executemany.
+
+    Args:
+        dialect_name (str): Name of the bound dialect (postgresql or sqlite).
+        table (Table): Rollup table to increment.
+
+    Returns:
+        Insert: INSERT ... ON CONFLICT (<primary key>) DO UPDATE statement.
+    """
+    dialect_insert = (
+        postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+    )
+    statement = dialect_insert(table)
+    return statement.on_conflict_do_update(
+        index_elements=list(table.primary_key.columns),
+        set_={
+            name: table.c[name] + statement.excluded[name] for name in ROLLUP_COUNTERS
+        },
+    )
+
+
+def _increment_params(
+    db, summaries: Iterable[CallSummary]
+) -> List[Tuple[Insert, List[Dict]]]:
+    dialect_name = db.get_bind().dialect.name
+    deltas = collect_rollup_deltas(summaries)
+    # Rows are always locked in the same order (all-time shards, then hourly
+    # buckets, ascending) to avoid deadlocks between concurrent transactions.
+    totals = [
+        {"shard": shard, **{name: values.get(name, 0) for name in ROLLUP_COUNTERS}}
+        for shard, values in sorted(deltas.totals.items())
+    ]
+    hourly = [
+        {
+            "bucket_start": bucket_start,
+            "shard": shard,
+            **{name: values.get(name, 0) for name in ROLLUP_COUNTERS},
+        }
+        for (bucket_start, shard), values in sorted(deltas.hourly.items())
+    ]
+    return [
+        (_increment_statement(dialect_name, table), params)
+        for table, params in ((rollup_table, totals), (hourly_table, hourly))
+        if params
+    ]
+
+
+def apply_rollup_deltas(db: Session, summaries: Iterable[CallSummary]) -> None:
+    """
+    Add flushed call summaries to the rollups within the caller's transaction.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+        summaries (Iterable[CallSummary]): Flushed, not yet committed summaries.
+    """
+    for statement, params in _increment_params(db, summaries):
+        db.execute(statement, params)
+
+
+async def apply_rollup_deltas_async(
+    db: AsyncSession, summaries: Iterable[CallSummary]
+) -> None:
+    """
+    Async counterpart of `apply_rollup_deltas`.
+
+    Args:
+        db (AsyncSession): SQLAlchemy async database session.
+        summaries (Iterable[CallSummary]): Flushed, not yet committed summaries.
+    """
+    for statement, params in _increment_params(db, summaries):
+        await db.execute(statement, params)
+
+
+def rollup_totals_columns(table: Table = rollup_table) -> List:
+    """
+    Sum of every counter over the selected rows of a rollup table.
+
+    Sums are cast back to the column type: Postgres widens sum(bigint) to
+    numeric, which would otherwise come back as Decimal.
+
+    Args:
+        table (Table): `call_metrics_rollup` or `call_metrics_hourly`.
+
+    Returns:
+        List: Labelled `coalesce(sum(column), 0)` expressions.
+    """
+    return [
+        cast(func.coalesce(func.sum(column), 0), column.type).label(column.name)
+        for column in (table.c[name] for name in ROLLUP_COUNTERS)
+    ]
+
+
+def live_rollup_statement() -> Select:
+    """
+    Recompute the rollup totals from the raw `call_summaries` rows.
+
+    Returns:
+        Select: Statement yielding one row with a column per rollup counter.
+    """
+    return select(*rollup_aggregates().values()).select_from(CallSummary)
+
+
+def rebuild_rollup(db: Session) -> int:
+    """
+    Replace both rollups with totals recomputed from the raw call summaries.
+
+    On Postgres, writers to `call_summaries` are blocked until the caller
+    commits, so no insert is counted twice or lost during the rebuild.
+
+    Args:
+        db (Session): SQLAlchemy database session; the caller commits.
+
+    Returns:
+        int: Number of all-time shard rows written.
+    """
+    dialect_name = db.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        db.execute(text("LOCK TABLE call_summaries IN SHARE MODE"))
+
+    shard = (CallSummary.id % ROLLUP_SHARDS).label("shard")
+    bucket_start = hour_bucket(CallSummary.created_at, dialect_name).label(
+        "bucket_start"
+    )
+    aggregates = rollup_aggregates()
+    counters = [aggregates[name] for name in ROLLUP_COUNTERS]
+
+    db.execute(delete(rollup_table))
+    db.execute(delete(hourly_table))
+    result = db.execute(
+        insert(rollup_table).from_select(
+            ["shard", *ROLLUP_COUNTERS],
+            select(shard, *counters).select_from(CallSummary).group_by(shard),
+        )
+    )
+    db.execute(
+        insert(hourly_table).from_select(
+            ["bucket_start", "shard", *ROLLUP_COUNTERS],
+            select(bucket_start, shard, *counters)
+            .select_from(CallSummary)
+            .group_by(bucket_start, shard),
+        )
+    )
+    return result.rowcount
+
+
+def _differences(
+    live: Dict, rollup: Dict, prefix: str = ""
+) -> Dict[str, Tuple[float, float]]:
+    return {
+        f"{prefix}{name}": (live.get(name, 0), rollup.get(name, 0))
+        for name in ROLLUP_COUNTERS
+        if not math.isclose(
+            live.get(name, 0), rollup.get(name, 0), rel_tol=1e-9, abs_tol=1e-6
+        )
+    }
+
+
+def check_rollup(db: Session) -> Dict[str, Tuple[float, float]]:
+    """
+    Compare both rollups with the live aggregate over raw rows.
+
+    Args:
+        db (Session): SQLAlchemy database session.
+
+    Returns:
+        Dict[str, Tuple[float, float]]: `(live, rollup)` values of every
+        counter that differs, keyed by counter name for the all-time rollup
+        and by `"<bucket_start> <counter>"` for hourly buckets; empty when
+        the rollups are consistent.
+    """
+    live = db.execute(live_rollup_statement()).mappings().one()
+    rollup = db.execute(select(*rollup_totals_columns())).mappings().one()
+    mismatches = _differences(live, rollup)
+
+    bucket_start = hour_bucket(
+        CallSummary.created_at, db.get_bind().dialect.name
+    ).label("bucket_start")
+    live_hourly = {
+        row["bucket_start"]: row
+        for row in db.execute(
+            select(bucket_start, *rollup_aggregates().values()).group_by(
+                bucket_start
+            )
+        ).mappings()
+    }
+    rollup_hourly = {
+        row["bucket_start"]: row
+        for row in db.execute(
+            select(
+                hourly_table.c.bucket_start, *rollup_totals_columns(hourly_table)
+            ).group_by(hourly_table.c.bucket_start)
+        ).mappings()
+    }
+    for bucket in sorted(live_hourly.keys() | rollup_hourly.keys()):
+        mismatches.update(
+            _differences(
+                live_hourly.get(bucket, {}),
+                rollup_hourly.get(bucket, {}),
+                prefix=f"{bucket.isoformat()} ",
+            )
+        )
+
+    return mismatches
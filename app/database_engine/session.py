@@ -1,11 +1,103 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-DATABASE_URL = "postgresql+psycopg2://user:password@db:5432/loads_db"
+from app.core.config import settings
+from app.core.instrumentation import instrument_engine
+from app.core.query_profiler import attach_query_profiler
 
-engine = create_engine(DATABASE_URL)
+ASYNC_DRIVERNAME = "postgresql+asyncpg"
+
+
+def to_async_url(database_url: str) -> URL:
+    """
+    Derive the asyncpg URL from the configured (psycopg2) DATABASE_URL.
+
+    Args:
+        database_url (str): SQLAlchemy URL of the synchronous engine.
+
+    Returns:
+        URL: Same database, host and credentials using the asyncpg driver.
+    """
+    return make_url(database_url).set(drivername=ASYNC_DRIVERNAME)
+
+
+def engine_options() -> dict:
+    """
+    Connection pool options shared by the sync and async engines.
+
+    Pool sizes apply per engine and per worker process: a deployment with N
+    workers can open up to N * 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    connections.
+
+    Returns:
+        dict: Keyword arguments for `create_engine` / `create_async_engine`.
+    """
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+# Synchronous engine: CLI commands, benchmarks and tests
+engine = create_engine(settings.DATABASE_URL, **engine_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Asynchronous engine: API request handlers
+async_engine = create_async_engine(
+    to_async_url(settings.DATABASE_URL), **engine_options()
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+# Statement timings for GET /metrics/runtime (no-op when disabled)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+# Per-request SQL profiling (see QueryProfilerMiddleware)
+if settings.QUERY_PROFILER_ENABLED:
+    attach_query_profiler(engine)
+    attach_query_profiler(async_engine.sync_engine)
+
+
+def pool_status(bind: Engine) -> dict:
+    """
+    Snapshot of a queue pool's live counters.
+
+    Args:
+        bind (Engine): Engine whose pool is inspected.
+
+    Returns:
+        dict: Configured size, checked-out, idle and overflow connections.
+    """
+    pool = bind.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # QueuePool.overflow() starts at -pool_size and grows with each
+        # connection opened; only the part above zero is real overflow.
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+def get_pool_status() -> dict:
+    """
+    Live pool counters of this worker's sync and async engines.
+
+    Returns:
+        dict: `pool_status` of each engine keyed by "sync" and "async".
+    """
+    return {
+        "sync": pool_status(engine),
+        "async": pool_status(async_engine.sync_engine),
+    }
+
 
 def get_db():
     db = SessionLocal()
@@ -13,3 +105,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,10 +1,68 @@
 import logging
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
+from app.business.call_summary_buffer import CallSummaryBuffer
+from app.business.fmcsa_client import FMCSAClient
+from app.business.load_index import LoadIndex
+from app.business.load_search_cache import LoadSearchCache
 from app.core.config import settings
+from app.core.request_capture import RequestCapture
+from app.database_engine.session import AsyncSessionLocal, SessionLocal
 from app.middlewares.api_log_request import APILogRequestMiddleware
+from app.middlewares.query_profiler import QueryProfilerMiddleware
+from app.middlewares.runtime_metrics import RuntimeMetricsMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Start and stop the background services of the application.
+
+    The FMCSA client and its connection pool live as long as the app.
+    With `CALL_SUMMARY_WRITE_BEHIND`, the call summary buffer recovers its
+    spill files on start-up and stores what is still queued on shutdown.
+    With `LOAD_INDEX_ENABLED`, the load index is loaded and then refreshed
+    in the background. With `LOAD_SEARCH_CACHE_ENABLED`, repeated searches
+    are cached until the TTL or until the load index sees changed loads.
+    With `REQUEST_CAPTURE_ENABLED`, sampled requests are written to traffic
+    files until shutdown.
+    """
+    app.state.call_summary_buffer = None
+    app.state.request_capture = None
+    app.state.load_index = None
+    app.state.load_search_cache = None
+    if settings.LOAD_SEARCH_CACHE_ENABLED:
+        app.state.load_search_cache = LoadSearchCache.from_settings()
+    async with AsyncExitStack() as services:
+        app.state.fmcsa_client = FMCSAClient.from_settings()
+        services.push_async_callback(app.state.fmcsa_client.aclose)
+
+        if settings.REQUEST_CAPTURE_ENABLED:
+            capture = RequestCapture.from_settings()
+            await capture.start()
+            services.push_async_callback(capture.stop)
+            app.state.request_capture = capture
+
+        if settings.CALL_SUMMARY_WRITE_BEHIND:
+            buffer = CallSummaryBuffer.from_settings(AsyncSessionLocal)
+            await buffer.start()
+            services.push_async_callback(buffer.stop)
+            app.state.call_summary_buffer = buffer
+
+        if settings.LOAD_INDEX_ENABLED:
+            cache = app.state.load_search_cache
+            load_index = LoadIndex.from_settings(
+                SessionLocal, on_change=cache.invalidate if cache else None
+            )
+            await load_index.start()
+            services.push_async_callback(load_index.stop)
+            app.state.load_index = load_index
+
+        yield
 
 
 def create_app() -> FastAPI:
@@ -13,7 +71,7 @@ def create_app() -> FastAPI:
 
     Responsibilities:
     - Set up structured logging.
-    - Register middlewares (CORS, request logging).
+    - Register middlewares (CORS, request logging, runtime metrics).
     - Register API routes.
     """
 
@@ -30,11 +88,20 @@ def create_app() -> FastAPI:
         version="1.0.0",
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         generate_unique_id_function=lambda route: f"{route.tags[0]}-{route.name}",
+        lifespan=lifespan,
     )
 
-    # Register request logging middleware
+    # Register request logging middleware (and request capture, if enabled)
     app.add_middleware(APILogRequestMiddleware)
 
+    # Register SQL profiling of each request (slow statements, N+1, budget)
+    if settings.QUERY_PROFILER_ENABLED:
+        app.add_middleware(QueryProfilerMiddleware)
+
+    # Register runtime latency histograms (around request logging, timing it too)
+    if settings.RUNTIME_METRICS_ENABLED:
+        app.add_middleware(RuntimeMetricsMiddleware)
+
     # Register CORS middleware if configured
     if settings.BACKEND_CORS_ORIGINS:
         app.add_middleware(
@@ -1,37 +1,213 @@
+"""
+Request/response logging as a pure ASGI middleware.
+
+Unlike `BaseHTTPMiddleware`, the request is passed straight to the app: no
+extra task or body stream per request, and streaming responses are sent
+as the app produces them. Log lines use %-style arguments and are only
+built when `INFO` is enabled for this logger.
+
+`LOG_SAMPLE_RATES` maps path prefixes to the fraction of requests logged
+(the longest matching prefix wins, other paths are always logged), e.g.
+`{"/api/v1/health": 0.01}`. Requests that are not sampled are still logged
+when they fail with a 5xx status.
+
+When the app runs a `RequestCapture` (`REQUEST_CAPTURE_ENABLED`), a sample
+of the requests with an empty or JSON body is also recorded to a traffic
+file for replay, whatever the log level (see `app.core.request_capture`).
+"""
+
+import json
 import logging
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+import random
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import constants, settings
+from app.core.request_capture import RequestCapture
+from app.schemas.traffic import RecordedRequest
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
 
 
-class APILogRequestMiddleware(BaseHTTPMiddleware):
-    def _get_client_ip(self, request: Request) -> str:
-        x_forwarded_for = request.headers.get("X-Forwarded-For")
-        if x_forwarded_for:
-            return x_forwarded_for.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
+def _header(scope: Scope, name: bytes) -> str:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
 
-    def _log_request(self, request: Request) -> None:
-        logger.info(
-            f"[Request] {request.method} {request.url.path} | "
-            f"Query: {dict(request.query_params)} | "
-            f"IP: {self._get_client_ip(request)} | "
-            f"User-Agent: {request.headers.get('User-Agent', '')} | "
-            f"Accept: {request.headers.get('Accept', '')} | "
-            f"Content-Type: {request.headers.get('Content-Type', '')}"
+
+def _client_ip(scope: Scope) -> str:
+    x_forwarded_for = _header(scope, b"x-forwarded-for")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def _capture(scope: Scope) -> Optional[RequestCapture]:
+    """Request capture started by the app's lifespan, if any."""
+    app = scope.get("app")
+    return getattr(getattr(app, "state", None), "request_capture", None)
+
+
+class APILogRequestMiddleware:
+    """
+    Log each HTTP request and its response status and latency, and capture
+    a sample of them when request capture is enabled.
+
+    Args:
+        app (ASGIApp): Application to wrap.
+        sample_rates (Optional[Dict[str, float]]): Fraction of requests
+            logged per path prefix; defaults to `LOG_SAMPLE_RATES`.
+        random_source (Callable[[], float]): Uniform [0, 1) sample source.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rates: Optional[Dict[str, float]] = None,
+        random_source: Callable[[], float] = random.random,
+    ):
+        self.app = app
+        rates = settings.LOG_SAMPLE_RATES if sample_rates is None else sample_rates
+        # Longest prefixes first, so the most specific rate is found first
+        self._sample_rates: Tuple[Tuple[str, float], ...] = tuple(
+            sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
         )
+        self._random = random_source
+
+    def _sampled(self, path: str) -> bool:
+        for prefix, rate in self._sample_rates:
+            if path.startswith(prefix):
+                return rate >= 1.0 or self._random() < rate
+        return True
 
-    def _log_response(self, request: Request, response: Response) -> None:
+    def _capturing(self, scope: Scope) -> Optional[RequestCapture]:
+        capture = _capture(scope)
+        if capture is None:
+            return None
+        content_type = _header(scope, b"content-type")
+        if content_type and not content_type.startswith("application/json"):
+            return None
+        if capture.sample_rate < 1.0 and self._random() >= capture.sample_rate:
+            return None
+        return capture
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        logging_enabled = logger.isEnabledFor(logging.INFO)
+        capture = self._capturing(scope)
+        if not logging_enabled and capture is None:
+            await self.app(scope, receive, send)
+            return
+
+        sampled = logging_enabled and self._sampled(scope["path"])
+        if sampled:
+            self._log_request(scope)
+
+        body = bytearray()
+        body_too_large = False
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_too_large
+            message = await receive()
+            if message["type"] == "http.request" and not body_too_large:
+                body.extend(message.get("body", b""))
+                if len(body) > constants.REQUEST_CAPTURE_MAX_BODY_BYTES:
+                    body_too_large = True
+                    body.clear()
+            return message
+
+        response_headers: Iterable[Tuple[bytes, bytes]] = ()
+        status_code = 500  # If the app fails before starting the response
+        received_at = time.time()
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_headers = message.get("headers", ())
+            await send(message)
+
+        try:
+            await self.app(
+                scope, receive if capture is None else receive_wrapper, send_wrapper
+            )
+        finally:
+            # Latency up to the last body chunk, streaming responses included
+            latency_ms = (time.perf_counter() - started) * 1000
+            if sampled or (logging_enabled and status_code >= 500):
+                self._log_response(scope, status_code, response_headers, latency_ms)
+            if capture is not None and not body_too_large:
+                self._capture_request(
+                    capture, scope, bytes(body), received_at, status_code, latency_ms
+                )
+
+    def _capture_request(
+        self,
+        capture: RequestCapture,
+        scope: Scope,
+        body: bytes,
+        received_at: float,
+        status_code: int,
+        latency_ms: float,
+    ) -> None:
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            return  # Not replayable as JSON
+        capture.submit(
+            RecordedRequest(
+                offset=round(received_at, 3),
+                method=scope["method"],
+                path=scope["path"],
+                route=getattr(scope.get("route"), "path", None),
+                query=scope["query_string"].decode("latin-1"),
+                body=payload,
+                status=status_code,
+                latency_ms=round(latency_ms, 3),
+            )
+        )
+
+    def _log_request(self, scope: Scope) -> None:
         logger.info(
-            f"[Response] {request.method} {request.url.path} | "
-            f"Status: {response.status_code} | "
-            f"Content-Type: {response.headers.get('Content-Type', '')}"
+            "[Request] %s %s | Query: %s | IP: %s | User-Agent: %s | "
+            "Accept: %s | Content-Type: %s",
+            scope["method"],
+            scope["path"],
+            scope["query_string"].decode("latin-1"),
+            _client_ip(scope),
+            _header(scope, b"user-agent"),
+            _header(scope, b"accept"),
+            _header(scope, b"content-type"),
         )
 
-    async def dispatch(self, request: Request, call_next):
-        self._log_request(request)
-        response = await call_next(request)
-        self._log_response(request, response)
-        return response
+    def _log_response(
+        self,
+        scope: Scope,
+        status_code: int,
+        headers: Iterable[Tuple[bytes, bytes]],
+        latency_ms: float,
+    ) -> None:
+        content_type = next(
+            (
+                value.decode("latin-1")
+                for key, value in headers
+                if key == b"content-type"
+            ),
+            "",
+        )
+        logger.info(
+            "[Response] %s %s | Status: %d | Content-Type: %s | Latency: %.1fms",
+            scope["method"],
+            scope["path"],
+            status_code,
+            content_type,
+            latency_ms,
+        )
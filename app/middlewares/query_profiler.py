@@ -0,0 +1,34 @@
+"""
+SQL profiling of every request as a pure ASGI middleware.
+
+Each request runs inside `profile_queries`; once its response is sent,
+requests over the statement budget, with repeated statements or with slow
+statements are logged as warnings (see `app.core.query_profiler`).
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.query_profiler import profile_queries, report_problems
+
+
+class QueryProfilerMiddleware:
+    """
+    Profile the SQL statements of each HTTP request.
+
+    Args:
+        app (ASGIApp): Application to wrap.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with profile_queries() as profile:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                report_problems(f"{scope['method']} {scope['path']}", profile)
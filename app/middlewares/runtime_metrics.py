@@ -0,0 +1,56 @@
+"""
+Per-route latency and database usage histograms as a pure ASGI middleware.
+
+Requests are labelled with their route template (e.g. `/api/v1/loads`),
+not the raw path, so path parameters do not create new series; requests
+matching no route share the `unmatched` label.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.instrumentation import (
+    REQUEST_DB_DURATION,
+    REQUEST_DB_QUERIES,
+    REQUEST_DURATION,
+    track_request_db_usage,
+)
+
+
+class RuntimeMetricsMiddleware:
+    """
+    Record the latency, statement count and SQL time of each HTTP request.
+
+    Args:
+        app (ASGIApp): Application to wrap.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500  # If the app fails before starting the response
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with track_request_db_usage() as usage:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                elapsed = time.perf_counter() - started
+                # The router stores the matched route in the shared scope
+                route = getattr(scope.get("route"), "path", None) or "unmatched"
+                method = scope["method"]
+                REQUEST_DURATION.observe(elapsed, method, route, str(status_code))
+                REQUEST_DB_QUERIES.observe(usage.queries, method, route)
+                REQUEST_DB_DURATION.observe(usage.seconds, method, route)
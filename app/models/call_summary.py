@@ -7,8 +7,12 @@ from sqlalchemy import (
     Enum,
     ForeignKey,
     Boolean,
+    DateTime,
+    Index,
+    func,
 )
 from app.database_engine.base_class import Base
+from datetime import datetime, timezone
 import enum
 
 
@@ -40,6 +44,10 @@ class CallSummary(Base):
     """
 
     __tablename__ = "call_summaries"
+    __table_args__ = (
+        # Keyset pagination (`id > cursor ORDER BY id`) filtered by load
+        Index("ix_call_summaries_load_id_id", "load_id", "id"),
+    )
 
     id = Column(
         Integer,
@@ -60,9 +68,13 @@ class CallSummary(Base):
         String(255), doc="Any special conditions discussed during the call."
     )
 
-    outcome = Column(Enum(CallOutcomeEnum), doc="Final outcome of the call.")
+    # Stored as VARCHAR (see init.sql), not as a native Postgres enum type
+    outcome = Column(
+        Enum(CallOutcomeEnum, native_enum=False),
+        doc="Final outcome of the call.",
+    )
     sentiment = Column(
-        Enum(SentimentEnum),
+        Enum(SentimentEnum, native_enum=False),
         doc="Overall sentiment detected from the carrier during the call.",
     )
 
@@ -80,3 +92,13 @@ class CallSummary(Base):
         nullable=True,
         doc="Indicates whether the carrier found the call helpful.",
     )
+    created_at = Column(
+        DateTime,
+        nullable=False,
+        index=True,
+        # Set client side (naive UTC) so the metrics rollup knows the hour
+        # bucket before commit; the server default covers raw SQL inserts.
+        default=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
+        server_default=func.now(),
+        doc="Time the call summary was logged (UTC).",
+    )
@@ -1,7 +1,19 @@
 import uuid
-from sqlalchemy import Column, String, Float, Integer, DateTime
+from sqlalchemy import (
+    Column,
+    String,
+    Float,
+    Integer,
+    DateTime,
+    Index,
+    case,
+    func,
+    literal,
+)
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql.expression import Grouping
 from app.database_engine.base_class import Base
+from app.core.config import constants
 
 
 class Load(Base):
@@ -25,9 +37,47 @@ class Load(Base):
         num_of_pieces (int): Number of pieces/packages.
         miles (float): Total distance in miles.
         dimensions (str): Load dimensions (e.g., "48x40x60").
+        updated_at (datetime): Last insert or update of the row.
     """
 
     __tablename__ = "loads"
+    __table_args__ = (
+        # Trigram (pg_trgm) indexes back the substring and fuzzy text filters
+        # in app.crud.load; a B-tree cannot serve ILIKE '%term%'.
+        Index(
+            "ix_loads_origin_trgm",
+            "origin",
+            postgresql_using="gin",
+            postgresql_ops={"origin": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_loads_destination_trgm",
+            "destination",
+            postgresql_using="gin",
+            postgresql_ops={"destination": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_loads_equipment_type_trgm",
+            "equipment_type",
+            postgresql_using="gin",
+            postgresql_ops={"equipment_type": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_loads_commodity_type_trgm",
+            "commodity_type",
+            postgresql_using="gin",
+            postgresql_ops={"commodity_type": "gin_trgm_ops"},
+        ),
+        # B-tree indexes for the range filters. The strict search sends a
+        # pickup window (often with a distance range); the relaxed search
+        # drops both and keeps rate/weight bounds.
+        Index("ix_loads_pickup_datetime_miles", "pickup_datetime", "miles"),
+        Index("ix_loads_loadboard_rate_weight", "loadboard_rate", "weight"),
+        Index("ix_loads_miles", "miles"),
+        Index("ix_loads_weight", "weight"),
+        # Incremental refresh of the in-memory load index
+        Index("ix_loads_updated_at", "updated_at"),
+    )
 
     load_id = Column(
         UUID(as_uuid=True), primary_key=True, index=True, default=uuid.uuid4
@@ -44,3 +94,36 @@ class Load(Base):
     num_of_pieces = Column(Integer, nullable=True)
     miles = Column(Float, nullable=True)
     dimensions = Column(String(100), nullable=True)
+    updated_at = Column(
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+
+def urgency_rank(notes_column):
+    """
+    SQL expression ranking urgent loads (0) ahead of the rest (1).
+
+    Literals are rendered inline rather than bound so the expression used in
+    queries is textually identical to the `ix_loads_priority` index below,
+    which lets Postgres read loads in priority order and stop at the LIMIT.
+
+    Args:
+        notes_column: The `notes` column of Load (or of an alias of it).
+    """
+    pattern = literal(f"%{constants.URGENT_KEYWORD}%", literal_execute=True)
+    is_urgent = func.lower(
+        func.coalesce(notes_column, literal("", literal_execute=True))
+    ).like(pattern)
+    return case(
+        (is_urgent, literal(0, literal_execute=True)),
+        else_=literal(1, literal_execute=True),
+    )
+
+
+# Priority order used by `app.crud.load.load_priority_ordering`.
+Index(
+    "ix_loads_priority",
+    Grouping(urgency_rank(Load.notes)),
+    Load.delivery_datetime,
+    Load.load_id,
+)
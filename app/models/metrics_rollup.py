@@ -0,0 +1,72 @@
+from sqlalchemy import BigInteger, Column, DateTime, Float, Integer
+from app.database_engine.base_class import Base
+
+# Every call summary increments the shard `id % ROLLUP_SHARDS`, so concurrent
+# inserts update different rows instead of queueing on a single row lock.
+ROLLUP_SHARDS = 16
+
+
+class MetricsCounters:
+    """
+    Counter columns shared by the all-time and the hourly metrics rollups.
+
+    Averages are stored as sums and non-null counts so rows can be added up
+    across shards and buckets.
+    """
+
+    total_calls = Column(BigInteger, nullable=False, default=0)
+
+    # Outcome counters
+    accepted = Column(BigInteger, nullable=False, default=0)
+    rejected = Column(BigInteger, nullable=False, default=0)
+    failed_negotiation = Column(BigInteger, nullable=False, default=0)
+    no_response = Column(BigInteger, nullable=False, default=0)
+    interested_follow_up = Column(BigInteger, nullable=False, default=0)
+
+    # Sentiment counters
+    sentiment_positive = Column(BigInteger, nullable=False, default=0)
+    sentiment_neutral = Column(BigInteger, nullable=False, default=0)
+    sentiment_negative = Column(BigInteger, nullable=False, default=0)
+
+    # Satisfaction counters (unknown = total_calls - satisfied - unsatisfied)
+    satisfied = Column(BigInteger, nullable=False, default=0)
+    unsatisfied = Column(BigInteger, nullable=False, default=0)
+
+    # Sums and non-null counts for the averages
+    agreed_price_sum = Column(Float, nullable=False, default=0)
+    agreed_price_count = Column(BigInteger, nullable=False, default=0)
+    call_duration_sec_sum = Column(BigInteger, nullable=False, default=0)
+    call_duration_sec_count = Column(BigInteger, nullable=False, default=0)
+    attempts_sum = Column(BigInteger, nullable=False, default=0)
+    attempts_count = Column(BigInteger, nullable=False, default=0)
+    counter_offers_sum = Column(BigInteger, nullable=False, default=0)
+    counter_offers_count = Column(BigInteger, nullable=False, default=0)
+
+
+class CallMetricsRollup(MetricsCounters, Base):
+    """
+    SQLAlchemy model holding the all-time running totals behind `/metrics`.
+
+    Rows are incremented in the same transaction that inserts a call summary
+    (see `app.crud.metrics_rollup`), so summing the shards gives the same
+    counters the live aggregate over `call_summaries` would, without
+    scanning it.
+    """
+
+    __tablename__ = "call_metrics_rollup"
+
+    shard = Column(Integer, primary_key=True, autoincrement=False)
+
+
+class CallMetricsHourly(MetricsCounters, Base):
+    """
+    SQLAlchemy model holding the same counters per hour of `created_at`.
+
+    Backs the windowed and bucketed `/metrics` queries: day and week buckets
+    are built by adding up hourly rows, never by rescanning call summaries.
+    """
+
+    __tablename__ = "call_metrics_hourly"
+
+    bucket_start = Column(DateTime, primary_key=True)
+    shard = Column(Integer, primary_key=True, autoincrement=False)
@@ -1,8 +1,11 @@
 from uuid import UUID
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from enum import Enum
 
+# Largest value of the INTEGER columns
+INT32_MAX = 2**31 - 1
+
 
 class CallOutcomeEnum(str, Enum):
     """
@@ -37,10 +40,12 @@ class CallSummaryCreate(BaseModel):
         default=None, description="Final price agreed with the carrier"
     )
     comments: Optional[str] = Field(
-        default=None, description="Any additional notes from the call"
+        default=None, max_length=500, description="Any additional notes from the call"
     )
     special_conditions: Optional[str] = Field(
-        default=None, description="Special agreements discussed during the call"
+        default=None,
+        max_length=255,
+        description="Special agreements discussed during the call",
     )
     outcome: Optional[CallOutcomeEnum] = Field(
         default=None, description="Outcome of the call with the carrier"
@@ -49,13 +54,22 @@ class CallSummaryCreate(BaseModel):
         default=None, description="Detected sentiment of the carrier during the call"
     )
     call_duration_sec: Optional[int] = Field(
-        default=0, description="Total duration of the call in seconds"
+        default=0,
+        ge=0,
+        le=INT32_MAX,
+        description="Total duration of the call in seconds",
     )
     attempts: Optional[int] = Field(
-        default=1, description="Number of call attempts made to the carrier"
+        default=1,
+        ge=0,
+        le=INT32_MAX,
+        description="Number of call attempts made to the carrier",
     )
     counter_offers: Optional[int] = Field(
-        default=0, description="Number of counter offers proposed by the carrier"
+        default=0,
+        ge=0,
+        le=INT32_MAX,
+        description="Number of counter offers proposed by the carrier",
     )
     satisfaction: Optional[bool] = Field(
         default=None, description="Whether the carrier found the interaction helpful"
@@ -72,3 +86,54 @@ class CallSummaryResponse(CallSummaryCreate):
 
     class Config:
         from_attributes = True
+
+
+class CallSummaryFilter(BaseModel):
+    """
+    Filters used for listing and exporting call summaries.
+    All fields are optional.
+    """
+
+    outcome: Optional[CallOutcomeEnum] = Field(None, description="Filter by outcome")
+    sentiment: Optional[SentimentEnum] = Field(
+        None, description="Filter by detected sentiment"
+    )
+    load_id: Optional[UUID] = Field(None, description="Filter by associated load")
+
+
+class CallSummaryPage(BaseModel):
+    """
+    One page of call summaries, ordered by ID.
+    Pass `next_cursor` as `cursor` to fetch the following page.
+    """
+
+    items: List[CallSummaryResponse] = Field(
+        ..., description="Call summaries of this page"
+    )
+    next_cursor: Optional[int] = Field(
+        None, description="Cursor of the next page; null on the last page"
+    )
+
+
+class CallSummaryBulkError(BaseModel):
+    """
+    Validation problems of one item of a bulk request.
+    """
+
+    index: int = Field(
+        ..., description="Zero-based position of the item (line for NDJSON)"
+    )
+    errors: List[str] = Field(..., description="Why the item was rejected")
+
+
+class CallSummaryBulkResponse(BaseModel):
+    """
+    Outcome of a bulk call summary request.
+    Valid items are stored together; rejected ones are listed in `errors`.
+    """
+
+    received: int = Field(..., description="Number of items in the request")
+    inserted: int = Field(..., description="Number of summaries stored")
+    errors: List[CallSummaryBulkError] = Field(
+        default_factory=list, description="Rejected items"
+    )
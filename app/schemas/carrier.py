@@ -1,5 +1,10 @@
+from enum import Enum
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
+from app.core.config import constants
+
 
 class VerifyMCResponse(BaseModel):
     """
@@ -14,3 +19,46 @@ class VerifyMCResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class CarrierVerificationSource(str, Enum):
+    """
+    Where batch verifications are answered from.
+
+    - FMCSA: the FMCSA API, through the shared cached client.
+    - LOCAL: the local rule of `/carriers/authorization/{mc_number}`.
+    """
+
+    FMCSA = "fmcsa"
+    LOCAL = "local"
+
+
+class CarrierBatchRequest(BaseModel):
+    """
+    MC numbers to verify in one request.
+    """
+
+    mc_numbers: List[str] = Field(
+        ...,
+        max_length=constants.CARRIER_BATCH_MAX_SIZE,
+        description="Motor Carrier numbers, duplicates allowed",
+    )
+    source: CarrierVerificationSource = Field(
+        CarrierVerificationSource.FMCSA, description="Where to verify them"
+    )
+
+
+class CarrierVerification(BaseModel):
+    """
+    Result of one MC number of a batch, streamed as soon as it is known.
+    """
+
+    index: int = Field(..., description="Position of the MC number in the request")
+    mc_number: str = Field(..., description="Motor Carrier number")
+    source: Optional[str] = Field(
+        None, description="hit, miss or stale (FMCSA cache), or local"
+    )
+    result: Optional[dict] = Field(
+        None, description="FMCSA answer, or the local authorization status"
+    )
+    error: Optional[str] = Field(None, description="Why the MC could not be verified")
@@ -1,9 +1,41 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from enum import Enum
+from typing import List, Optional
 from uuid import UUID
 
 
+class MatchTier(str, Enum):
+    """
+    Filter tier a load was matched with during a search.
+    """
+
+    STRICT = "strict"
+    RELAXED = "relaxed"
+
+
+class TextMatchMode(str, Enum):
+    """
+    Strategy used to match the textual load filters (origin, destination,
+    equipment and commodity). Both modes are served by the pg_trgm indexes.
+
+    - SUBSTRING: case-insensitive `ILIKE '%term%'`.
+    - FUZZY: trigram word similarity, tolerant to misspelled terms.
+    """
+
+    SUBSTRING = "substring"
+    FUZZY = "fuzzy"
+
+
+class LoadImportFormat(str, Enum):
+    """
+    File formats accepted by the load catalog import.
+    """
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
 class LoadBase(BaseModel):
     """
     Shared structure for load entities.
@@ -50,6 +82,43 @@ class LoadCreate(BaseModel):
     dimensions: str
 
 
+class LoadImport(LoadCreate):
+    """
+    One row of a load catalog import (CSV or NDJSON).
+    Rows with a known `load_id` update that load; rows without one are
+    inserted with a generated ID.
+    """
+
+    load_id: Optional[UUID] = Field(
+        None, description="Load to create or update; generated when missing"
+    )
+
+
+class LoadImportError(BaseModel):
+    """
+    A rejected row of a load import.
+    """
+
+    line: int = Field(..., description="Line of the row in the source file")
+    errors: List[str] = Field(..., description="Why the row was rejected")
+
+
+class LoadImportReport(BaseModel):
+    """
+    Outcome of a load catalog import.
+    Only the first rejected rows are listed in `errors`.
+    """
+
+    received: int = Field(0, description="Rows read from the source")
+    upserted: int = Field(0, description="Loads inserted or updated")
+    rejected: int = Field(0, description="Rows that failed validation")
+    errors: List[LoadImportError] = Field(
+        default_factory=list, description="First rejected rows"
+    )
+    elapsed_sec: float = Field(0.0, description="Wall time of the import")
+    rows_per_sec: float = Field(0.0, description="Upserted loads per second")
+
+
 class LoadResponse(LoadBase):
     """
     Response schema for returning enriched load data via the API.
@@ -58,6 +127,9 @@ class LoadResponse(LoadBase):
     first_offer: Optional[float] = Field(None, description="AI-generated initial offer")
     max_rate: Optional[float] = Field(None, description="Maximum possible rate")
     rate_per_mile: Optional[float] = Field(None, description="Rate per mile")
+    match_tier: Optional[MatchTier] = Field(
+        None, description="Whether the load matched the strict or relaxed filters"
+    )
 
 
 class LoadFilter(BaseModel):
@@ -84,3 +156,39 @@ class LoadFilter(BaseModel):
     max_rate: Optional[float] = Field(None, description="Maximum rate")
     min_miles: Optional[float] = Field(None, description="Minimum trip distance")
     max_miles: Optional[float] = Field(None, description="Maximum trip distance")
+    match_mode: TextMatchMode = Field(
+        TextMatchMode.SUBSTRING, description="How textual filters are matched"
+    )
+
+
+class LoadSearchCursor(BaseModel):
+    """
+    Position of the last load of a search page, carried by the opaque
+    continuation token. The next page starts right after it in the
+    (tier, urgency, delivery, load_id) ranking.
+    """
+
+    match_tier: MatchTier = Field(..., description="Tier of the last load")
+    urgent: bool = Field(..., description="Whether the last load is urgent")
+    delivery_datetime: Optional[datetime] = Field(
+        None, description="Delivery time of the last load"
+    )
+    load_id: UUID = Field(..., description="ID of the last load")
+    limit: int = Field(..., description="Page size of the search")
+    filters_digest: str = Field(
+        ..., description="Digest of the filters the cursor was issued for"
+    )
+
+
+class LoadSearchPage(BaseModel):
+    """
+    Top-ranked loads of a search, enriched with pricing.
+    Pass `next_cursor` as `cursor` to fetch the following loads.
+    """
+
+    items: List[LoadResponse] = Field(
+        ..., description="Loads of this page, from most to least priority"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Continuation token of the next page; null on the last page"
+    )
@@ -1,3 +1,6 @@
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -63,3 +66,44 @@ class MetricsResponse(BaseModel):
     satisfaction_summary: SatisfactionStats = Field(
         ..., description="Overview of carrier satisfaction levels"
     )
+
+
+class MetricsBucket(str, Enum):
+    """
+    Granularity of the `/metrics` time series.
+    """
+
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+
+
+class MetricsPoint(BaseModel):
+    """
+    Metrics of the call summaries logged within one time bucket.
+    """
+
+    bucket_start: datetime = Field(..., description="Start of the bucket (UTC)")
+    metrics: MetricsResponse = Field(
+        ..., description="KPIs of the calls logged in this bucket"
+    )
+
+
+class MetricsSeriesResponse(BaseModel):
+    """
+    Time series of the operational metrics, one point per non-empty bucket.
+    """
+
+    bucket: MetricsBucket = Field(..., description="Granularity of the series")
+    from_: Optional[datetime] = Field(
+        None, alias="from", description="Inclusive start of the window (UTC)"
+    )
+    to: Optional[datetime] = Field(
+        None, description="Exclusive end of the window (UTC)"
+    )
+    points: List[MetricsPoint] = Field(
+        ..., description="Buckets in chronological order"
+    )
+
+    class Config:
+        populate_by_name = True
@@ -1,6 +1,9 @@
 from enum import Enum
+from typing import Annotated, Dict, List, Optional
 from pydantic import BaseModel, Field
 
+from app.core.config import constants
+
 
 class FinalStatus(str, Enum):
     """
@@ -43,3 +46,83 @@ class CounterOfferResponse(BaseModel):
     message: str = Field(
         ..., description="Human-friendly text to present to the carrier"
     )
+
+
+class NegotiationStrategy(BaseModel):
+    """
+    Alternative negotiation constants evaluated by a batch request.
+    """
+
+    max_negotiation_rounds: int = Field(
+        ..., ge=1, description="Rounds before the negotiation is closed"
+    )
+    rounding_step: float = Field(
+        ..., gt=0, description="Step in USD the suggested increments are rounded to"
+    )
+
+
+class CounterOfferBatchRequest(BaseModel):
+    """
+    Arrays of counteroffers evaluated together, element `i` of each array
+    describing negotiation `i` (same constraints as `CounterOfferRequest`,
+    except that rounds may go up to the largest strategy's limit).
+    """
+
+    carrier_offers: List[Annotated[float, Field(gt=0)]] = Field(
+        ...,
+        max_length=constants.NEGOTIATION_BATCH_MAX_SIZE,
+        description="Offers proposed by the carriers in USD",
+    )
+    last_offers: List[Annotated[float, Field(gt=0)]] = Field(
+        ...,
+        max_length=constants.NEGOTIATION_BATCH_MAX_SIZE,
+        description="Our previous proposals in USD",
+    )
+    negotiation_rounds: List[Annotated[int, Field(ge=1)]] = Field(
+        ...,
+        max_length=constants.NEGOTIATION_BATCH_MAX_SIZE,
+        description=(
+            "Current negotiation rounds, up to the most rounds allowed by a "
+            "strategy (3 for the live rules)"
+        ),
+    )
+    max_rates: List[Annotated[float, Field(gt=0)]] = Field(
+        ...,
+        max_length=constants.NEGOTIATION_BATCH_MAX_SIZE,
+        description="Maximum allowable rates in USD",
+    )
+    strategies: Dict[str, NegotiationStrategy] = Field(
+        default_factory=dict,
+        description="Alternative constants to evaluate, by name",
+    )
+
+
+class CounterOfferBatchResult(BaseModel):
+    """
+    Evaluation of a batch with one strategy, aligned with the request arrays.
+    Offers in a round beyond the strategy's limit are not evaluated: their
+    entries are null.
+    """
+
+    final_status: List[Optional[FinalStatus]] = Field(
+        ..., description="Outcome per offer, null when its round is out of range"
+    )
+    counter_suggestion: List[Optional[float]] = Field(
+        ..., description="Next counteroffer per offer, null when not countering"
+    )
+    rounds_left: List[Optional[int]] = Field(
+        ..., description="Rounds remaining per offer, null when out of range"
+    )
+    status_counts: Dict[str, int] = Field(
+        ...,
+        description="Number of offers per outcome, and `out_of_range` for the "
+        "offers in rounds beyond the strategy's limit",
+    )
+
+
+class CounterOfferBatchResponse(BaseModel):
+    """
+    Batch evaluation per strategy: `current` uses the live constants.
+    """
+
+    results: Dict[str, CounterOfferBatchResult]
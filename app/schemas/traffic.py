@@ -0,0 +1,33 @@
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+class RecordedRequest(BaseModel):
+    """
+    One API request of a traffic file.
+
+    Traffic files are NDJSON, one request per line in the order they were
+    sent (the `requests.jsonl` format). They are written by the traffic
+    generator and recorder in `benchmarks.traffic` and by the request
+    capture of the API (`app.core.request_capture`), and replayed by
+    `benchmarks.traffic`, which starts from the earliest offset.
+    """
+
+    offset: float = Field(
+        ...,
+        ge=0,
+        description="Seconds since the start of the traffic (Unix time in captures)",
+    )
+    method: str = Field(..., description="HTTP method")
+    path: str = Field(..., description="Path including the API prefix")
+    route: Optional[str] = Field(
+        None,
+        description="Route template matched, e.g. `/api/v1/carriers/fmcsa/{mc_number}`",
+    )
+    query: str = Field("", description="Raw query string, without `?`")
+    body: Optional[Any] = Field(None, description="JSON body, if any")
+    status: Optional[int] = Field(None, description="Status code answered")
+    latency_ms: Optional[float] = Field(
+        None, description="Time to the full response, in milliseconds"
+    )
@@ -73,3 +73,23 @@ def normalize_city(raw: Optional[str]) -> Optional[str]:
         return None
     city = raw.split(",", 1)[0].strip().lower()
     return city
+
+
+def normalize_location(raw: Optional[str]) -> Optional[str]:
+    """
+    Normalizes a stored "city, state" location the way `normalize_city`
+    cleans search terms, but keeps the state.
+
+    Handles formats like "  Chicago ,IL " → "chicago, il".
+    Returns None for empty or invalid values (e.g. "null", "undefined").
+
+    Args:
+        raw (Optional[str]): The raw location string.
+
+    Returns:
+        Optional[str]: The cleaned, lowercase location or None if invalid.
+    """
+    if not raw or raw.strip().lower() in {"", "none", "null", "undefined"}:
+        return None
+    parts = [" ".join(part.split()) for part in raw.lower().split(",")]
+    return ", ".join(part for part in parts if part) or None
@@ -1,6 +1,7 @@
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import List, Optional
 import dateutil.parser
+from pydantic import ValidationError
 
 
 def safe_parse_datetime(value: Optional[str]) -> Optional[datetime]:
@@ -24,6 +25,23 @@ def safe_parse_datetime(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
+def to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Converts a timezone-aware datetime to naive UTC, as stored in the database.
+
+    Naive datetimes are assumed to already be in UTC and returned unchanged.
+
+    Args:
+        value (Optional[datetime]): A datetime, aware or naive.
+
+    Returns:
+        Optional[datetime]: The naive UTC datetime or None.
+    """
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 def safe_parse_float(value: Optional[str]) -> Optional[float]:
     """
     Safely parses a string into a float.
@@ -55,3 +73,19 @@ def safe_parse_str(value: Optional[str]) -> Optional[str]:
         Optional[str]: A non-empty, stripped string or None.
     """
     return value.strip() if value and value.strip() else None
+
+
+def format_validation_errors(error: ValidationError) -> List[str]:
+    """
+    Flattens a pydantic validation error into "field: message" strings.
+
+    Args:
+        error (ValidationError): The error raised while validating one item.
+
+    Returns:
+        List[str]: One message per invalid field ("item" for the whole item).
+    """
+    return [
+        f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}"
+        for detail in error.errors()
+    ]
@@ -0,0 +1,127 @@
+"""
+Measure requests per second per worker under concurrent voice-call traffic.
+
+Keeps `--concurrency` requests in flight against a running API (one
+uvicorn worker, e.g. `make run`) for `--duration` seconds and reports the
+throughput and latency percentiles of every endpoint in the call flow.
+
+    python -m benchmarks.concurrency --base-url http://127.0.0.1:8000 --concurrency 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+ENDPOINTS: Dict[str, Tuple[str, str, Optional[dict]]] = {
+    "search_loads": ("GET", "/loads?origin=chicago&equipment_type=dry%20van", None),
+    "counteroffer": (
+        "POST",
+        "/counteroffer",
+        {
+            "carrier_offer": 1650,
+            "last_offer": 1500,
+            "negotiation_round": 1,
+            "max_rate": 1800,
+        },
+    ),
+    "metrics": ("GET", "/metrics", None),
+}
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def _caller(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    body: Optional[dict],
+    deadline: float,
+    latencies: List[float],
+    errors: List[int],
+) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            if response.status_code >= 500:
+                errors.append(response.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def _run_endpoint(
+    base_url: str, api_key: str, name: str, concurrency: int, duration: float
+) -> None:
+    method, path, body = ENDPOINTS[name]
+    latencies: List[float] = []
+    errors: List[int] = []
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url.rstrip("/") + settings.API_V1_STR,
+        headers={settings.AUTH_HEADER_KEY: api_key},
+        limits=limits,
+        timeout=60,
+    ) as client:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                _caller(client, method, path, body, deadline, latencies, errors)
+                for _ in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - started
+
+    print(
+        f"{name:<14} | {len(latencies) / elapsed:>8.1f} | "
+        f"{statistics.median(latencies):>7.1f}ms | "
+        f"{_percentile(latencies, 95):>7.1f}ms | "
+        f"{_percentile(latencies, 99):>7.1f}ms | {len(errors):>6}"
+    )
+
+
+async def run(
+    base_url: str, api_key: str, endpoints: List[str], concurrency: int, duration: float
+) -> None:
+    print(f"{concurrency} concurrent callers, {duration:.0f}s per endpoint")
+    print(
+        f"{'endpoint':<14} | {'req/s':>8} | {'p50':>9} | {'p95':>9} | "
+        f"{'p99':>9} | {'errors':>6}"
+    )
+    for name in endpoints:
+        await _run_endpoint(base_url, api_key, name, concurrency, duration)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--api-key", default=settings.AUTH_API_KEY)
+    parser.add_argument(
+        "--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS)
+    )
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--duration", type=float, default=30.0)
+    args = parser.parse_args()
+    asyncio.run(
+        run(
+            args.base_url,
+            args.api_key,
+            args.endpoints,
+            args.concurrency,
+            args.duration,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
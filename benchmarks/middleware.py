@@ -0,0 +1,197 @@
+"""
+Measure the overhead of the request logging and runtime metrics middlewares.
+
+A minimal FastAPI app (one JSON route) is called in-process, without a
+server or socket, with no middleware, with the previous
+`BaseHTTPMiddleware`-based logger and with `APILogRequestMiddleware`
+(logging every request, sampling 1% of them, and with `INFO` disabled),
+and with `RuntimeMetricsMiddleware` alone.
+Log lines are formatted and written to os.devnull, as a real handler would.
+
+For each variant it reports the cost per request in a closed loop and the
+latency percentiles of an open loop sending `--rate` requests per second.
+
+    python -m benchmarks.middleware --rate 5000 --duration 5
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from typing import Callable, Dict, List
+
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middlewares import api_log_request
+from app.middlewares.api_log_request import APILogRequestMiddleware
+from app.middlewares.runtime_metrics import RuntimeMetricsMiddleware
+from benchmarks.concurrency import _percentile
+
+PATH = "/api/v1/loads"
+QUERY = b"origin=chicago&equipment_type=dry%20van"
+
+
+class BaseHTTPLogMiddleware(BaseHTTPMiddleware):
+    """The request logging as it was before `APILogRequestMiddleware`."""
+
+    async def dispatch(self, request: Request, call_next):
+        forwarded = request.headers.get("X-Forwarded-For")
+        ip = forwarded.split(",")[0].strip() if forwarded else request.client.host
+        api_log_request.logger.info(
+            f"[Request] {request.method} {request.url.path} | "
+            f"Query: {dict(request.query_params)} | IP: {ip} | "
+            f"User-Agent: {request.headers.get('User-Agent', '')} | "
+            f"Accept: {request.headers.get('Accept', '')} | "
+            f"Content-Type: {request.headers.get('Content-Type', '')}"
+        )
+        response = await call_next(request)
+        api_log_request.logger.info(
+            f"[Response] {request.method} {request.url.path} | "
+            f"Status: {response.status_code} | "
+            f"Content-Type: {response.headers.get('Content-Type', '')}"
+        )
+        return response
+
+
+def _app(middleware=None, **options) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware, **options)
+
+    @app.get(PATH)
+    async def search_loads():
+        return {"load_id": "6b0d1e0c", "loadboard_rate": 1850.0}
+
+    return app
+
+
+def _scope() -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "root_path": "",
+        "query_string": QUERY,
+        "headers": [
+            (b"host", b"localhost"),
+            (b"user-agent", b"voice-agent/1.0"),
+            (b"accept", b"application/json"),
+            (b"x-api-key", b"secret"),
+        ],
+        "client": ("10.0.0.7", 50000),
+        "server": ("localhost", 8000),
+    }
+
+
+async def _request(app: FastAPI) -> None:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(_scope(), receive, send)
+
+
+async def _closed_loop(app: FastAPI, requests: int) -> float:
+    started = time.perf_counter()
+    for _ in range(requests):
+        await _request(app)
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+async def _open_loop(app: FastAPI, rate: int, duration: float) -> Dict[str, float]:
+    """Start requests on a fixed schedule; latency counts from the scheduled time."""
+    latencies: List[float] = []
+    tasks = []
+    total = int(rate * duration)
+
+    async def timed(scheduled: float) -> None:
+        await _request(app)
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+
+    started = time.perf_counter()
+    sent = 0
+    while sent < total:
+        due = min(total, int((time.perf_counter() - started) * rate) + 1)
+        while sent < due:
+            tasks.append(asyncio.create_task(timed(started + sent / rate)))
+            sent += 1
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    return {
+        "throughput": total / elapsed,
+        "p50": _percentile(latencies, 50),
+        "p99": _percentile(latencies, 99),
+    }
+
+
+def _variants() -> Dict[str, Callable[[], FastAPI]]:
+    return {
+        "no middleware": lambda: _app(),
+        "BaseHTTPMiddleware": lambda: _app(BaseHTTPLogMiddleware),
+        "ASGI, every request": lambda: _app(APILogRequestMiddleware, sample_rates={}),
+        "ASGI, 1% sampled": lambda: _app(
+            APILogRequestMiddleware, sample_rates={PATH: 0.01}
+        ),
+        "ASGI, INFO disabled": lambda: _app(APILogRequestMiddleware, sample_rates={}),
+        "runtime metrics": lambda: _app(RuntimeMetricsMiddleware),
+    }
+
+
+async def run(rate: int, duration: float, requests: int) -> None:
+    logger = api_log_request.logger
+    devnull = open(os.devnull, "w")
+    handler = logging.StreamHandler(devnull)
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s")
+    )
+    logger.addHandler(handler)
+    logger.propagate = False
+
+    print(
+        f"{'variant':<22} | {'closed loop':>12} | {'overhead':>9} | "
+        f"{'at ' + format(rate, ',') + ' req/s':>16} | {'p50':>8} | {'p99':>8}"
+    )
+    baseline = None
+    try:
+        for name, build in _variants().items():
+            logger.setLevel(
+                logging.WARNING if name.endswith("INFO disabled") else logging.INFO
+            )
+            app = build()
+            await _closed_loop(app, 1000)  # Warm-up
+            per_request = await _closed_loop(app, requests)
+            baseline = per_request if baseline is None else baseline
+            result = await _open_loop(app, rate, duration)
+            print(
+                f"{name:<22} | {per_request:>10.1f}us | "
+                f"{per_request - baseline:>+7.1f}us | "
+                f"{result['throughput']:>10,.0f} req/s | "
+                f"{result['p50']:>7.2f}ms | {result['p99']:>7.2f}ms"
+            )
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+        logger.setLevel(logging.INFO)
+        devnull.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rate", type=int, default=5000)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--requests", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.rate, args.duration, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark the batch negotiation evaluation against the scalar function.
+
+Negotiations over the synthetic board (pricing of
+`benchmarks.synthetic.populate_loads`) are evaluated with
+`evaluate_counter_offer` in a loop and with `evaluate_counter_offers`.
+The results are checked to be identical before the timings are printed,
+then a few alternative strategies are compared on the same offers.
+No database is needed.
+
+    python -m benchmarks.negotiation --size 1000000
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from app.business.load import calculate_load_offers
+from app.business.negotiation import (
+    NegotiationRules,
+    evaluate_counter_offer,
+    evaluate_counter_offers,
+)
+from app.schemas.negotiations import CounterOfferRequest
+from benchmarks.pricing import synthetic_board
+
+STRATEGIES = {
+    "current": NegotiationRules.from_constants(),
+    "two rounds": NegotiationRules(2, 10),
+    "rounding 50": NegotiationRules(3, 50),
+    "five rounds": NegotiationRules(5, 10),
+}
+
+
+def synthetic_negotiations(size: int, seed: int = 0) -> Dict[str, List]:
+    """Counteroffers on the loads of the synthetic board, from our first offer."""
+    offers = calculate_load_offers(**synthetic_board(size))
+    rng = random.Random(seed)
+    negotiations: Dict[str, List] = {
+        "carrier_offers": [],
+        "last_offers": [],
+        "negotiation_rounds": [],
+        "max_rates": offers["max_rate"].tolist(),
+    }
+    for first_offer in offers["first_offer"].tolist():
+        negotiations["carrier_offers"].append(
+            round(first_offer * rng.uniform(0.95, 1.35))
+        )
+        negotiations["last_offers"].append(first_offer)
+        negotiations["negotiation_rounds"].append(rng.randint(1, 3))
+    return negotiations
+
+
+def _timed(label: str, size: int, run) -> object:
+    started = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<29} | {elapsed * 1000:>9.1f}ms | {size / elapsed:>13,.0f} offers/s")
+    return result
+
+
+def run(size: int) -> None:
+    negotiations = synthetic_negotiations(size)
+    arrays = {name: np.array(values) for name, values in negotiations.items()}
+
+    print(
+        f"{'evaluating ' + format(size, ',') + ' offers':<29} | {'time':>11} | "
+        f"{'throughput':>21}"
+    )
+    scalar = _timed(
+        "scalar evaluate_counter_offer",
+        size,
+        lambda: [
+            evaluate_counter_offer(
+                CounterOfferRequest(
+                    carrier_offer=negotiations["carrier_offers"][i],
+                    last_offer=negotiations["last_offers"][i],
+                    negotiation_round=negotiations["negotiation_rounds"][i],
+                    max_rate=negotiations["max_rates"][i],
+                )
+            )
+            for i in range(size)
+        ],
+    )
+    batch = _timed(
+        "batch, from lists", size, lambda: evaluate_counter_offers(**negotiations)
+    )
+    _timed("batch, from arrays", size, lambda: evaluate_counter_offers(**arrays))
+
+    assert batch["final_status"].tolist() == [r.final_status.value for r in scalar]
+    assert batch["rounds_left"].tolist() == [r.rounds_left for r in scalar]
+    # None becomes NaN, like the batch suggestions
+    expected = np.array([r.counter_suggestion for r in scalar], dtype=np.float64)
+    assert np.array_equal(batch["counter_suggestion"], expected, equal_nan=True)
+    print("batch results identical to the scalar function")
+
+    print()
+    print(
+        f"{'strategy':<12} | {'accepted':>9} | {'counter':>9} | {'limit':>9} | "
+        f"{'mean counter':>12}"
+    )
+    for name, rules in STRATEGIES.items():
+        evaluated = evaluate_counter_offers(**arrays, rules=rules)
+        statuses = evaluated["final_status"]
+        print(
+            f"{name:<12} | {np.mean(statuses == 'accepted'):>9.1%} | "
+            f"{np.mean(statuses == 'counter'):>9.1%} | "
+            f"{np.mean(statuses == 'limit_reached'):>9.1%} | "
+            f"{np.nanmean(evaluated['counter_suggestion']):>12,.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.size)
+
+
+if __name__ == "__main__":
+    main()
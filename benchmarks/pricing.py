@@ -0,0 +1,113 @@
+"""
+Benchmark the batch load pricing against the per-load scalar function.
+
+A deterministic board of synthetic loads (the rows of
+`benchmarks.synthetic.populate_loads`) is priced with `_calculate_load_offer`
+in a loop and with `calculate_load_offers`, both from strings and from
+precomputed flags.
+The results are checked to be identical before the timings are printed.
+No database is needed.
+
+    python -m benchmarks.pricing --size 1000000
+"""
+
+import argparse
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from app.business.load import _calculate_load_offer, calculate_load_offers
+from benchmarks.synthetic import (
+    COMMODITY_WEIGHTS,
+    EQUIPMENT_WEIGHTS,
+    NOTE_WEIGHTS,
+    mix,
+    load_loadboard_rate,
+    load_miles,
+    pick,
+)
+
+
+def synthetic_board(size: int) -> Dict[str, List]:
+    """Pricing inputs of `size` loads, mirroring `populate_loads`."""
+    equipment, notes, commodities = (
+        mix(EQUIPMENT_WEIGHTS),
+        mix(NOTE_WEIGHTS),
+        mix(COMMODITY_WEIGHTS),
+    )
+    rows = range(1, size + 1)
+    return {
+        "miles": [load_miles(i) for i in rows],
+        "equipment_types": [pick(equipment, "load", i, 2) for i in rows],
+        "notes": [pick(notes, "load", i, 3) for i in rows],
+        "commodity_types": [pick(commodities, "load", i, 4) for i in rows],
+        "loadboard_rates": [load_loadboard_rate(i) for i in rows],
+    }
+
+
+def _timed(label: str, size: int, run) -> object:
+    started = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} | {elapsed * 1000:>9.1f}ms | {size / elapsed:>13,.0f} loads/s")
+    return result
+
+
+def run(size: int) -> None:
+    board = synthetic_board(size)
+    flags = {
+        "equipment_types": np.array(
+            [value in ("reefer", "flatbed") for value in board["equipment_types"]]
+        ),
+        "notes": np.array(["urgent" in value for value in board["notes"]]),
+        "commodity_types": np.array(
+            ["medical" in value for value in board["commodity_types"]]
+        ),
+    }
+    loadboard_rates = np.array(board["loadboard_rates"])
+
+    print(
+        f"{'pricing ' + format(size, ',') + ' loads':<28} | {'time':>11} | {'throughput':>20}"
+    )
+    scalar = _timed(
+        "scalar _calculate_load_offer",
+        size,
+        lambda: [
+            _calculate_load_offer(
+                miles=board["miles"][i],
+                equipment_type=board["equipment_types"][i],
+                notes=board["notes"][i],
+                commodity_type=board["commodity_types"][i],
+                loadboard_rate=board["loadboard_rates"][i],
+            )
+            for i in range(size)
+        ],
+    )
+    from_strings = _timed(
+        "batch, from strings", size, lambda: calculate_load_offers(**board)
+    )
+    from_flags = _timed(
+        "batch, from flags",
+        size,
+        lambda: calculate_load_offers(
+            board["miles"], loadboard_rates=loadboard_rates, **flags
+        ),
+    )
+
+    for name in ("first_offer", "max_rate", "rate_per_mile"):
+        expected = np.array([offer[name] for offer in scalar], dtype=np.float64)
+        assert np.array_equal(from_strings[name], expected), name
+        assert np.array_equal(from_flags[name], expected), name
+    print("batch results identical to the scalar function")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Deterministic synthetic data for benchmarks.
+
+Rows are generated server-side with `generate_series` so millions of loads
+and call summaries can be created in seconds. The same `count` always
+yields the same rows.
+
+Categorical values are drawn from weighted mixes (freight hubs, a dry van
+heavy equipment mix, about 12% urgent loads, typical call outcomes) using
+slices of an md5 of the row number, so each column is drawn independently
+of the others and `pick` reproduces any draw in Python.
+"""
+
+import hashlib
+import uuid
+from typing import Dict, List, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def mix(weights: Dict[str, int]) -> List[str]:
+    """Each value repeated by its weight, so a uniform draw follows the weights."""
+    return [value for value, weight in weights.items() for _ in range(weight)]
+
+
+# Freight volume per city, relative: hubs first
+CITY_WEIGHTS = {
+    "chicago, il": 9,
+    "dallas, tx": 8,
+    "atlanta, ga": 7,
+    "los angeles, ca": 7,
+    "houston, tx": 6,
+    "memphis, tn": 5,
+    "indianapolis, in": 5,
+    "columbus, oh": 4,
+    "kansas city, mo": 4,
+    "newark, nj": 4,
+    "phoenix, az": 3,
+    "charlotte, nc": 3,
+    "nashville, tn": 3,
+    "st. louis, mo": 3,
+    "denver, co": 3,
+    "jacksonville, fl": 3,
+    "philadelphia, pa": 3,
+    "detroit, mi": 2,
+    "louisville, ky": 2,
+    "el paso, tx": 2,
+    "seattle, wa": 2,
+    "miami, fl": 2,
+    "orlando, fl": 2,
+    "minneapolis, mn": 2,
+    "sacramento, ca": 2,
+    "salt lake city, ut": 2,
+    "tampa, fl": 1,
+    "cleveland, oh": 1,
+    "pittsburgh, pa": 1,
+    "baltimore, md": 1,
+    "richmond, va": 1,
+    "birmingham, al": 1,
+    "new orleans, la": 1,
+    "oklahoma city, ok": 1,
+    "omaha, ne": 1,
+    "wichita, ks": 1,
+    "albuquerque, nm": 1,
+    "las vegas, nv": 1,
+    "portland, or": 1,
+    "boise, id": 1,
+}
+CITIES = list(CITY_WEIGHTS)
+
+EQUIPMENT_WEIGHTS = {
+    "dry van": 55,
+    "reefer": 22,
+    "flatbed": 13,
+    "step deck": 6,
+    "power only": 4,
+}
+EQUIPMENT_TYPES = list(EQUIPMENT_WEIGHTS)
+
+COMMODITY_WEIGHTS = {
+    "retail goods": 18,
+    "beverages": 10,
+    "paper": 9,
+    "furniture": 8,
+    "auto parts": 8,
+    "construction supplies": 8,
+    "machinery": 7,
+    "electronics": 7,
+    "dairy": 7,
+    "meat": 6,
+    "frozen vegetables": 6,
+    "medical supplies": 6,
+}
+COMMODITIES = list(COMMODITY_WEIGHTS)
+
+NOTE_WEIGHTS = {
+    "routine delivery": 20,
+    "normal cargo": 18,
+    "delivery flexible": 12,
+    "requires follow-up call": 10,
+    "multi-stop route": 8,
+    "cold chain required": 8,
+    "fragile materials": 7,
+    "oversized load": 5,
+    "urgent - store opening": 6,
+    "urgent delivery": 6,
+}
+NOTES = list(NOTE_WEIGHTS)
+
+OUTCOME_WEIGHTS = {
+    "accepted": 30,
+    "no_response": 25,
+    "rejected": 20,
+    "failed_negotiation": 15,
+    "interested_follow_up": 10,
+}
+SENTIMENT_WEIGHTS = {"positive": 45, "neutral": 35, "negative": 20}
+
+# Hex digits of the row's md5 per draw, so one md5 gives five draws
+_SLICE = 6
+
+
+def pick(values: Sequence[str], seed: str, i: int, slot: int) -> str:
+    """
+    Python mirror of the SQL draws: the value of row `i` for one column.
+
+    Args:
+        values (Sequence[str]): Weighted mix the value is drawn from.
+        seed (str): Hash prefix of the table ("load" or "call").
+        i (int): Row number, from 1.
+        slot (int): Column slot of the draw (0-4).
+
+    Returns:
+        str: The drawn value.
+    """
+    digest = hashlib.md5(f"{seed}-{i}".encode()).hexdigest()
+    start = slot * _SLICE
+    return values[int(digest[start : start + _SLICE], 16) % len(values)]
+
+
+def _draw_sql(param: str, slot: int) -> str:
+    """SQL for `pick` of array parameter `param`; expects a `digest` column."""
+    return (
+        f"(CAST(:{param} AS varchar[]))[1 + "
+        f"('x' || substr(digest, {1 + slot * _SLICE}, {_SLICE}))::bit(24)::int "
+        f"% cardinality(CAST(:{param} AS varchar[]))]"
+    )
+
+
+def load_miles(i: int) -> float:
+    """Miles of synthetic load `i`."""
+    return 50.0 + (i * 37) % 2950
+
+
+def load_loadboard_rate(i: int) -> float:
+    """Loadboard rate of synthetic load `i`."""
+    return float(round(load_miles(i) * (2.2 + (i % 13) * 0.1)))
+
+
+def load_id(i: int) -> uuid.UUID:
+    """load_id of synthetic load `i`."""
+    return uuid.UUID(hashlib.md5(f"load-{i}".encode()).hexdigest())
+
+
+def load_id_sql(expression: str) -> str:
+    """SQL for the load_id of the synthetic load numbered by `expression`."""
+    return f"md5('load-' || ({expression}))::uuid"
+
+
+_INSERT_LOADS = f"""
+INSERT INTO loads (
+    load_id, origin, destination, pickup_datetime, delivery_datetime,
+    equipment_type, loadboard_rate, notes, weight, commodity_type,
+    num_of_pieces, miles, dimensions
+)
+SELECT
+    {load_id_sql("i")},
+    {_draw_sql("cities", 0)},
+    {_draw_sql("cities", 1)},
+    pickup,
+    pickup + make_interval(hours => 4 + miles::int / 50),
+    {_draw_sql("equipment", 2)},
+    round((miles * (2.2 + (i % 13) * 0.1))::numeric, 0),
+    {_draw_sql("notes", 3)},
+    5000 + (i * 113) % 40000,
+    {_draw_sql("commodities", 4)},
+    10 + i % 140,
+    miles,
+    '48x40x60'
+FROM (
+    SELECT
+        i,
+        md5('load-' || i) AS digest,
+        (50 + (i * 37) % 2950)::float AS miles,
+        timestamp '2025-08-01' + ((i * 31) % 2160) * interval '1 hour' AS pickup
+    FROM generate_series(1, :count) AS i
+) AS series
+"""
+
+
+def populate_loads(conn: Connection, count: int) -> None:
+    """
+    Insert `count` deterministic synthetic loads into the `loads` table
+    visible from `conn` (honours `schema_translate_map` / search_path).
+
+    Load `i` (from 1) has the id `md5('load-' || i)`.
+    """
+    conn.execute(
+        text(_INSERT_LOADS),
+        {
+            "count": count,
+            "cities": mix(CITY_WEIGHTS),
+            "equipment": mix(EQUIPMENT_WEIGHTS),
+            "notes": mix(NOTE_WEIGHTS),
+            "commodities": mix(COMMODITY_WEIGHTS),
+        },
+    )
+
+
+_INSERT_CALL_SUMMARIES = f"""
+INSERT INTO call_summaries (
+    load_id, agreed_price, comments, special_conditions, outcome, sentiment,
+    call_duration_sec, attempts, counter_offers, satisfaction, created_at
+)
+SELECT
+    {load_id_sql("1 + ('x' || substr(digest, 1, 8))::bit(32)::bigint % :loads")},
+    CASE WHEN outcome = 'accepted'
+        THEN 600 + ('x' || substr(digest, 9, 4))::bit(16)::int % 3400 END,
+    NULL,
+    NULL,
+    outcome,
+    {_draw_sql("sentiments", 3)},
+    CASE WHEN outcome = 'no_response'
+        THEN 10 + i % 30 ELSE 60 + (i * 7) % 840 END,
+    1 + i % 3,
+    CASE WHEN outcome IN ('accepted', 'failed_negotiation') THEN i % 4 ELSE 0 END,
+    CASE (i * 7) % 10 WHEN 0 THEN NULL WHEN 1 THEN NULL WHEN 2 THEN NULL
+        WHEN 3 THEN false WHEN 4 THEN false ELSE true END,
+    timestamp '2025-05-01' + (i::float / :count) * interval '90 days'
+FROM (
+    SELECT i, digest, {_draw_sql("outcomes", 2)} AS outcome
+    FROM (
+        SELECT i, md5('call-' || i) AS digest
+        FROM generate_series(1, :count) AS i
+    ) AS hashed
+) AS series
+"""
+
+
+def populate_call_summaries(conn: Connection, count: int, loads: int) -> None:
+    """
+    Insert `count` deterministic synthetic call summaries.
+
+    Each references one of the first `loads` synthetic loads; they are
+    spread evenly over the 90 days from 2025-05-01. The metrics rollups are
+    not updated: rebuild them afterwards (`app.cli.metrics_rollup`).
+    """
+    conn.execute(
+        text(_INSERT_CALL_SUMMARIES),
+        {
+            "count": count,
+            "loads": loads,
+            "outcomes": mix(OUTCOME_WEIGHTS),
+            "sentiments": mix(SENTIMENT_WEIGHTS),
+        },
+    )
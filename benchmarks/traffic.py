@@ -0,0 +1,421 @@
+"""
+Load-test the API with captured or synthetic voice-agent traffic.
+
+Traffic files use the `requests.jsonl` format: one `RecordedRequest` per
+line (offset in seconds, method, path, query, JSON body and, once
+recorded, the status and latency observed). Production traffic is
+captured by the API itself with `REQUEST_CAPTURE_ENABLED`.
+
+    # Seed a dedicated database: 1M loads, 10M call summaries, rollups rebuilt
+    python -m benchmarks.traffic seed --loads 1000000 --summaries 10000000 --yes
+
+    # Five minutes of call flows (search, negotiation, summary) plus dashboard polling
+    python -m benchmarks.traffic generate captures/synthetic.jsonl --duration 300 --call-rate 20
+
+    # Replay at the recorded pace, or 5x faster, recording what was observed
+    python -m benchmarks.traffic replay captures/synthetic.jsonl --speed 5 --record captures/run.jsonl
+
+    # Replay the captures of every worker of a release, then compare releases
+    python -m benchmarks.traffic replay captures/requests-*.jsonl* --record captures/v1.jsonl
+    python -m benchmarks.traffic compare captures/v1.jsonl captures/v2.jsonl
+
+`replay` reports throughput, p50/p95/p99 and errors per endpoint. It
+sends each request at its offset (divided by `--speed`, counted from the
+earliest request of the files) whatever the previous answers took, with
+at most `--concurrency` in flight; `lag` tells how late requests were
+started, i.e. whether the player itself kept up. Replayed call summaries
+are inserted into the target database.
+
+`compare` puts the latency percentiles per endpoint of two recorded files
+side by side, e.g. replays of the same capture against two releases.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import httpx
+from sqlalchemy import create_engine, text
+
+from app.cli.metrics_rollup import rebuild
+from app.core.config import settings
+from app.schemas.traffic import RecordedRequest
+from benchmarks.concurrency import _percentile
+from benchmarks.synthetic import (
+    CITY_WEIGHTS,
+    EQUIPMENT_WEIGHTS,
+    OUTCOME_WEIGHTS,
+    SENTIMENT_WEIGHTS,
+    load_id,
+    load_loadboard_rate,
+    mix,
+    populate_call_summaries,
+    populate_loads,
+)
+
+# Dashboard polling of the KPIs, in seconds
+METRICS_INTERVAL = 5.0
+METRICS_SERIES_INTERVAL = 30.0
+
+_CITIES = mix(CITY_WEIGHTS)
+_EQUIPMENT = mix(EQUIPMENT_WEIGHTS)
+_OUTCOMES = mix(OUTCOME_WEIGHTS)
+_SENTIMENTS = mix(SENTIMENT_WEIGHTS)
+
+
+def seed(database_url: str, loads: int, summaries: int) -> None:
+    """Replace the loads and call summaries of a database with synthetic rows."""
+    engine = create_engine(database_url)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("TRUNCATE call_summaries, loads"))
+            started = time.perf_counter()
+            populate_loads(conn, loads)
+            conn.execute(text("ANALYZE loads"))
+            print(f"{loads:,} loads in {time.perf_counter() - started:.1f}s")
+            started = time.perf_counter()
+            populate_call_summaries(conn, summaries, loads)
+            conn.execute(text("ANALYZE call_summaries"))
+            print(
+                f"{summaries:,} call summaries in {time.perf_counter() - started:.1f}s"
+            )
+        started = time.perf_counter()
+        rebuild(engine)
+        print(f"metrics rollups rebuilt in {time.perf_counter() - started:.1f}s")
+    finally:
+        engine.dispose()
+
+
+def _request(
+    offset: float, method: str, path: str, query: Optional[dict] = None, body=None
+) -> RecordedRequest:
+    return RecordedRequest(
+        offset=round(offset, 3),
+        method=method,
+        path=settings.API_V1_STR + path,
+        query=urlencode(query or {}),
+        body=body,
+    )
+
+
+def _call_flow(rng: random.Random, start: float, loads: int) -> List[RecordedRequest]:
+    """One agent call: load search, 0-3 negotiation rounds, call summary."""
+    query = {
+        "origin": rng.choice(_CITIES).split(",")[0],
+        "equipment_type": rng.choice(_EQUIPMENT),
+    }
+    if rng.random() < 0.3:
+        query["destination"] = rng.choice(_CITIES).split(",")[0]
+    if rng.random() < 0.25:
+        query["limit"] = 5
+    requests = [_request(start, "GET", "/loads", query)]
+
+    i = rng.randint(1, loads)
+    max_rate = round(load_loadboard_rate(i) * 1.1)
+    last_offer = round(load_loadboard_rate(i) * 0.8)
+    offset = start
+    rounds = rng.choice([0, 1, 1, 2, 2, 3])
+    for negotiation_round in range(1, rounds + 1):
+        offset += rng.uniform(5, 20)
+        carrier_offer = round(last_offer * rng.uniform(1.02, 1.3))
+        requests.append(
+            _request(
+                offset,
+                "POST",
+                "/counteroffer",
+                body={
+                    "carrier_offer": carrier_offer,
+                    "last_offer": last_offer,
+                    "negotiation_round": negotiation_round,
+                    "max_rate": max_rate,
+                },
+            )
+        )
+        last_offer = round((last_offer + carrier_offer) / 2)
+
+    offset += rng.uniform(10, 60)
+    outcome = rng.choice(_OUTCOMES)
+    requests.append(
+        _request(
+            offset,
+            "POST",
+            "/call-summary",
+            body={
+                "load_id": str(load_id(i)),
+                "agreed_price": last_offer if outcome == "accepted" else None,
+                "outcome": outcome,
+                "sentiment": rng.choice(_SENTIMENTS),
+                "call_duration_sec": round(offset - start),
+                "attempts": 1,
+                "counter_offers": rounds,
+            },
+        )
+    )
+    return requests
+
+
+def generate(
+    duration: float, call_rate: float, loads: int, seed_value: int
+) -> List[RecordedRequest]:
+    """
+    Synthetic traffic: call flows starting as a Poisson process plus polling.
+
+    Args:
+        duration (float): Seconds during which calls start.
+        call_rate (float): Calls started per second, on average.
+        loads (int): Synthetic loads the call summaries may reference.
+        seed_value (int): Random seed; the same arguments give the same file.
+
+    Returns:
+        List[RecordedRequest]: Requests sorted by offset.
+    """
+    rng = random.Random(seed_value)
+    requests: List[RecordedRequest] = []
+    offset = rng.expovariate(call_rate)
+    while offset < duration:
+        requests.extend(_call_flow(rng, offset, loads))
+        offset += rng.expovariate(call_rate)
+
+    polled = 0.0
+    while polled < duration:
+        requests.append(_request(polled, "GET", "/metrics"))
+        if polled % METRICS_SERIES_INTERVAL == 0:
+            requests.append(_request(polled, "GET", "/metrics", {"bucket": "day"}))
+        polled += METRICS_INTERVAL
+    return sorted(requests, key=lambda request: request.offset)
+
+
+def read_traffic(*paths: str) -> List[RecordedRequest]:
+    """Requests of one or more traffic files, merged and sorted by offset."""
+    requests: List[RecordedRequest] = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            requests.extend(
+                RecordedRequest.model_validate_json(line)
+                for line in file
+                if line.strip()
+            )
+    return sorted(requests, key=lambda request: request.offset)
+
+
+def write_traffic(path: str, requests: Iterable[RecordedRequest]) -> None:
+    """Write requests to a traffic file, one JSON object per line."""
+    with open(path, "w", encoding="utf-8") as file:
+        for request in requests:
+            file.write(request.model_dump_json() + "\n")
+
+
+def endpoint(request: RecordedRequest) -> str:
+    """Label of a request in the reports: method and route (or path)."""
+    return f"{request.method} {request.route or request.path}"
+
+
+async def replay(
+    requests: List[RecordedRequest],
+    base_url: str,
+    api_key: str,
+    speed: float,
+    concurrency: int,
+) -> Tuple[List[RecordedRequest], List[float], float]:
+    """
+    Send the requests at their offsets, counted from the first request and
+    divided by `speed`.
+
+    Returns:
+        Tuple[List[RecordedRequest], List[float], float]: The requests with
+        the observed status (0 for transport errors) and latency, the start
+        lag of each request in milliseconds, and the elapsed seconds.
+    """
+    in_flight = asyncio.Semaphore(concurrency)
+    observed: List[RecordedRequest] = []
+    lags: List[float] = []
+
+    async def send(client: httpx.AsyncClient, request: RecordedRequest, due: float):
+        async with in_flight:
+            sent = time.perf_counter()
+            lags.append((sent - due) * 1000)
+            url = request.path + (f"?{request.query}" if request.query else "")
+            try:
+                response = await client.request(request.method, url, json=request.body)
+                await response.aread()
+                status = response.status_code
+            except httpx.HTTPError:
+                status = 0
+            observed.append(
+                request.model_copy(
+                    update={
+                        "offset": round(sent - started, 3),
+                        "status": status,
+                        "latency_ms": round((time.perf_counter() - sent) * 1000, 3),
+                    }
+                )
+            )
+
+    async with httpx.AsyncClient(
+        base_url=base_url.rstrip("/"),
+        headers={settings.AUTH_HEADER_KEY: api_key},
+        limits=httpx.Limits(max_connections=concurrency),
+        timeout=60,
+    ) as client:
+        tasks = []
+        first = requests[0].offset if requests else 0.0
+        started = time.perf_counter()
+        for request in requests:
+            due = started + (request.offset - first) / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(send(client, request, due)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    return sorted(observed, key=lambda request: request.offset), lags, elapsed
+
+
+def latency_summary(
+    requests: Iterable[RecordedRequest],
+) -> Dict[str, Tuple[int, float, float, float, int]]:
+    """
+    Requests, p50, p95 and p99 latency (ms) and errors per endpoint.
+
+    Requests without an observed latency are left out; `all` covers every
+    endpoint.
+    """
+    by_endpoint: Dict[str, List[RecordedRequest]] = defaultdict(list)
+    for request in requests:
+        if request.latency_ms is not None:
+            by_endpoint[endpoint(request)].append(request)
+    by_endpoint["all"] = [
+        request for group in by_endpoint.values() for request in group
+    ]
+
+    summary = {}
+    for name, group in by_endpoint.items():
+        if not group:
+            continue
+        latencies = [request.latency_ms for request in group]
+        summary[name] = (
+            len(group),
+            statistics.median(latencies),
+            _percentile(latencies, 95),
+            _percentile(latencies, 99),
+            sum(1 for request in group if not 0 < (request.status or 0) < 500),
+        )
+    return summary
+
+
+def report(observed: List[RecordedRequest], elapsed: float) -> None:
+    """Print throughput, latency percentiles and errors per endpoint."""
+    print(
+        f"{'endpoint':<28} | {'requests':>8} | {'req/s':>8} | {'p50':>9} | "
+        f"{'p95':>9} | {'p99':>9} | {'errors':>6}"
+    )
+    for name, (count, p50, p95, p99, errors) in latency_summary(observed).items():
+        print(
+            f"{name:<28} | {count:>8} | {count / elapsed:>8.1f} | "
+            f"{p50:>7.1f}ms | {p95:>7.1f}ms | {p99:>7.1f}ms | {errors:>6}"
+        )
+
+
+def compare(baseline: List[RecordedRequest], candidate: List[RecordedRequest]) -> None:
+    """Print the latency percentiles per endpoint of two recorded runs."""
+    before = latency_summary(baseline)
+    after = latency_summary(candidate)
+    print(
+        f"{'endpoint':<28} | {'requests':>15} | {'p50 (ms)':>24} | "
+        f"{'p95 (ms)':>24} | {'p99 (ms)':>24} | {'errors':>11}"
+    )
+    for name in [*before, *(name for name in after if name not in before)]:
+        if name not in before or name not in after:
+            print(
+                f"{name:<28} | only in {'baseline' if name in before else 'candidate'}"
+            )
+            continue
+        count, *percentiles, errors = before[name]
+        new_count, *new_percentiles, new_errors = after[name]
+        cells = [
+            f"{old:>7.1f} → {new:>7.1f} {(new - old) / old:>+6.0%}"
+            if old
+            else f"{old:>7.1f} → {new:>7.1f}       "
+            for old, new in zip(percentiles, new_percentiles)
+        ]
+        print(
+            f"{name:<28} | {count:>6} → {new_count:>6} | {' | '.join(cells)} | "
+            f"{errors:>4} → {new_errors:>4}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser(
+        "seed", help="Fill a database with synthetic rows"
+    )
+    seed_parser.add_argument("--database-url", default=settings.DATABASE_URL)
+    seed_parser.add_argument("--loads", type=int, default=1_000_000)
+    seed_parser.add_argument("--summaries", type=int, default=10_000_000)
+    seed_parser.add_argument(
+        "--yes", action="store_true", help="Confirm the tables may be truncated"
+    )
+
+    generate_parser = commands.add_parser("generate", help="Write synthetic traffic")
+    generate_parser.add_argument("output")
+    generate_parser.add_argument("--duration", type=float, default=300.0)
+    generate_parser.add_argument("--call-rate", type=float, default=20.0)
+    generate_parser.add_argument("--loads", type=int, default=1_000_000)
+    generate_parser.add_argument("--seed", type=int, default=0)
+
+    replay_parser = commands.add_parser("replay", help="Replay traffic files")
+    replay_parser.add_argument("inputs", nargs="+", metavar="input")
+    replay_parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    replay_parser.add_argument("--api-key", default=settings.AUTH_API_KEY)
+    replay_parser.add_argument("--speed", type=float, default=1.0)
+    replay_parser.add_argument("--concurrency", type=int, default=500)
+    replay_parser.add_argument("--record", help="Traffic file of what was observed")
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare the latencies of two recorded runs"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    args = parser.parse_args()
+
+    if args.command == "seed":
+        if not args.yes:
+            parser.error("seed truncates loads and call_summaries; pass --yes")
+        seed(args.database_url, args.loads, args.summaries)
+    elif args.command == "generate":
+        requests = generate(args.duration, args.call_rate, args.loads, args.seed)
+        write_traffic(args.output, requests)
+        print(f"{len(requests):,} requests written to {args.output}")
+    elif args.command == "compare":
+        compare(read_traffic(args.baseline), read_traffic(args.candidate))
+    else:
+        if args.record in args.inputs:
+            parser.error("--record must not overwrite a replayed file")
+        observed, lags, elapsed = asyncio.run(
+            replay(
+                read_traffic(*args.inputs),
+                args.base_url,
+                args.api_key,
+                args.speed,
+                args.concurrency,
+            )
+        )
+        report(observed, elapsed)
+        print(
+            f"start lag p50 {statistics.median(lags):.1f}ms, "
+            f"p99 {_percentile(lags, 99):.1f}ms"
+        )
+        if args.record:
+            write_traffic(args.record, observed)
+
+
+if __name__ == "__main__":
+    main()
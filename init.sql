@@ -1,6 +1,9 @@
 -- Enable the uuid-ossp extension if not already enabled (required for uuid generation)
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Enable trigram matching (required for the text search indexes on loads)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Create table for loads with UUID as primary key
 CREATE TABLE IF NOT EXISTS loads (
     load_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -15,7 +18,30 @@ CREATE TABLE IF NOT EXISTS loads (
     commodity_type VARCHAR,
     num_of_pieces INT,
     miles FLOAT,
-    dimensions VARCHAR
+    dimensions VARCHAR,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Trigram indexes backing the ILIKE '%term%' and fuzzy load filters
+CREATE INDEX IF NOT EXISTS ix_loads_origin_trgm ON loads USING gin (origin gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_loads_destination_trgm ON loads USING gin (destination gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_loads_equipment_type_trgm ON loads USING gin (equipment_type gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_loads_commodity_type_trgm ON loads USING gin (commodity_type gin_trgm_ops);
+
+-- B-tree indexes backing the pickup window, distance, rate and weight filters
+CREATE INDEX IF NOT EXISTS ix_loads_pickup_datetime_miles ON loads (pickup_datetime, miles);
+CREATE INDEX IF NOT EXISTS ix_loads_loadboard_rate_weight ON loads (loadboard_rate, weight);
+CREATE INDEX IF NOT EXISTS ix_loads_miles ON loads (miles);
+CREATE INDEX IF NOT EXISTS ix_loads_weight ON loads (weight);
+
+-- Rows changed since the last refresh of the in-memory load index
+CREATE INDEX IF NOT EXISTS ix_loads_updated_at ON loads (updated_at);
+
+-- Priority order of load searches: urgent first, then earliest delivery
+CREATE INDEX IF NOT EXISTS ix_loads_priority ON loads (
+    (CASE WHEN (lower(coalesce(notes, '')) LIKE '%urgent%') THEN 0 ELSE 1 END),
+    delivery_datetime,
+    load_id
 );
 
 -- Create table for call summaries (linked by UUID)
@@ -31,7 +57,64 @@ CREATE TABLE IF NOT EXISTS call_summaries (
     attempts INTEGER DEFAULT 1,
     counter_offers INTEGER DEFAULT 0,
     satisfaction BOOLEAN,
-    created_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Time-window scans of call summaries (metrics rebuilds, listings)
+CREATE INDEX IF NOT EXISTS ix_call_summaries_created_at ON call_summaries (created_at);
+
+-- Keyset pagination of the call summaries of one load
+CREATE INDEX IF NOT EXISTS ix_call_summaries_load_id_id ON call_summaries (load_id, id);
+
+-- Running totals behind /metrics, incremented on every call summary insert
+-- (rebuild with `python -m app.cli.metrics_rollup rebuild`)
+CREATE TABLE IF NOT EXISTS call_metrics_rollup (
+    shard INTEGER PRIMARY KEY,
+    total_calls BIGINT NOT NULL DEFAULT 0,
+    accepted BIGINT NOT NULL DEFAULT 0,
+    rejected BIGINT NOT NULL DEFAULT 0,
+    failed_negotiation BIGINT NOT NULL DEFAULT 0,
+    no_response BIGINT NOT NULL DEFAULT 0,
+    interested_follow_up BIGINT NOT NULL DEFAULT 0,
+    sentiment_positive BIGINT NOT NULL DEFAULT 0,
+    sentiment_neutral BIGINT NOT NULL DEFAULT 0,
+    sentiment_negative BIGINT NOT NULL DEFAULT 0,
+    satisfied BIGINT NOT NULL DEFAULT 0,
+    unsatisfied BIGINT NOT NULL DEFAULT 0,
+    agreed_price_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    agreed_price_count BIGINT NOT NULL DEFAULT 0,
+    call_duration_sec_sum BIGINT NOT NULL DEFAULT 0,
+    call_duration_sec_count BIGINT NOT NULL DEFAULT 0,
+    attempts_sum BIGINT NOT NULL DEFAULT 0,
+    attempts_count BIGINT NOT NULL DEFAULT 0,
+    counter_offers_sum BIGINT NOT NULL DEFAULT 0,
+    counter_offers_count BIGINT NOT NULL DEFAULT 0
+);
+
+-- Same counters per hour of created_at, backing the windowed /metrics queries
+CREATE TABLE IF NOT EXISTS call_metrics_hourly (
+    bucket_start TIMESTAMP NOT NULL,
+    shard INTEGER NOT NULL,
+    total_calls BIGINT NOT NULL DEFAULT 0,
+    accepted BIGINT NOT NULL DEFAULT 0,
+    rejected BIGINT NOT NULL DEFAULT 0,
+    failed_negotiation BIGINT NOT NULL DEFAULT 0,
+    no_response BIGINT NOT NULL DEFAULT 0,
+    interested_follow_up BIGINT NOT NULL DEFAULT 0,
+    sentiment_positive BIGINT NOT NULL DEFAULT 0,
+    sentiment_neutral BIGINT NOT NULL DEFAULT 0,
+    sentiment_negative BIGINT NOT NULL DEFAULT 0,
+    satisfied BIGINT NOT NULL DEFAULT 0,
+    unsatisfied BIGINT NOT NULL DEFAULT 0,
+    agreed_price_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    agreed_price_count BIGINT NOT NULL DEFAULT 0,
+    call_duration_sec_sum BIGINT NOT NULL DEFAULT 0,
+    call_duration_sec_count BIGINT NOT NULL DEFAULT 0,
+    attempts_sum BIGINT NOT NULL DEFAULT 0,
+    attempts_count BIGINT NOT NULL DEFAULT 0,
+    counter_offers_sum BIGINT NOT NULL DEFAULT 0,
+    counter_offers_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket_start, shard)
 );
 
 -- Sample INSERT with explicit UUIDs (only for demonstration purposes)
@@ -178,3 +261,58 @@ INSERT INTO call_summaries (
     0,
     TRUE
 );
+
+-- Seed the metrics rollups from the sample call summaries (same totals as
+-- app.crud.metrics_rollup.rebuild_rollup)
+INSERT INTO call_metrics_rollup
+SELECT
+    id % 16 AS shard,
+    count(*),
+    count(*) FILTER (WHERE outcome = 'accepted'),
+    count(*) FILTER (WHERE outcome = 'rejected'),
+    count(*) FILTER (WHERE outcome = 'failed_negotiation'),
+    count(*) FILTER (WHERE outcome = 'no_response'),
+    count(*) FILTER (WHERE outcome = 'interested_follow_up'),
+    count(*) FILTER (WHERE sentiment = 'positive'),
+    count(*) FILTER (WHERE sentiment = 'neutral'),
+    count(*) FILTER (WHERE sentiment = 'negative'),
+    count(*) FILTER (WHERE satisfaction IS TRUE),
+    count(*) FILTER (WHERE satisfaction IS FALSE),
+    coalesce(sum(agreed_price), 0),
+    count(agreed_price),
+    coalesce(sum(call_duration_sec), 0),
+    count(call_duration_sec),
+    coalesce(sum(attempts), 0),
+    count(attempts),
+    coalesce(sum(counter_offers), 0),
+    count(counter_offers)
+FROM call_summaries
+GROUP BY 1
+ON CONFLICT (shard) DO NOTHING;
+
+INSERT INTO call_metrics_hourly
+SELECT
+    date_trunc('hour', created_at) AS bucket_start,
+    id % 16 AS shard,
+    count(*),
+    count(*) FILTER (WHERE outcome = 'accepted'),
+    count(*) FILTER (WHERE outcome = 'rejected'),
+    count(*) FILTER (WHERE outcome = 'failed_negotiation'),
+    count(*) FILTER (WHERE outcome = 'no_response'),
+    count(*) FILTER (WHERE outcome = 'interested_follow_up'),
+    count(*) FILTER (WHERE sentiment = 'positive'),
+    count(*) FILTER (WHERE sentiment = 'neutral'),
+    count(*) FILTER (WHERE sentiment = 'negative'),
+    count(*) FILTER (WHERE satisfaction IS TRUE),
+    count(*) FILTER (WHERE satisfaction IS FALSE),
+    coalesce(sum(agreed_price), 0),
+    count(agreed_price),
+    coalesce(sum(call_duration_sec), 0),
+    count(call_duration_sec),
+    coalesce(sum(attempts), 0),
+    count(attempts),
+    coalesce(sum(counter_offers), 0),
+    count(counter_offers)
+FROM call_summaries
+GROUP BY 1, 2
+ON CONFLICT (bucket_start, shard) DO NOTHING;
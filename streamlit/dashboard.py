@@ -2,6 +2,7 @@ import streamlit as st
 import requests
 import plotly.express as px
 import pandas as pd
+from datetime import datetime, timedelta, timezone
 
 st.set_page_config(page_title="📊 Load Assistant Dashboard", layout="wide")
 st.title("📊 Load Assistant - Operational Metrics")
@@ -75,5 +76,45 @@ try:
     fig_satisfaction.update_traces(textinfo="label+percent")
     st.plotly_chart(fig_satisfaction, use_container_width=True)
 
+    st.markdown("---")
+    st.markdown("### 📈 Daily Trends (last 30 days)")
+
+    since = datetime.now(timezone.utc) - timedelta(days=30)
+    trends_response = requests.get(
+        "http://api:8000/api/v1/metrics",
+        params={"bucket": "day", "from": since.isoformat()},
+    )
+    trends_response.raise_for_status()
+    points = trends_response.json()["points"]
+
+    if points:
+        trends_df = pd.DataFrame(
+            [
+                {
+                    "Day": point["bucket_start"],
+                    "Calls": point["metrics"]["total_calls"],
+                    "Accepted": point["metrics"]["accepted"],
+                    "Avg Price": point["metrics"]["avg_agreed_price"],
+                }
+                for point in points
+            ]
+        )
+
+        fig_calls = px.line(
+            trends_df,
+            x="Day",
+            y=["Calls", "Accepted"],
+            title="Calls per Day",
+            markers=True,
+        )
+        st.plotly_chart(fig_calls, use_container_width=True)
+
+        fig_price = px.line(
+            trends_df, x="Day", y="Avg Price", title="Avg Agreed Price", markers=True
+        )
+        st.plotly_chart(fig_price, use_container_width=True)
+    else:
+        st.info("No calls in the last 30 days.")
+
 except Exception as e:
     st.error(f"🚨 Failed to load metrics from API: {e}")
@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database_engine.base_class import Base
+from app.models.call_summary import CallSummary  # noqa: F401 - registers table
+from app.models.load import Load
+from app.models.metrics_rollup import CallMetricsRollup  # noqa: F401 - registers table
+
+
+@pytest.fixture
+def db_session():
+    """In-memory SQLite session with the application schema created."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@asynccontextmanager
+async def async_db_engine() -> AsyncIterator[AsyncEngine]:
+    """In-memory aiosqlite engine; use inside a coroutine run by `asyncio.run`."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+@asynccontextmanager
+async def async_db_session() -> AsyncIterator[AsyncSession]:
+    """In-memory aiosqlite session; use inside a coroutine run by `asyncio.run`."""
+    async with async_db_engine() as engine:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+
+def make_load(**overrides) -> Load:
+    """Build a Load row with sensible defaults for tests."""
+    pickup = overrides.pop("pickup_datetime", datetime(2025, 8, 10, 8, 0))
+    values = {
+        "load_id": uuid.uuid4(),
+        "origin": "chicago, il",
+        "destination": "dallas, tx",
+        "pickup_datetime": pickup,
+        "delivery_datetime": pickup + timedelta(days=1),
+        "equipment_type": "dry van",
+        "loadboard_rate": 1500.0,
+        "notes": "routine delivery",
+        "weight": 15000.0,
+        "commodity_type": "retail goods",
+        "num_of_pieces": 50,
+        "miles": 900.0,
+        "dimensions": "48x40x60",
+    }
+    values.update(overrides)
+    return Load(**values)
+
+
+class StubFMCSA(ThreadingHTTPServer):
+    """Local stand-in for the FMCSA API, counting requests and connections."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.status = 200
+        self.delay = 0.0
+        self.requests = 0
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url_template(self) -> str:
+        host, port = self.server_address
+        return (
+            f"http://{host}:{port}/carriers/docket-number/{{mc_number}}"
+            "?webKey={web_key}"
+        )
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.active += 1
+            self.server.max_active = max(self.server.max_active, self.server.active)
+        time.sleep(self.server.delay)
+        with self.server.lock:
+            self.server.active -= 1
+        mc_number = self.path.split("/")[-1].split("?")[0]
+        body = json.dumps(
+            {
+                "content": [
+                    {"carrier": {"dotNumber": int(mc_number), "allowedToOperate": "Y"}}
+                ]
+            }
+        ).encode()
+        status = self.server.status
+        if callable(status):
+            status = status(mc_number)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    """Local FMCSA stub server, serving on a free port for the test."""
+    server = StubFMCSA()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
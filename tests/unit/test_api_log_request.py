@@ -0,0 +1,124 @@
+import asyncio
+import logging
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.middlewares.api_log_request import APILogRequestMiddleware
+
+LOGGER = "app.middlewares.api_log_request"
+
+
+def _app(**middleware_options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(APILogRequestMiddleware, **middleware_options)
+
+    @app.get("/api/v1/health")
+    def health():
+        return {"status": "ok"}
+
+    @app.get("/api/v1/fail")
+    def fail():
+        raise HTTPException(status_code=503, detail="down")
+
+    @app.get("/api/v1/stream")
+    async def stream():
+        async def chunks():
+            for n in range(3):
+                await asyncio.sleep(0.05)
+                yield f"{n}\n"
+
+        return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+    return app
+
+
+def _messages(caplog):
+    return [record.getMessage() for record in caplog.records if record.name == LOGGER]
+
+
+class TestAPILogRequestMiddleware:
+    """Test suite for the ASGI request logging middleware"""
+
+    def test_logs_request_and_response(self, caplog):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        with TestClient(_app()) as client:
+            response = client.get(
+                "/api/v1/health?origin=chicago",
+                headers={"X-Forwarded-For": "10.0.0.7, 10.0.0.1", "Accept": "*/*"},
+            )
+
+        assert response.json() == {"status": "ok"}
+        request_line, response_line = _messages(caplog)
+        assert request_line.startswith(
+            "[Request] GET /api/v1/health | Query: origin=chicago | IP: 10.0.0.7"
+        )
+        assert "Accept: */*" in request_line
+        assert response_line.startswith(
+            "[Response] GET /api/v1/health | Status: 200 | "
+            "Content-Type: application/json | Latency: "
+        )
+
+    def test_streaming_responses_pass_through(self, caplog):
+        """The body is streamed untouched and latency covers the whole stream"""
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        with TestClient(_app()) as client:
+            with client.stream("GET", "/api/v1/stream") as response:
+                lines = list(response.iter_lines())
+
+        assert lines == ["0", "1", "2"]
+        latency = _messages(caplog)[-1].rsplit("Latency: ", 1)[1]
+        assert float(latency.rstrip("ms")) >= 150
+
+    @pytest.mark.parametrize("sample, logged", [(0.3, 2), (0.7, 0)])
+    def test_sampled_paths(self, caplog, sample, logged):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        app = _app(
+            sample_rates={"/api/v1": 1.0, "/api/v1/health": 0.5},
+            random_source=lambda: sample,
+        )
+        with TestClient(app) as client:
+            client.get("/api/v1/health")
+
+        assert len(_messages(caplog)) == logged
+
+    def test_failures_of_unsampled_paths_are_logged(self, caplog):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        with TestClient(_app(sample_rates={"/api/v1": 0.0})) as client:
+            client.get("/api/v1/health")
+            client.get("/api/v1/fail")
+
+        (message,) = _messages(caplog)
+        assert message.startswith("[Response] GET /api/v1/fail | Status: 503")
+
+    def test_nothing_is_logged_above_info(self, caplog):
+        caplog.set_level(logging.WARNING, logger=LOGGER)
+        with TestClient(_app()) as client:
+            assert client.get("/api/v1/health").status_code == 200
+
+        assert _messages(caplog) == []
+
+    def test_configured_level_skips_the_logging_path(self, caplog, monkeypatch):
+        """Above INFO, the app gets the server's receive and send untouched"""
+        caplog.set_level(logging.WARNING, logger=LOGGER)
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append((receive, send))
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            pass
+
+        middleware = APILogRequestMiddleware(app)
+        monkeypatch.setattr(
+            middleware, "_log_request", lambda scope: pytest.fail("logged")
+        )
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+        asyncio.run(middleware(scope, receive, send))
+
+        assert calls == [(receive, send)]
@@ -0,0 +1,260 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from app.business.call_summary import (
+    ingest_call_summaries,
+    ingest_call_summaries_async,
+)
+from app.core.config import constants
+from app.crud.call_summary import (
+    bulk_create_call_summaries,
+    create_call_summary,
+    create_call_summary_async,
+    get_all_call_summaries_async,
+    get_call_summaries_page,
+    get_call_summaries_page_async,
+    stream_call_summaries,
+    stream_call_summaries_async,
+)
+from app.crud.metrics_rollup import check_rollup
+from app.schemas.call_summary import CallSummaryCreate, CallSummaryFilter
+from tests.unit.conftest import async_db_session, make_load
+
+
+class TestAsyncCallSummaryCrud:
+    """Test suite for the AsyncSession call summary functions"""
+
+    def test_create_and_list_call_summaries(self):
+        """Created summaries are persisted and returned by the listing"""
+        load = make_load()
+        payload = CallSummaryCreate(
+            load_id=load.load_id,
+            agreed_price=1800.0,
+            outcome="accepted",
+            sentiment="positive",
+            satisfaction=True,
+        )
+
+        async def scenario():
+            async with async_db_session() as db:
+                db.add(load)
+                await db.commit()
+                created = await create_call_summary_async(db, payload)
+                return created, await get_all_call_summaries_async(db)
+
+        created, summaries = asyncio.run(scenario())
+
+        assert created.id is not None
+        assert [summary.id for summary in summaries] == [created.id]
+        assert summaries[0].agreed_price == 1800.0
+        assert summaries[0].outcome.value == "accepted"
+
+
+OUTCOMES = ["accepted", "rejected", "accepted", "no_response", "accepted"]
+
+
+def _seed_summaries(db, loads):
+    """Create one summary per outcome, alternating between the given loads."""
+    return [
+        create_call_summary(
+            db,
+            CallSummaryCreate(
+                load_id=loads[index % len(loads)].load_id,
+                outcome=outcome,
+                sentiment="positive" if index % 2 else "neutral",
+            ),
+        ).id
+        for index, outcome in enumerate(OUTCOMES)
+    ]
+
+
+class TestCallSummaryPagination:
+    """Test suite for keyset pages and the streaming export"""
+
+    def test_pages_cover_every_summary_once(self, db_session):
+        """Following next_cursor walks all summaries in ID order"""
+        load = make_load()
+        db_session.add(load)
+        db_session.commit()
+        ids = _seed_summaries(db_session, [load])
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            page, cursor = get_call_summaries_page(
+                db_session, CallSummaryFilter(), after_id=cursor, limit=2
+            )
+            seen.extend(summary.id for summary in page)
+            pages += 1
+            if cursor is None:
+                break
+
+        assert seen == ids
+        assert pages == 3
+
+    def test_exact_last_page_has_no_cursor(self, db_session):
+        """A page that ends exactly at the last row does not point further"""
+        load = make_load()
+        db_session.add(load)
+        db_session.commit()
+        ids = _seed_summaries(db_session, [load])
+
+        page, cursor = get_call_summaries_page(
+            db_session, CallSummaryFilter(), limit=len(ids)
+        )
+
+        assert [summary.id for summary in page] == ids
+        assert cursor is None
+
+    def test_filters_combine(self, db_session):
+        """Outcome, sentiment and load filters narrow the listing together"""
+        loads = [make_load(), make_load()]
+        db_session.add_all(loads)
+        db_session.commit()
+        ids = _seed_summaries(db_session, loads)
+
+        accepted, _ = get_call_summaries_page(
+            db_session, CallSummaryFilter(outcome="accepted")
+        )
+        of_first_load, _ = get_call_summaries_page(
+            db_session,
+            CallSummaryFilter(load_id=loads[0].load_id, sentiment="neutral"),
+        )
+
+        assert [summary.id for summary in accepted] == [ids[0], ids[2], ids[4]]
+        assert [summary.id for summary in of_first_load] == [ids[0], ids[2], ids[4]]
+
+    def test_stream_matches_pages(self, db_session):
+        """The export yields the same rows as walking every page"""
+        load = make_load()
+        db_session.add(load)
+        db_session.commit()
+        ids = _seed_summaries(db_session, [load])
+
+        streamed = stream_call_summaries(db_session, CallSummaryFilter())
+        rejected = stream_call_summaries(
+            db_session, CallSummaryFilter(outcome="rejected")
+        )
+
+        assert [summary.id for summary in streamed] == ids
+        assert [summary.id for summary in rejected] == [ids[1]]
+
+    def test_async_page_and_stream(self):
+        """The AsyncSession variants agree with the sync ones"""
+        load = make_load()
+
+        async def scenario():
+            async with async_db_session() as db:
+                db.add(load)
+                await db.commit()
+                ids = []
+                for outcome in OUTCOMES:
+                    created = await create_call_summary_async(
+                        db, CallSummaryCreate(load_id=load.load_id, outcome=outcome)
+                    )
+                    ids.append(created.id)
+                page, cursor = await get_call_summaries_page_async(
+                    db, CallSummaryFilter(), after_id=ids[0], limit=2
+                )
+                streamed = [
+                    summary.id
+                    async for summary in stream_call_summaries_async(
+                        db, CallSummaryFilter(outcome="accepted")
+                    )
+                ]
+                return ids, page, cursor, streamed
+
+        ids, page, cursor, streamed = asyncio.run(scenario())
+
+        assert [summary.id for summary in page] == ids[1:3]
+        assert cursor == ids[2]
+        assert streamed == [ids[0], ids[2], ids[4]]
+
+
+class TestBulkCallSummaries:
+    """Test suite for bulk call summary ingestion"""
+
+    def test_json_array_reports_invalid_items(self, db_session):
+        """Valid items are stored and invalid ones reported by index"""
+        load = make_load()
+        db_session.add(load)
+        db_session.commit()
+        items = [
+            {"load_id": str(load.load_id), "outcome": "accepted", "agreed_price": 1500},
+            {"load_id": str(load.load_id), "outcome": "maybe"},
+            {"outcome": "rejected"},
+            {"load_id": str(uuid.uuid4()), "outcome": "rejected"},
+            {"load_id": str(load.load_id), "sentiment": "negative"},
+        ]
+
+        result = ingest_call_summaries(
+            db_session, json.dumps(items).encode(), ndjson=False
+        )
+
+        assert (result.received, result.inserted) == (5, 2)
+        assert [error.index for error in result.errors] == [1, 2, 3]
+        assert result.errors[0].errors[0].startswith("outcome:")
+        assert "not found" in result.errors[2].errors[0]
+        page, _ = get_call_summaries_page(db_session, CallSummaryFilter())
+        assert [summary.outcome for summary in page] == ["accepted", None]
+        assert check_rollup(db_session) == {}
+
+    def test_ndjson_lines_are_indexed(self, db_session):
+        """NDJSON errors use line numbers; blank lines are skipped"""
+        load = make_load()
+        db_session.add(load)
+        db_session.commit()
+        line = json.dumps({"load_id": str(load.load_id), "outcome": "accepted"})
+        body = "\n".join([line, "", "{not json", line]).encode()
+
+        result = ingest_call_summaries(db_session, body, ndjson=True)
+
+        assert (result.received, result.inserted) == (3, 2)
+        assert [error.index for error in result.errors] == [2]
+        assert "Invalid JSON" in result.errors[0].errors[0]
+
+    def test_malformed_array_is_rejected(self, db_session):
+        """A body that is not a JSON array is refused as a whole"""
+        with pytest.raises(ValueError):
+            ingest_call_summaries(db_session, b'{"load_id": 1}', ndjson=False)
+        with pytest.raises(ValueError):
+            ingest_call_summaries(db_session, b"[{", ndjson=False)
+
+    def test_batches_share_one_transaction(self, db_session, monkeypatch):
+        """Items spanning several batches are all stored with their counters"""
+        monkeypatch.setattr(constants, "CALL_SUMMARY_BULK_BATCH", 2)
+        load = make_load()
+        db_session.add(load)
+        db_session.commit()
+        payloads = [
+            CallSummaryCreate(load_id=load.load_id, outcome=outcome)
+            for outcome in OUTCOMES
+        ]
+
+        ids = bulk_create_call_summaries(db_session, payloads)
+
+        assert len(ids) == len(OUTCOMES) and ids == sorted(ids)
+        assert check_rollup(db_session) == {}
+
+    def test_async_ingestion(self):
+        """The AsyncSession path stores the same rows"""
+        load = make_load()
+        body = "\n".join(
+            json.dumps({"load_id": str(load.load_id), "outcome": outcome})
+            for outcome in OUTCOMES
+        ).encode()
+
+        async def scenario():
+            async with async_db_session() as db:
+                db.add(load)
+                await db.commit()
+                result = await ingest_call_summaries_async(db, body, ndjson=True)
+                page, _ = await get_call_summaries_page_async(db, CallSummaryFilter())
+                return result, page
+
+        result, page = asyncio.run(scenario())
+
+        assert result.inserted == len(OUTCOMES) and not result.errors
+        assert [summary.outcome.value for summary in page] == OUTCOMES
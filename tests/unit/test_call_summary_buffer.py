@@ -0,0 +1,347 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.exc import DataError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.api.dependencies import get_call_summary_buffer
+from app.business import call_summary_buffer
+from app.business.call_summary_buffer import (
+    DEAD_LETTER_FILE,
+    BufferFullError,
+    CallSummaryBuffer,
+)
+from app.main import app
+from app.models.call_summary import CallSummary
+from app.schemas.call_summary import CallSummaryCreate
+from tests.unit.conftest import async_db_engine, make_load
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    """Poll `condition` until it holds or fail after `timeout` seconds."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+async def _count_summaries(sessions) -> int:
+    async with sessions() as db:
+        return await db.scalar(select(func.count()).select_from(CallSummary))
+
+
+def _failing_sessions():
+    raise ConnectionError("database unavailable")
+
+
+def _run_with_db(scenario):
+    """Run `scenario(sessions, load)` against a fresh database with one load."""
+    load = make_load()
+
+    async def main():
+        async with async_db_engine() as engine:
+            sessions = async_sessionmaker(engine, expire_on_commit=False)
+            async with sessions() as db:
+                db.add(load)
+                await db.commit()
+            return await scenario(sessions, load)
+
+    return asyncio.run(main())
+
+
+class TestCallSummaryBuffer:
+    """Test suite for the write-behind call summary buffer"""
+
+    def test_flushes_full_batches_then_rest_on_stop(self, tmp_path):
+        """Full batches are stored right away; stop stores the remainder"""
+
+        async def scenario(sessions, load):
+            buffer = CallSummaryBuffer(
+                sessions, str(tmp_path), batch_size=3, flush_interval=30
+            )
+            await buffer.start()
+            for _ in range(7):
+                await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            await _wait_for(lambda: buffer.stored == 6)
+            queued = buffer.stats()["queued"]
+            await buffer.stop()
+            return queued, buffer.stored, await _count_summaries(sessions)
+
+        queued, stored, rows = _run_with_db(scenario)
+
+        assert queued == 1
+        assert stored == rows == 7
+        assert list(tmp_path.iterdir()) == []
+
+    def test_flushes_partial_batch_after_interval(self, tmp_path):
+        """A lone summary is stored once the flush interval elapses"""
+
+        async def scenario(sessions, load):
+            buffer = CallSummaryBuffer(
+                sessions, str(tmp_path), batch_size=100, flush_interval=0.05
+            )
+            await buffer.start()
+            await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            await _wait_for(lambda: buffer.stored == 1)
+            rows = await _count_summaries(sessions)
+            await buffer.stop()
+            return rows
+
+        assert _run_with_db(scenario) == 1
+
+    def test_backpressure_when_database_stalls(self, tmp_path):
+        """A full queue rejects new summaries after the enqueue timeout"""
+
+        async def scenario(sessions, load):
+            buffer = CallSummaryBuffer(
+                _failing_sessions,
+                str(tmp_path),
+                max_size=1,
+                batch_size=1,
+                enqueue_timeout=0.05,
+                retry_delay=0.01,
+            )
+            await buffer.start()
+            await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            await _wait_for(lambda: buffer.stats()["queued"] == 0)
+            await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            with pytest.raises(BufferFullError):
+                await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            await buffer.stop(timeout=0.05)
+
+            # Restart with a working database: both accepted summaries survive
+            recovered = CallSummaryBuffer(sessions, str(tmp_path))
+            await recovered.start()
+            await recovered.stop()
+            return recovered.stored, await _count_summaries(sessions)
+
+        assert _run_with_db(scenario) == (2, 2)
+
+    def test_crash_replays_only_uncommitted_summaries(self, tmp_path):
+        """Committed batches are not stored twice after a crash"""
+
+        async def scenario(sessions, load):
+            buffer = CallSummaryBuffer(
+                sessions, str(tmp_path), batch_size=2, flush_interval=30
+            )
+            await buffer.start()
+            for _ in range(3):
+                await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            await _wait_for(lambda: buffer.stored == 2)
+            # Crash: the flusher dies and the spill file lock is released
+            buffer._task.cancel()
+            buffer._spill.close()
+
+            recovered = CallSummaryBuffer(sessions, str(tmp_path))
+            await recovered.start()
+            await recovered.stop()
+            return recovered.stored, await _count_summaries(sessions)
+
+        assert _run_with_db(scenario) == (1, 3)
+
+    def test_claims_spill_files_of_dead_workers(self, tmp_path):
+        """Orphan spill files are stored; a torn last line and bad loads are skipped"""
+
+        async def scenario(sessions, load):
+            records = [
+                {"seq": 1, "summary": {"load_id": str(load.load_id)}},
+                {"committed": 1},
+                {"seq": 2, "summary": {"load_id": str(load.load_id)}},
+                {"seq": 3, "summary": {"load_id": str(uuid.uuid4())}},
+            ]
+            orphan = tmp_path / "call-summaries-999999.ndjson"
+            orphan.write_text(
+                "".join(json.dumps(record) + "\n" for record in records)
+                + '{"seq": 4, "summ'
+            )
+
+            buffer = CallSummaryBuffer(sessions, str(tmp_path))
+            await buffer.start()
+            await buffer.stop()
+            return buffer.stats(), orphan.exists(), await _count_summaries(sessions)
+
+        stats, orphan_left, rows = _run_with_db(scenario)
+
+        assert (stats["stored"], stats["dropped"], rows) == (1, 1, 1)
+        assert not orphan_left
+        (dead,) = [json.loads(line) for line in (tmp_path / DEAD_LETTER_FILE).open()]
+        assert dead["error"] == "unknown load_id"
+
+    def test_rejected_summaries_are_dead_lettered(self, tmp_path, monkeypatch):
+        """A summary the database refuses is set aside; the rest is stored"""
+        insert = call_summary_buffer.bulk_create_call_summaries_async
+
+        async def refuse_bad_comments(db, payloads):
+            if any(payload.comments == "bad" for payload in payloads):
+                raise DataError("INSERT", {}, Exception("value too long"))
+            return await insert(db, payloads)
+
+        monkeypatch.setattr(
+            call_summary_buffer,
+            "bulk_create_call_summaries_async",
+            refuse_bad_comments,
+        )
+
+        async def scenario(sessions, load):
+            buffer = CallSummaryBuffer(
+                sessions, str(tmp_path), batch_size=5, flush_interval=30
+            )
+            await buffer.start()
+            for comments in ["ok", "bad", "ok", "ok", "ok", "ok"]:
+                await buffer.enqueue(
+                    CallSummaryCreate(load_id=load.load_id, comments=comments)
+                )
+            await buffer.stop()
+            return buffer.stats(), await _count_summaries(sessions)
+
+        stats, rows = _run_with_db(scenario)
+
+        assert (stats["stored"], stats["rejected"], rows) == (5, 1, 5)
+        (dead,) = [json.loads(line) for line in (tmp_path / DEAD_LETTER_FILE).open()]
+        assert dead["summary"]["comments"] == "bad"
+        assert "value too long" in dead["error"]
+        assert [path.name for path in tmp_path.iterdir()] == [DEAD_LETTER_FILE]
+
+    def test_pool_timeouts_are_retried(self, tmp_path):
+        """An exhausted pool delays the batch instead of dead-lettering it"""
+
+        async def scenario(sessions, load):
+            timeouts = iter(range(2))
+
+            def busy_sessions():
+                if next(timeouts, None) is not None:
+                    raise PoolTimeoutError("QueuePool limit reached")
+                return sessions()
+
+            buffer = CallSummaryBuffer(
+                busy_sessions, str(tmp_path), flush_interval=30, retry_delay=0.01
+            )
+            await buffer.start()
+            for _ in range(3):
+                await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            await buffer.stop()
+            return buffer.stats(), await _count_summaries(sessions)
+
+        stats, rows = _run_with_db(scenario)
+
+        assert (stats["stored"], stats["dropped"], stats["rejected"]) == (3, 0, 0)
+        assert rows == 3
+        assert list(tmp_path.iterdir()) == []
+
+    def test_flusher_survives_unexpected_errors(self, tmp_path, monkeypatch):
+        """A failing batch step is retried; the flusher stays alive"""
+        failed = []
+
+        async def scenario(sessions, load):
+            buffer = CallSummaryBuffer(
+                sessions, str(tmp_path), flush_interval=0.01, retry_delay=0.01
+            )
+            mark_committed = buffer._mark_committed
+
+            async def full_disk_once(seq):
+                if not failed:
+                    failed.append(seq)
+                    raise OSError("No space left on device")
+                await mark_committed(seq)
+
+            monkeypatch.setattr(buffer, "_mark_committed", full_disk_once)
+            await buffer.start()
+            await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            await _wait_for(lambda: failed)
+            await buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+            await _wait_for(lambda: buffer.stored == 2)
+            stats = buffer.stats()
+            await buffer.stop()
+            return stats, await _count_summaries(sessions)
+
+        stats, rows = _run_with_db(scenario)
+
+        assert stats["flusher_alive"]
+        assert (stats["stored"], rows) == (2, 2)
+
+    def test_concurrent_enqueues_share_fsyncs(self, tmp_path, monkeypatch):
+        """Group commit: one fsync covers the enqueues waiting for it"""
+        fsyncs = []
+        fsync = os.fsync
+
+        def slow_fsync(fd):
+            fsyncs.append(fd)
+            fsync(fd)
+            time.sleep(0.02)
+
+        monkeypatch.setattr(os, "fsync", slow_fsync)
+
+        async def scenario(sessions, load):
+            buffer = CallSummaryBuffer(sessions, str(tmp_path), flush_interval=30)
+            await buffer.start()
+            await asyncio.gather(
+                *(
+                    buffer.enqueue(CallSummaryCreate(load_id=load.load_id))
+                    for _ in range(50)
+                )
+            )
+            await buffer.stop()
+            return buffer.stored
+
+        assert _run_with_db(scenario) == 50
+        assert 1 <= len(fsyncs) <= 3
+
+
+class _FakeBuffer:
+    def __init__(self, full: bool = False):
+        self.full = full
+        self.queued = []
+
+    async def enqueue(self, payload):
+        if self.full:
+            raise BufferFullError("queue full")
+        self.queued.append(payload)
+
+
+class TestWriteBehindEndpoint:
+    """Test suite for POST /call-summary in write-behind mode"""
+
+    def _post(self, buffer, **fields):
+        app.dependency_overrides[get_call_summary_buffer] = lambda: buffer
+        try:
+            return TestClient(app).post(
+                "/api/v1/call-summary",
+                json={"load_id": str(uuid.uuid4()), "outcome": "accepted", **fields},
+                headers={"X-API-Key": "my-secret-api-key-123"},
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_queued_summary_returns_202(self):
+        """The summary is handed to the buffer and acknowledged at once"""
+        buffer = _FakeBuffer()
+
+        response = self._post(buffer)
+
+        assert response.status_code == 202
+        assert [payload.outcome.value for payload in buffer.queued] == ["accepted"]
+
+    def test_full_queue_returns_503(self):
+        """Backpressure is surfaced with a Retry-After header"""
+        response = self._post(_FakeBuffer(full=True))
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+    def test_unstorable_summary_is_rejected_before_queueing(self):
+        """Values the columns cannot hold get a 422, not a 202"""
+        buffer = _FakeBuffer()
+
+        too_long = self._post(buffer, special_conditions="x" * 256)
+        out_of_range = self._post(buffer, call_duration_sec=2**31)
+
+        assert (too_long.status_code, out_of_range.status_code) == (422, 422)
+        assert buffer.queued == []
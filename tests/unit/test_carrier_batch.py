@@ -0,0 +1,124 @@
+import asyncio
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from app.business.carrier import verify_carriers
+from app.business.fmcsa_client import FMCSAClient
+from app.core.config import constants, settings
+from app.main import app
+from app.schemas.carrier import CarrierVerificationSource
+
+
+def _verify_all(stub, mc_numbers, concurrency, **kwargs):
+    async def main():
+        client = FMCSAClient(stub.url_template, "key", **kwargs)
+        try:
+            return [
+                verification
+                async for verification in verify_carriers(
+                    mc_numbers, CarrierVerificationSource.FMCSA, client, concurrency
+                )
+            ], client.stats()
+        finally:
+            await client.aclose()
+
+    return asyncio.run(main())
+
+
+class TestCarrierBatch:
+    """Test suite for batch MC verification, against a local FMCSA stub"""
+
+    def test_concurrency_is_bounded_and_duplicates_reuse_lookups(self, stub):
+        stub.delay = 0.02
+        mc_numbers = [str(100000 + i % 150) for i in range(300)]
+
+        verifications, stats = _verify_all(stub, mc_numbers, concurrency=8)
+
+        assert sorted(v.index for v in verifications) == list(range(300))
+        assert all(
+            v.result["content"][0]["carrier"]["dotNumber"] == int(v.mc_number)
+            for v in verifications
+        )
+        assert stub.requests == 150
+        assert stub.max_active <= 8
+        assert stats["hits"] + stats["coalesced"] == 150
+
+    def test_concurrent_batches_share_the_client_limit(self, stub):
+        stub.delay = 0.02
+
+        async def main():
+            client = FMCSAClient(stub.url_template, "key", batch_concurrency=4)
+
+            async def batch(first: int):
+                mc_numbers = [str(first + i) for i in range(40)]
+                return [
+                    verification
+                    async for verification in verify_carriers(
+                        mc_numbers, CarrierVerificationSource.FMCSA, client, 8
+                    )
+                ]
+
+            try:
+                return await asyncio.gather(batch(300000), batch(400000))
+            finally:
+                await client.aclose()
+
+        batches = asyncio.run(main())
+
+        assert [len(verifications) for verifications in batches] == [40, 40]
+        assert stub.requests == 80
+        assert stub.max_active <= 4
+
+    def test_failures_are_reported_per_mc(self, stub):
+        stub.status = lambda mc_number: 403 if mc_number.endswith("7") else 200
+
+        verifications, _ = _verify_all(
+            stub, ["100007", "100001", "12", "100002"], concurrency=2
+        )
+
+        errors = {v.mc_number: v.error for v in verifications if v.error}
+        assert errors == {
+            "100007": "FMCSA answered 403",
+            "12": "MC number must have 5 to 8 characters",
+        }
+        assert len(verifications) == 4
+
+    def test_throughput_reaches_thousands_per_minute(self, stub):
+        """With 100 ms of FMCSA latency, 16 lookups in flight verify ~9600/min"""
+        stub.delay = 0.1
+        mc_numbers = [str(200000 + i) for i in range(160)]
+
+        started = time.perf_counter()
+        verifications, _ = _verify_all(
+            stub, mc_numbers, concurrency=16, max_connections=20
+        )
+        per_minute = len(verifications) / (time.perf_counter() - started) * 60
+
+        assert not [v for v in verifications if v.error]
+        assert per_minute > 3000
+
+    def test_endpoint_streams_ndjson(self, stub, monkeypatch):
+        monkeypatch.setattr(settings, "FMCSA_URL", stub.url_template)
+
+        with TestClient(app) as client:
+            response = client.post(
+                "/api/v1/carriers/verify/batch",
+                json={"mc_numbers": ["500001", "400001"], "source": "local"},
+            )
+            too_many = client.post(
+                "/api/v1/carriers/verify/batch",
+                json={
+                    "mc_numbers": ["500001"] * (constants.CARRIER_BATCH_MAX_SIZE + 1)
+                },
+            )
+
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert sorted((line["index"], line["result"]["status"]) for line in lines) == [
+            (0, "authorized"),
+            (1, "non-authorized"),
+        ]
+        assert stub.requests == 0
+        assert too_many.status_code == 422
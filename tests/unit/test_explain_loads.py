@@ -0,0 +1,44 @@
+from app.cli.explain_loads import index_names, sequential_scans
+
+
+def _plan(node_type, **extra):
+    return {"Node Type": node_type, **extra}
+
+
+def test_sequential_scans_found_in_nested_plans():
+    document = {
+        "Plan": _plan(
+            "Limit",
+            Plans=[
+                _plan(
+                    "Append",
+                    Plans=[
+                        _plan(
+                            "Index Scan",
+                            **{
+                                "Relation Name": "loads",
+                                "Index Name": "ix_loads_priority",
+                            },
+                        ),
+                        _plan("Seq Scan", **{"Relation Name": "loads"}),
+                    ],
+                )
+            ],
+        )
+    }
+
+    assert sequential_scans(document) == ["loads"]
+    assert index_names(document) == ["ix_loads_priority"]
+
+
+def test_index_only_plan_has_no_sequential_scans():
+    document = {
+        "Plan": _plan(
+            "Bitmap Heap Scan",
+            **{"Relation Name": "loads"},
+            Plans=[_plan("Bitmap Index Scan", **{"Index Name": "ix_loads_miles"})],
+        )
+    }
+
+    assert sequential_scans(document) == []
+    assert index_names(document) == ["ix_loads_miles"]
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from app.business.fmcsa_client import (
+    CircuitBreaker,
+    FMCSAClient,
+    FMCSARequestError,
+    FMCSAUnavailableError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _run(stub, scenario, **kwargs):
+    async def main():
+        client = FMCSAClient(stub.url_template, "key", **kwargs)
+        try:
+            return await scenario(client)
+        finally:
+            await client.aclose()
+
+    return asyncio.run(main())
+
+
+class TestFMCSAClient:
+    """Test suite for the shared FMCSA client, against a local stub server"""
+
+    def test_answers_are_cached_and_connections_reused(self, stub):
+        async def scenario(client):
+            first = await client.lookup("123456")
+            second = await client.lookup("123456")
+            for mc_number in ("200001", "200002", "200003"):
+                await client.lookup(mc_number)
+            return first, second
+
+        first, second = _run(stub, scenario)
+
+        assert (first.source, second.source) == ("miss", "hit")
+        assert second.payload == first.payload
+        assert first.payload["content"][0]["carrier"]["dotNumber"] == 123456
+        assert stub.requests == 4
+        assert stub.connections == 1
+
+    def test_concurrent_lookups_are_coalesced(self, stub):
+        stub.delay = 0.2
+
+        async def scenario(client):
+            lookups = await asyncio.gather(
+                *(client.lookup("123456") for _ in range(20))
+            )
+            return lookups, client.stats()
+
+        lookups, stats = _run(stub, scenario)
+
+        assert stub.requests == 1
+        assert {lookup.source for lookup in lookups} == {"miss"}
+        assert (stats["misses"], stats["coalesced"]) == (1, 19)
+
+    def test_stale_answers_are_served_while_fmcsa_fails(self, stub):
+        clock = FakeClock()
+
+        async def scenario(client):
+            await client.lookup("123456")
+            clock.now = 60.0  # Past the TTL
+            stub.status = 503
+            stale = await client.lookup("123456")
+            with pytest.raises(FMCSAUnavailableError):
+                await client.lookup("999999")
+            return stale, client.stats()
+
+        stale, stats = _run(stub, scenario, cache_ttl=30.0, clock=clock)
+
+        assert stale.source == "stale"
+        assert stale.payload["content"][0]["carrier"]["dotNumber"] == 123456
+        assert (stats["stale_served"], stats["upstream_errors"]) == (1, 2)
+
+    def test_open_circuit_skips_fmcsa_until_trial_succeeds(self, stub):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30.0, clock=clock)
+        stub.status = 500
+
+        async def scenario(client):
+            for _ in range(2):
+                with pytest.raises(FMCSAUnavailableError):
+                    await client.lookup("123456")
+            assert breaker.state == CircuitBreaker.OPEN
+            with pytest.raises(FMCSAUnavailableError, match="circuit open"):
+                await client.lookup("123456")
+            assert stub.requests == 2
+
+            clock.now = 30.0
+            stub.status = 200
+            recovered = await client.lookup("123456")
+            return recovered, client.stats()
+
+        recovered, stats = _run(stub, scenario, breaker=breaker, clock=clock)
+
+        assert recovered.source == "miss"
+        assert stub.requests == 3
+        assert (stats["circuit"], stats["circuit_opened"]) == ("closed", 1)
+
+    def test_timeouts_count_as_failures(self, stub):
+        stub.delay = 0.5
+        breaker = CircuitBreaker(failure_threshold=1)
+
+        async def scenario(client):
+            with pytest.raises(FMCSAUnavailableError):
+                await client.lookup("123456")
+
+        _run(stub, scenario, timeout=0.1, breaker=breaker)
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_rejected_lookups_are_not_cached(self, stub):
+        stub.status = 403
+
+        async def scenario(client):
+            for _ in range(2):
+                with pytest.raises(FMCSARequestError):
+                    await client.lookup("123456")
+            return client.stats()
+
+        stats = _run(stub, scenario)
+
+        assert stub.requests == 2
+        assert (stats["cached"], stats["circuit"]) == (0, "closed")
@@ -0,0 +1,73 @@
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app.business.healthcheck import HealthcheckManager
+from app.database_engine.session import engine_options, pool_status, to_async_url
+
+
+class TestPoolStatus:
+    """Test suite for the connection pool counters"""
+
+    def test_pool_status_tracks_checked_out_idle_and_overflow(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=QueuePool,
+            pool_size=2,
+            max_overflow=1,
+        )
+        try:
+            connections = [engine.connect() for _ in range(3)]
+            assert pool_status(engine) == {
+                "size": 2,
+                "checked_out": 3,
+                "idle": 0,
+                "overflow": 1,
+            }
+
+            for connection in connections:
+                connection.close()
+            status = pool_status(engine)
+            assert status["checked_out"] == 0
+            assert status["idle"] == 2
+            assert status["overflow"] == 0
+        finally:
+            engine.dispose()
+
+    def test_healthcheck_reports_both_pools(self):
+        status = HealthcheckManager().status()
+
+        assert status["status"] == "ok"
+        assert set(status["database_pools"]) == {"sync", "async"}
+        assert status["database_pools"]["async"]["checked_out"] == 0
+
+
+class TestEngineConfiguration:
+    """Test suite for the engine settings"""
+
+    def test_async_url_keeps_database_and_credentials(self):
+        url = to_async_url("postgresql+psycopg2://user:secret@db:5432/loads_db")
+
+        assert url.drivername == "postgresql+asyncpg"
+        assert (url.username, url.password, url.host, url.port, url.database) == (
+            "user",
+            "secret",
+            "db",
+            5432,
+            "loads_db",
+        )
+
+    def test_engine_options_come_from_settings(self, monkeypatch):
+        monkeypatch.setattr("app.core.config.settings.DB_POOL_SIZE", 20)
+        monkeypatch.setattr("app.core.config.settings.DB_POOL_PRE_PING", False)
+
+        options = engine_options()
+
+        assert options["pool_size"] == 20
+        assert options["pool_pre_ping"] is False
+        assert set(options) == {
+            "pool_size",
+            "max_overflow",
+            "pool_timeout",
+            "pool_recycle",
+            "pool_pre_ping",
+        }
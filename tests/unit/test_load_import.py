@@ -0,0 +1,150 @@
+import io
+import json
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.routes import load as load_routes
+from app.business.load_import import import_loads, read_load_records
+from app.core.config import constants, settings
+from app.database_engine.base_class import Base
+from app.main import app
+from app.models.load import Load
+from app.schemas.load import LoadImportFormat
+from app.utils.normalization import normalize_location
+from tests.unit.conftest import make_load
+
+CSV_HEADER = (
+    "load_id,origin,destination,pickup_datetime,delivery_datetime,equipment_type,"
+    "loadboard_rate,notes,weight,commodity_type,num_of_pieces,miles,dimensions\n"
+)
+
+
+def _csv_row(load_id="", origin="Chicago, IL", rate="1500", notes="") -> str:
+    return (
+        f'{load_id},"{origin}","Dallas ,TX",2025-08-10 08:00,2025-08-11 08:00,'
+        f"dry van,{rate},{notes},15000,retail goods,50,900,48x40x60\n"
+    )
+
+
+def _import(db, text: str, import_format=LoadImportFormat.CSV, **kwargs):
+    records = read_load_records(io.StringIO(text, newline=""), import_format)
+    return import_loads(db, records, **kwargs)
+
+
+class TestLoadImport:
+    """Test suite for the load catalog import pipeline"""
+
+    def test_csv_rows_are_normalized_and_inserted(self, db_session):
+        """Locations are normalized and missing IDs are generated"""
+        report = _import(db_session, CSV_HEADER + _csv_row() + _csv_row(rate="1600"))
+
+        loads = db_session.scalars(select(Load).order_by(Load.loadboard_rate)).all()
+        assert (report.received, report.upserted, report.rejected) == (2, 2, 0)
+        assert [(load.origin, load.destination) for load in loads] == [
+            ("chicago, il", "dallas, tx"),
+            ("chicago, il", "dallas, tx"),
+        ]
+        assert loads[0].notes is None
+        assert loads[0].load_id != loads[1].load_id
+
+    def test_existing_loads_are_updated(self, db_session):
+        """Rows with a known load_id replace that load"""
+        existing = make_load(loadboard_rate=1000.0)
+        db_session.add(existing)
+        db_session.commit()
+
+        report = _import(
+            db_session,
+            CSV_HEADER + _csv_row(load_id=existing.load_id, rate="2000"),
+        )
+
+        db_session.expire_all()
+        assert report.upserted == 1
+        assert db_session.scalars(select(Load.loadboard_rate)).all() == [2000.0]
+
+    def test_last_row_wins_within_and_across_chunks(self, db_session):
+        """Repeated IDs are upserted in file order, whatever the chunking"""
+        load_id = uuid.uuid4()
+        rows = [_csv_row(load_id=load_id, rate=str(rate)) for rate in (1, 2, 3)]
+
+        _import(db_session, CSV_HEADER + "".join(rows), chunk_size=2)
+
+        assert db_session.scalars(select(Load.loadboard_rate)).all() == [3.0]
+
+    def test_invalid_rows_are_reported_with_lines(self, db_session):
+        """Bad rows are skipped and reported by source line"""
+        text = (
+            CSV_HEADER + _csv_row() + _csv_row(rate="cheap") + _csv_row(origin="null")
+        )
+
+        report = _import(db_session, text)
+
+        assert (report.upserted, report.rejected) == (1, 2)
+        assert [error.line for error in report.errors] == [3, 4]
+        assert report.errors[0].errors[0].startswith("loadboard_rate:")
+        assert report.errors[1].errors == ["origin: empty location"]
+
+    def test_ndjson_with_malformed_line(self, db_session, monkeypatch):
+        """NDJSON lines are imported; undecodable ones are counted"""
+        monkeypatch.setattr(constants, "LOAD_IMPORT_MAX_ERRORS", 1)
+        load = {
+            "origin": "Miami, FL",
+            "destination": "Tampa, FL",
+            "pickup_datetime": "2025-08-10T08:00:00",
+            "delivery_datetime": "2025-08-10T18:00:00",
+            "equipment_type": "reefer",
+            "loadboard_rate": 900,
+            "weight": 10000,
+            "commodity_type": "dairy",
+            "num_of_pieces": 10,
+            "miles": 280,
+            "dimensions": "40x48x70",
+        }
+        text = "\n".join([json.dumps(load), "", "{oops", "[]", json.dumps(load)])
+
+        report = _import(db_session, text, import_format=LoadImportFormat.NDJSON)
+
+        assert (report.received, report.upserted, report.rejected) == (4, 2, 2)
+        assert [error.line for error in report.errors] == [3]
+        assert report.errors[0].errors[0].startswith("invalid JSON")
+        assert report.rows_per_sec > 0
+
+    def test_normalize_location(self):
+        """Locations keep the state and drop stray whitespace and case"""
+        assert normalize_location("  St.  Louis ,MO ") == "st. louis, mo"
+        assert normalize_location("Chicago") == "chicago"
+        assert normalize_location("undefined") is None
+        assert normalize_location(" , ") is None
+
+
+class TestLoadImportEndpoint:
+    """Test suite for POST /loads/import"""
+
+    def test_uploaded_csv_is_spooled_and_imported(self, monkeypatch):
+        engine = create_engine(
+            "sqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(engine)
+        monkeypatch.setattr(load_routes, "SessionLocal", sessionmaker(bind=engine))
+        monkeypatch.setattr(constants, "LOAD_IMPORT_SPOOL_BYTES", 100)
+        body = CSV_HEADER + "".join(_csv_row(rate=str(1000 + n)) for n in range(20))
+
+        with TestClient(app) as client:
+            response = client.post(
+                "/api/v1/loads/import",
+                content=body.encode(),
+                headers={
+                    settings.AUTH_HEADER_KEY: settings.AUTH_API_KEY,
+                    "Content-Type": "text/csv",
+                },
+            )
+
+        assert response.status_code == 200
+        assert (response.json()["received"], response.json()["upserted"]) == (20, 20)
+        engine.dispose()
@@ -0,0 +1,227 @@
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+from app.business.load import get_best_load, get_load_page
+from app.business.load_index import INDEXED_COLUMNS, LoadIndex, _database_now
+from app.core.config import constants
+from app.crud.load import (
+    filter_loads_from_db,
+    get_ranked_loads,
+    get_tiered_ranked_loads,
+    upsert_loads,
+)
+from app.models.load import Load
+from app.schemas.load import LoadFilter, MatchTier, TextMatchMode
+from tests.unit.conftest import make_load
+
+CITIES = ["Chicago, IL", "chicago, il", "Dallas, TX", "St. Louis, MO", "Atlanta, GA"]
+EQUIPMENT = ["Dry Van", "dry van", "Reefer", "Flatbed"]
+COMMODITIES = ["Retail Goods", "Medical Supplies", "100% Cotton", None]
+NOTES = [None, "", "URGENT delivery", "routine delivery", "Urgent - medical"]
+TERMS = ["chi", "CHICAGO", "dallas, tx", "st. ", "a", "zzz", "%o%", "d_y", "100%"]
+START = datetime(2025, 8, 1, 8, 0)
+
+
+def _random_load(rng: random.Random) -> Load:
+    pickup = START + timedelta(days=rng.randint(0, 10), hours=rng.choice([0, 6]))
+    return make_load(
+        origin=rng.choice(CITIES),
+        destination=rng.choice(CITIES),
+        pickup_datetime=pickup,
+        delivery_datetime=pickup + timedelta(days=rng.choice([1, 2])),
+        equipment_type=rng.choice(EQUIPMENT),
+        commodity_type=rng.choice(COMMODITIES),
+        notes=rng.choice(NOTES),
+        loadboard_rate=rng.choice([None, 1000.0, 1500.0, 2250.5]),
+        weight=rng.choice([None, 8000.0, 15000.0, 42000.0]),
+        miles=rng.choice([None, 250.0, 900.0, 1800.0]),
+        num_of_pieces=rng.choice([None, 10, 50]),
+    )
+
+
+def _random_filter(rng: random.Random) -> LoadFilter:
+    values = {}
+    for field in ("origin", "destination", "equipment_type", "commodity_type"):
+        if rng.random() < 0.3:
+            values[field] = rng.choice(TERMS)
+    for field, choices in {
+        "min_weight": [8000, 15000.0],
+        "max_weight": [15000, 42000],
+        "min_rate": [1000, 1500.0],
+        "max_rate": [1500, 2250.5],
+        "min_miles": [250, 900],
+        "max_miles": [900, 1800],
+        "pickup_datetime_from": [START + timedelta(days=3)],
+        "pickup_datetime_to": [START + timedelta(days=6, hours=6)],
+    }.items():
+        if rng.random() < 0.25:
+            values[field] = rng.choice(choices)
+    return LoadFilter(**values)
+
+
+def _row(load: Load) -> tuple:
+    return tuple(getattr(load, column) for column in INDEXED_COLUMNS)
+
+
+def _assert_matches_database(index: LoadIndex, db, filters: LoadFilter) -> None:
+    db.expire_all()
+    relaxed = filters.copy(update=constants.RELAXED_FILTER_FIELDS)
+
+    assert sorted(map(_row, index.filter_loads(filters))) == sorted(
+        map(_row, filter_loads_from_db(db, filters))
+    ), filters
+    assert [_row(load) for load in index.ranked_loads(filters, limit=5)] == [
+        _row(load) for load in get_ranked_loads(db, filters, limit=5)
+    ], filters
+    assert [
+        (load.load_id, tier)
+        for load, tier in index.tiered_ranked_loads(filters, relaxed, limit=3)
+    ] == [
+        (load.load_id, tier)
+        for load, tier in get_tiered_ranked_loads(db, filters, relaxed, limit=3)
+    ], filters
+
+
+def _seeded_index(db, count: int = 200, seed: int = 7):
+    rng = random.Random(seed)
+    db.add_all([_random_load(rng) for _ in range(count)])
+    db.commit()
+    index = LoadIndex(sessionmaker(bind=db.get_bind()))
+    index.reload()
+    return index, rng
+
+
+class _PostgresSession:
+    """Session on a PostgreSQL server whose `TimeZone` is UTC-5."""
+
+    zone = timezone(timedelta(hours=-5))
+
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=postgresql.dialect())
+
+    def scalar(self, statement):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        if "LOCALTIMESTAMP" in sql:
+            return self.now.astimezone(self.zone).replace(tzinfo=None)
+        assert "now()" in sql
+        return self.now.astimezone(self.zone)
+
+
+class TestLoadIndex:
+    """Differential tests of the in-memory load index against the database"""
+
+    def test_matches_database_for_random_filters(self, db_session):
+        """Filtering, priority ranking and tiers match the SQL queries"""
+        index, rng = _seeded_index(db_session)
+
+        _assert_matches_database(index, db_session, LoadFilter())
+        for _ in range(300):
+            _assert_matches_database(index, db_session, _random_filter(rng))
+
+    def test_refresh_applies_inserted_and_updated_loads(self, db_session):
+        """Changed rows are picked up without a full reload"""
+        index, rng = _seeded_index(db_session)
+        loads = db_session.query(Load).all()
+
+        # ORM updates bump updated_at through `onupdate`
+        loads[0].notes = "urgent: reefer down"
+        loads[1].miles = None
+        loads[2].origin = "Tulsa, OK"
+        db_session.commit()
+        # Import-style upserts: an update and new loads
+        replacement = {column: getattr(loads[3], column) for column in INDEXED_COLUMNS}
+        replacement["equipment_type"] = "Power Only"
+        upsert_loads(
+            db_session,
+            [replacement]
+            + [
+                {column: getattr(load, column) for column in INDEXED_COLUMNS}
+                for load in (_random_load(rng) for _ in range(20))
+            ],
+        )
+
+        assert index.refresh() > 0
+        assert index.stats()["loads"] == 220
+        for filters in [
+            LoadFilter(),
+            LoadFilter(origin="tulsa"),
+            LoadFilter(equipment_type="power"),
+            LoadFilter(min_miles=0),
+        ] + [_random_filter(rng) for _ in range(100)]:
+            _assert_matches_database(index, db_session, filters)
+
+    def test_refresh_clock_matches_updated_at_time_zone(self):
+        """`updated_at DEFAULT NOW()` holds local time, whatever the offset"""
+        now = datetime(2025, 8, 1, 15, 0, tzinfo=timezone.utc)
+        # What `TIMESTAMP DEFAULT NOW()` stores in that session
+        stored_updated_at = datetime(2025, 8, 1, 10, 0)
+
+        assert _database_now(_PostgresSession(now)) == stored_updated_at
+
+    def test_pages_match_database_pages(self, db_session):
+        """Continuation tokens resume at the same load on both paths"""
+        rng = random.Random(11)
+        loads = [_random_load(rng) for _ in range(150)]
+        for load in loads:  # LoadResponse requires these columns
+            for column in ("loadboard_rate", "weight", "miles", "num_of_pieces"):
+                if getattr(load, column) is None:
+                    setattr(load, column, 1)
+            load.commodity_type = load.commodity_type or "Retail Goods"
+        db_session.add_all(loads)
+        db_session.commit()
+        index = LoadIndex(sessionmaker(bind=db_session.get_bind()))
+        index.reload()
+
+        for filters in [LoadFilter()] + [_random_filter(rng) for _ in range(50)]:
+            cursor = None
+            while True:
+                from_index = get_load_page(
+                    None, filters, limit=7, cursor=cursor, load_index=index
+                )
+                from_database = get_load_page(db_session, filters, 7, cursor)
+                assert from_index == from_database, filters
+                cursor = from_index.next_cursor
+                if cursor is None:
+                    break
+
+    def test_reload_drops_deleted_loads(self, db_session):
+        """Deletes are only seen by the periodic full reload"""
+        index, _ = _seeded_index(db_session, count=10)
+        db_session.delete(db_session.query(Load).first())
+        db_session.commit()
+
+        index.refresh()
+        assert index.stats()["loads"] == 10
+        index.reload()
+        assert index.stats()["loads"] == 9
+        _assert_matches_database(index, db_session, LoadFilter())
+
+    def test_fuzzy_searches_use_the_database(self, db_session):
+        """Only loaded indexes in substring mode answer searches"""
+        index = LoadIndex(sessionmaker(bind=db_session.get_bind()))
+        assert not index.supports(LoadFilter())
+
+        index.reload()
+        assert index.supports(LoadFilter())
+        assert not index.supports(LoadFilter(match_mode=TextMatchMode.FUZZY))
+
+    def test_best_load_without_database_round_trip(self, db_session):
+        """get_best_load is answered from the index when one is given"""
+        urgent = make_load(notes="URGENT", miles=2000.0)
+        db_session.add_all([make_load(), urgent])
+        db_session.commit()
+        index = LoadIndex(sessionmaker(bind=db_session.get_bind()))
+        index.reload()
+
+        best = get_best_load(None, LoadFilter(max_miles=100), load_index=index)
+
+        assert best.load_id == urgent.load_id
+        assert best.match_tier == MatchTier.RELAXED
+        assert best.first_offer == 1350
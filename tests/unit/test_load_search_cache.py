@@ -0,0 +1,124 @@
+import threading
+from datetime import datetime
+
+from sqlalchemy.orm import sessionmaker
+
+from app.business.load_index import LoadIndex
+from app.business.load_search_cache import LoadSearchCache
+from app.schemas.load import LoadFilter
+from tests.unit.conftest import make_load
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLoadSearchCache:
+    """Test suite for the load search result cache"""
+
+    def test_key_is_canonical(self):
+        """Equal normalized filters give the same key, other parameters do not"""
+        first = LoadFilter(
+            origin="chicago, il", pickup_datetime_from=datetime(2025, 8, 1)
+        )
+        second = LoadFilter(
+            pickup_datetime_from="2025-08-01T00:00", origin="chicago, il"
+        )
+
+        assert LoadSearchCache.key(first) == LoadSearchCache.key(second)
+        assert LoadSearchCache.key(first) != LoadSearchCache.key(first, 5, None)
+        assert LoadSearchCache.key(first) != LoadSearchCache.key(
+            first.copy(update={"origin": "dallas, tx"})
+        )
+
+    def test_lru_eviction_and_counters(self):
+        """The least recently used search is evicted first"""
+        cache = LoadSearchCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", None)
+        assert cache.get("a") == (True, 1)
+
+        cache.put("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.get("c") == (True, 3)
+        assert cache.stats() == {
+            "entries": 2,
+            "capacity": 2,
+            "hits": 3,
+            "misses": 1,
+            "evictions": 1,
+            "invalidations": 0,
+        }
+
+    def test_results_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = LoadSearchCache(ttl=30.0, clock=clock)
+        cache.put("a", None)
+
+        clock.now = 29.9
+        assert cache.get("a") == (True, None)
+        clock.now = 30.0
+        assert cache.get("a") == (False, None)
+        assert cache.stats()["entries"] == 0
+
+    def test_invalidation_drops_results_computed_before_it(self):
+        """A search racing with an invalidation does not cache stale rows"""
+        cache = LoadSearchCache()
+        cache.put("a", 1)
+        generation = cache.generation
+
+        cache.invalidate()
+        cache.put("b", 2, generation)
+
+        assert cache.get("a") == (False, None)
+        assert cache.get("b") == (False, None)
+        cache.put("b", 2, cache.generation)
+        assert cache.get("b") == (True, 2)
+
+    def test_concurrent_use_keeps_counters_consistent(self):
+        cache = LoadSearchCache(max_entries=50)
+
+        def worker(offset: int):
+            for i in range(2000):
+                key = str((i * 7 + offset) % 80)
+                if not cache.get(key)[0]:
+                    cache.put(key, i)
+                if i % 500 == 0:
+                    cache.invalidate()
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats["hits"] + stats["misses"] == 8 * 2000
+        assert stats["entries"] <= 50
+        assert stats["invalidations"] == 8 * 4
+
+    def test_load_index_changes_invalidate(self, db_session):
+        """Refreshes that change indexed loads empty the cache"""
+        db_session.add(make_load())
+        db_session.commit()
+        cache = LoadSearchCache()
+        index = LoadIndex(
+            sessionmaker(bind=db_session.get_bind()), on_change=cache.invalidate
+        )
+        index.reload()
+        cache.put("a", 1)
+
+        index.refresh()
+        assert cache.get("a") == (True, 1)
+
+        db_session.add(make_load())
+        db_session.commit()
+        index.refresh()
+        assert cache.get("a") == (False, None)
+        assert cache.stats()["invalidations"] == 2
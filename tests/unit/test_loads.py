@@ -1,23 +1,46 @@
+import asyncio
+import random
 from datetime import datetime
 from unittest.mock import Mock, patch
+from sqlalchemy import and_
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
 from app.business.load import (
+    PricingRates,
+    _calculate_load_offer,
+    calculate_load_offers,
     get_best_load,
+    get_best_load_async,
+    get_load_page,
+    get_load_page_async,
     prioritize_loads,
 )
-from app.schemas.load import LoadFilter
+from app.crud.load import (
+    build_load_conditions,
+    filter_loads_from_db,
+    filter_loads_from_db_async,
+    get_ranked_loads,
+    get_ranked_loads_async,
+    get_tiered_ranked_loads,
+    get_tiered_ranked_loads_async,
+)
+from app.core.config import Settings, constants
+from app.models.load import Load
+from app.schemas.load import LoadFilter, MatchTier, TextMatchMode
+from tests.unit.conftest import async_db_session, make_load
 
 
 class TestGetBestLoad:
     """Test suite for get_best_load function"""
 
-    @patch("app.business.load.filter_loads_from_db")
-    @patch("app.business.load.prioritize_loads")
+    @patch("app.business.load.get_tiered_ranked_loads")
     @patch("app.business.load.enrich_with_pricing")
-    def test_get_best_load_strict_filters_success(
-        self, mock_enrich, mock_prioritize, mock_filter
-    ):
+    def test_get_best_load_strict_filters_success(self, mock_enrich, mock_ranked):
         """Test successful load retrieval with strict filters"""
         # Arrange
         mock_db = Mock(spec=Session)
@@ -27,8 +50,7 @@ class TestGetBestLoad:
 
         mock_load = Mock()
         mock_load.id = 1
-        mock_filter.return_value = [mock_load]
-        mock_prioritize.return_value = [mock_load]
+        mock_ranked.return_value = [(mock_load, MatchTier.STRICT)]
 
         # Create a simple mock response instead of LoadResponse instance
         expected_response = Mock()
@@ -43,35 +65,25 @@ class TestGetBestLoad:
 
         # Assert
         assert result == expected_response
-        mock_filter.assert_called_once_with(mock_db, filters)
-        mock_prioritize.assert_called_once_with([mock_load])
-        mock_enrich.assert_called_once_with(mock_load)
-
-    @patch("app.business.load.filter_loads_from_db")
-    @patch("app.core.config.constants")
-    def test_get_best_load_fallback_to_relaxed_filters(
-        self, mock_constants, mock_filter
-    ):
-        """Test fallback to relaxed filters when strict filters return no results"""
+        mock_ranked.assert_called_once()
+        assert mock_ranked.call_args.args[:2] == (mock_db, filters)
+        mock_enrich.assert_called_once_with(mock_load, match_tier=MatchTier.STRICT)
+
+    @patch("app.business.load.get_tiered_ranked_loads")
+    def test_get_best_load_fallback_to_relaxed_filters(self, mock_ranked):
+        """Test that relaxed filters are evaluated in the same single query"""
         # Arrange
         mock_db = Mock(spec=Session)
         filters = LoadFilter(
-            origin_city="Chicago", destination_city="Dallas", equipment_type="dry_van"
+            origin="chicago",
+            pickup_datetime_from=datetime(2025, 8, 10),
+            max_miles=500,
         )
 
-        mock_constants.RELAXED_FILTER_FIELDS = {
-            "miles": None,
-            "delivery_datetime": None,
-        }
-
-        # First call returns empty, second call returns results
         mock_load = Mock()
-        mock_filter.side_effect = [[], [mock_load]]
+        mock_ranked.return_value = [(mock_load, MatchTier.RELAXED)]
 
-        with patch("app.business.load.prioritize_loads") as mock_prioritize, patch(
-            "app.business.load.enrich_with_pricing"
-        ) as mock_enrich:
-            mock_prioritize.return_value = [mock_load]
+        with patch("app.business.load.enrich_with_pricing") as mock_enrich:
             mock_enrich.return_value = Mock()
 
             # Act
@@ -79,20 +91,25 @@ class TestGetBestLoad:
 
             # Assert
             assert result is not None
-            assert mock_filter.call_count == 2
-            # First call with original filters
-            mock_filter.assert_any_call(mock_db, filters)
-            # Second call should be with relaxed filters
-
-    @patch("app.business.load.filter_loads_from_db")
-    def test_get_best_load_no_results(self, mock_filter):
+            mock_ranked.assert_called_once()
+            _, strict, relaxed = mock_ranked.call_args.args
+            assert strict == filters
+            assert relaxed.origin == "chicago"
+            assert relaxed.pickup_datetime_from is None
+            assert relaxed.max_miles is None
+            mock_enrich.assert_called_once_with(
+                mock_load, match_tier=MatchTier.RELAXED
+            )
+
+    @patch("app.business.load.get_tiered_ranked_loads")
+    def test_get_best_load_no_results(self, mock_ranked):
         """Test when no loads are found even with relaxed filters"""
         # Arrange
         mock_db = Mock(spec=Session)
         filters = LoadFilter(origin_city="NonExistentCity")
 
         # Both strict and relaxed filters return empty
-        mock_filter.return_value = []
+        mock_ranked.return_value = []
 
         # Act
         result = get_best_load(mock_db, filters)
@@ -177,3 +194,330 @@ class TestPrioritizeLoads:
             # Assert
             assert len(result) == 2
             assert result[0] == load_with_none_notes  # Earlier delivery date
+
+
+class TestGetRankedLoads:
+    """Test suite comparing the SQL ranking with prioritize_loads"""
+
+    def _seed(self, db_session):
+        loads = [
+            make_load(notes="routine", delivery_datetime=datetime(2025, 8, 11, 9)),
+            make_load(notes="URGENT pickup", delivery_datetime=datetime(2025, 8, 14)),
+            make_load(notes=None, delivery_datetime=datetime(2025, 8, 10, 12)),
+            make_load(notes="urgent - cold", delivery_datetime=datetime(2025, 8, 12)),
+            make_load(origin="miami, fl", notes="urgent", miles=300.0),
+            make_load(notes="non-urgent", delivery_datetime=datetime(2025, 8, 9)),
+        ]
+        db_session.add_all(loads)
+        db_session.commit()
+        return loads
+
+    def test_ranked_loads_match_reference_ordering(self, db_session):
+        """SQL ordering must match prioritize_loads over the full result set"""
+        self._seed(db_session)
+        filters = LoadFilter(origin="chicago")
+
+        expected = prioritize_loads(filter_loads_from_db(db_session, filters))
+        ranked = get_ranked_loads(db_session, filters, limit=len(expected))
+
+        assert [load.load_id for load in ranked] == [
+            load.load_id for load in expected
+        ]
+
+    def test_ranked_loads_respects_limit_and_filters(self, db_session):
+        """Only the top rows matching the filters are returned"""
+        self._seed(db_session)
+
+        ranked = get_ranked_loads(db_session, LoadFilter(origin="chicago"), limit=2)
+        assert len(ranked) == 2
+        assert all("urgent" in load.notes.lower() for load in ranked)
+
+        ranked = get_ranked_loads(db_session, LoadFilter(max_miles=500), limit=5)
+        assert [load.origin for load in ranked] == ["miami, fl"]
+
+    def test_tiered_loads_prefer_strict_matches(self, db_session):
+        """Strict matches rank ahead of urgent relaxed-only matches"""
+        self._seed(db_session)
+        strict = LoadFilter(origin="chicago", max_miles=500)
+        relaxed = strict.copy(update={"max_miles": None})
+        db_session.add(make_load(notes="routine", miles=400.0))
+        db_session.commit()
+
+        ranked = get_tiered_ranked_loads(db_session, strict, relaxed, limit=10)
+
+        assert ranked[0][1] == MatchTier.STRICT
+        assert ranked[0][0].miles == 400.0
+        assert [tier for _, tier in ranked[1:]] == [MatchTier.RELAXED] * 5
+
+    def test_tiered_loads_report_relaxed_when_no_strict_match(self, db_session):
+        """Falls back to relaxed ranking in the same query"""
+        self._seed(db_session)
+        strict = LoadFilter(origin="chicago", max_miles=10)
+        relaxed = strict.copy(update={"max_miles": None})
+
+        ranked = get_tiered_ranked_loads(db_session, strict, relaxed, limit=1)
+        expected = get_ranked_loads(db_session, relaxed, limit=1)
+
+        assert ranked == [(expected[0], MatchTier.RELAXED)]
+
+
+class TestAsyncLoadSearch:
+    """Test suite for the AsyncSession variants used by the API"""
+
+    def _loads(self):
+        return [
+            make_load(notes="routine", delivery_datetime=datetime(2025, 8, 11, 9)),
+            make_load(notes="URGENT pickup", delivery_datetime=datetime(2025, 8, 14)),
+            make_load(origin="miami, fl", notes="urgent", miles=300.0),
+            make_load(notes=None, delivery_datetime=datetime(2025, 8, 10, 12)),
+        ]
+
+    def test_async_queries_match_sync_queries(self, db_session):
+        """Async crud functions return the same rows as their sync counterparts"""
+        filters = LoadFilter(origin="chicago")
+        strict = LoadFilter(origin="chicago", max_miles=10)
+        relaxed = strict.copy(update={"max_miles": None})
+        loads = self._loads()
+        db_session.add_all([make_load(**self._columns(load)) for load in loads])
+        db_session.commit()
+
+        async def scenario():
+            async with async_db_session() as db:
+                db.add_all(loads)
+                await db.commit()
+                return (
+                    await filter_loads_from_db_async(db, filters),
+                    await get_ranked_loads_async(db, filters, limit=10),
+                    await get_tiered_ranked_loads_async(db, strict, relaxed, limit=1),
+                )
+
+        matched, ranked, tiered = asyncio.run(scenario())
+
+        assert {load.load_id for load in matched} == {
+            load.load_id for load in filter_loads_from_db(db_session, filters)
+        }
+        assert [load.load_id for load in ranked] == [
+            load.load_id for load in get_ranked_loads(db_session, filters, limit=10)
+        ]
+        sync_tiered = get_tiered_ranked_loads(db_session, strict, relaxed, limit=1)
+        assert [(load.load_id, tier) for load, tier in tiered] == [
+            (load.load_id, tier) for load, tier in sync_tiered
+        ]
+
+    def test_get_best_load_async_enriches_top_load(self):
+        """The async business path returns the priced top load with its tier"""
+
+        async def scenario():
+            async with async_db_session() as db:
+                db.add_all(self._loads())
+                await db.commit()
+                return await get_best_load_async(
+                    db, LoadFilter(origin="chicago", max_miles=10)
+                )
+
+        best = asyncio.run(scenario())
+
+        assert best.notes == "URGENT pickup"
+        assert best.match_tier == MatchTier.RELAXED
+        assert best.first_offer is not None
+
+    @staticmethod
+    def _columns(load):
+        return {
+            column.name: getattr(load, column.name)
+            for column in load.__table__.columns
+        }
+
+
+class TestLoadPages:
+    """Test suite for top-K search pages and their continuation tokens"""
+
+    STRICT = LoadFilter(origin="chicago", max_miles=500)
+
+    def _seed(self, db_session):
+        # Shared delivery dates make the load_id tie-breaker matter
+        rng = random.Random(3)
+        db_session.add_all(
+            make_load(
+                notes=rng.choice(["urgent", "routine", None]),
+                delivery_datetime=datetime(2025, 8, rng.randint(10, 12)),
+                miles=rng.choice([300.0, 900.0]),
+                origin=rng.choice(["chicago, il", "miami, fl"]),
+            )
+            for _ in range(40)
+        )
+        db_session.commit()
+
+    def _walk(self, fetch, limit):
+        pages = [fetch(limit=limit)]
+        while pages[-1].next_cursor:
+            pages.append(fetch(cursor=pages[-1].next_cursor))
+        return pages
+
+    def test_pages_follow_the_tiered_ranking(self, db_session):
+        """Pages concatenate to the full ranking, across the tier boundary"""
+        self._seed(db_session)
+        relaxed = self.STRICT.copy(update=constants.RELAXED_FILTER_FIELDS)
+        expected = get_tiered_ranked_loads(db_session, self.STRICT, relaxed, 100)
+
+        pages = self._walk(
+            lambda **kwargs: get_load_page(db_session, self.STRICT, **kwargs), 3
+        )
+
+        assert [len(page.items) for page in pages[:-1]] == [3] * (len(pages) - 1)
+        assert [
+            (item.load_id, item.match_tier) for page in pages for item in page.items
+        ] == [(load.load_id, tier) for load, tier in expected]
+        assert {MatchTier.STRICT, MatchTier.RELAXED} <= {tier for _, tier in expected}
+        assert pages[0].items[0].first_offer is not None
+
+    def test_last_page_has_no_cursor(self, db_session):
+        """A page holding the last matching load ends the walk"""
+        db_session.add_all([make_load(), make_load()])
+        db_session.commit()
+
+        assert get_load_page(db_session, LoadFilter(), limit=2).next_cursor is None
+        page = get_load_page(db_session, LoadFilter(), limit=1)
+        assert page.next_cursor is not None
+        assert len(get_load_page(db_session, LoadFilter(), limit=5).items) == 2
+
+    def test_cursor_is_bound_to_its_filters(self, db_session):
+        """Tokens issued for other filters, or garbled, are rejected"""
+        self._seed(db_session)
+        cursor = get_load_page(db_session, self.STRICT, limit=1).next_cursor
+
+        with pytest.raises(ValueError, match="different filters"):
+            get_load_page(db_session, LoadFilter(origin="miami"), cursor=cursor)
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            get_load_page(db_session, self.STRICT, cursor=cursor[:-4])
+
+    def test_async_pages_match_sync_pages(self, db_session):
+        """The async variant walks the same pages"""
+        self._seed(db_session)
+        loads = db_session.query(Load).all()
+        rows = [TestAsyncLoadSearch._columns(load) for load in loads]
+
+        async def scenario():
+            async with async_db_session() as db:
+                db.add_all([Load(**row) for row in rows])
+                await db.commit()
+                pages = [await get_load_page_async(db, self.STRICT, limit=4)]
+                while pages[-1].next_cursor:
+                    pages.append(
+                        await get_load_page_async(
+                            db, self.STRICT, cursor=pages[-1].next_cursor
+                        )
+                    )
+                return pages
+
+        pages = asyncio.run(scenario())
+        sync_pages = self._walk(
+            lambda **kwargs: get_load_page(db_session, self.STRICT, **kwargs), 4
+        )
+
+        assert [page.model_dump() for page in pages] == [
+            page.model_dump() for page in sync_pages
+        ]
+
+
+class TestBuildLoadConditions:
+    """Test suite for the text matching modes"""
+
+    def _compile(self, filters):
+        clause = and_(*build_load_conditions(filters))
+        return str(clause.compile(dialect=postgresql.dialect()))
+
+    def test_substring_mode_uses_ilike(self):
+        sql = self._compile(LoadFilter(origin="chicago", equipment_type="reefer"))
+        assert sql.count("ILIKE") == 2
+
+    def test_fuzzy_mode_uses_trigram_word_similarity(self):
+        sql = self._compile(
+            LoadFilter(
+                origin="chicgo",
+                commodity_type="dairy",
+                match_mode=TextMatchMode.FUZZY,
+            )
+        )
+        assert "ILIKE" not in sql
+        assert sql.count("%>") == 2
+
+    def test_unknown_match_mode_setting_fails_at_startup(self, monkeypatch):
+        monkeypatch.setenv("LOAD_TEXT_MATCH_MODE", "fuzy")
+
+        with pytest.raises(ValidationError, match="LOAD_TEXT_MATCH_MODE"):
+            Settings()
+
+
+class TestCalculateLoadOffers:
+    """Test suite for the vectorized batch pricing"""
+
+    def _random_loads(self, count: int):
+        rng = random.Random(11)
+        return {
+            "miles": [rng.uniform(50, 3000) for _ in range(count)],
+            "equipment_types": [
+                rng.choice(["Reefer", "FLATBED", "dry van", "reefer ", "Step Deck"])
+                for _ in range(count)
+            ],
+            "notes": [
+                rng.choice([None, "", "URGENT pickup", "not urgent?", "routine"])
+                for _ in range(count)
+            ],
+            "commodity_types": [
+                rng.choice([None, "", "Medical Supplies", "paramedical", "dairy"])
+                for _ in range(count)
+            ],
+            # Integers, halves after the discount and arbitrary floats
+            "loadboard_rates": [
+                rng.choice(
+                    [
+                        rng.randint(0, 5000),
+                        5 + 10 * rng.randint(0, 500),
+                        rng.random() * 1e4,
+                    ]
+                )
+                for _ in range(count)
+            ],
+        }
+
+    def _assert_matches_scalar(self, loads, offers):
+        for i in range(len(loads["miles"])):
+            expected = _calculate_load_offer(
+                miles=loads["miles"][i],
+                equipment_type=loads["equipment_types"][i],
+                notes=loads["notes"][i],
+                commodity_type=loads["commodity_types"][i],
+                loadboard_rate=loads["loadboard_rates"][i],
+            )
+            assert {name: values[i] for name, values in offers.items()} == expected
+
+    def test_batch_matches_scalar_pricing(self):
+        """Every load is priced exactly like `_calculate_load_offer`"""
+        loads = self._random_loads(5000)
+
+        self._assert_matches_scalar(loads, calculate_load_offers(**loads))
+
+    def test_what_if_rates_and_precomputed_flags(self, monkeypatch):
+        """Custom rates price like the scalar function with those constants"""
+        loads = self._random_loads(500)
+        rates = PricingRates(3.1, 0.35, 0.15, 0.07, 0.12, 200)
+        flags = {
+            "equipment_types": np.array(
+                [e.lower() in ("reefer", "flatbed") for e in loads["equipment_types"]]
+            ),
+            "notes": np.array(["urgent" in (n or "").lower() for n in loads["notes"]]),
+        }
+
+        offers = calculate_load_offers(**{**loads, **flags}, rates=rates)
+
+        for name, value in {
+            "BASE_RATE_PER_MILE": 3.1,
+            "EQUIPMENT_PREMIUM": 0.35,
+            "URGENCY_PREMIUM": 0.15,
+            "MEDICAL_PREMIUM": 0.07,
+            "DISCOUNT_RATE": 0.12,
+            "MIN_MARGIN": 200,
+        }.items():
+            monkeypatch.setattr(constants, name, value)
+        self._assert_matches_scalar(loads, offers)
@@ -0,0 +1,291 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import event, func, select
+
+from app.business.metrics import (
+    bucket_start_of,
+    build_metrics_response,
+    calculate_metrics,
+    calculate_metrics_async,
+    calculate_metrics_series,
+    calculate_metrics_series_async,
+    calculate_window_metrics,
+    live_metrics_statement,
+)
+from app.crud.call_summary import create_call_summary, create_call_summary_async
+from app.crud.metrics_rollup import check_rollup, rebuild_rollup
+from app.models.call_summary import CallSummary
+from app.models.metrics_rollup import CallMetricsHourly, CallMetricsRollup
+from app.schemas.call_summary import CallSummaryCreate
+from app.schemas.metrics import MetricsBucket
+from tests.unit.conftest import async_db_session, make_load
+
+
+def _payloads(load_id):
+    return [
+        CallSummaryCreate(
+            load_id=load_id,
+            outcome="accepted",
+            sentiment="positive",
+            agreed_price=1800.0,
+            call_duration_sec=120,
+            attempts=1,
+            counter_offers=2,
+            satisfaction=True,
+        ),
+        CallSummaryCreate(
+            load_id=load_id,
+            outcome="accepted",
+            sentiment="neutral",
+            agreed_price=2050.0,
+            call_duration_sec=200,
+            attempts=2,
+            counter_offers=1,
+            satisfaction=False,
+        ),
+        CallSummaryCreate(
+            load_id=load_id,
+            outcome="rejected",
+            sentiment="negative",
+            call_duration_sec=45,
+            attempts=3,
+            counter_offers=0,
+        ),
+        CallSummaryCreate(
+            load_id=load_id,
+            outcome="no_response",
+            call_duration_sec=None,
+            attempts=1,
+        ),
+    ]
+
+
+def _seed(db_session):
+    load = make_load()
+    db_session.add(load)
+    db_session.commit()
+    for payload in _payloads(load.load_id):
+        create_call_summary(db_session, payload)
+    return load
+
+
+class TestCalculateMetrics:
+    """Test suite for the metrics served from the rollup"""
+
+    def test_metrics_values(self, db_session):
+        _seed(db_session)
+        db_session.add(make_load())
+        db_session.commit()
+
+        metrics = calculate_metrics(db_session)
+
+        assert metrics.total_loads == 2
+        assert metrics.total_calls == 4
+        assert (metrics.accepted, metrics.rejected, metrics.no_response) == (2, 1, 1)
+        assert (metrics.failed_negotiation, metrics.interested_follow_up) == (0, 0)
+        assert metrics.avg_agreed_price == 1925.0
+        assert metrics.avg_call_duration_sec == round((120 + 200 + 45) / 3, 2)
+        assert metrics.avg_attempts == 1.75
+        assert metrics.avg_counter_offers == 0.75
+        assert metrics.sentiment_summary.dict() == {
+            "positive": 1,
+            "neutral": 1,
+            "negative": 1,
+        }
+        assert metrics.satisfaction_summary.dict() == {
+            "satisfied": 1,
+            "unsatisfied": 1,
+            "unknown": 2,
+        }
+
+    def test_metrics_use_a_single_query(self, db_session):
+        _seed(db_session)
+        statements = []
+        engine = db_session.get_bind()
+
+        def listener(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            calculate_metrics(db_session)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 1
+        assert "call_summaries" not in statements[0]
+
+    def test_metrics_without_calls(self, db_session):
+        metrics = calculate_metrics(db_session)
+
+        assert metrics.total_calls == 0
+        assert metrics.avg_agreed_price == 0
+        assert metrics.avg_call_duration_sec == 0
+        assert metrics.satisfaction_summary.unknown == 0
+
+    def test_async_metrics_match_sync_metrics(self, db_session):
+        load = _seed(db_session)
+        expected = calculate_metrics(db_session)
+
+        async def scenario():
+            async with async_db_session() as db:
+                db.add(make_load(load_id=load.load_id))
+                await db.commit()
+                for payload in _payloads(load.load_id):
+                    await create_call_summary_async(db, payload)
+                return await calculate_metrics_async(db)
+
+        assert asyncio.run(scenario()) == expected
+
+
+class TestMetricsRollup:
+    """Test suite for the rollup maintenance and consistency check"""
+
+    def test_rollup_matches_live_aggregate(self, db_session):
+        _seed(db_session)
+
+        live = db_session.execute(live_metrics_statement()).mappings().one()
+
+        assert check_rollup(db_session) == {}
+        assert build_metrics_response(live) == calculate_metrics(db_session)
+
+    def test_rollup_rows_are_sharded(self, db_session):
+        _seed(db_session)
+
+        shards = db_session.scalars(select(CallMetricsRollup.shard)).all()
+
+        assert sorted(shards) == [1, 2, 3, 4]
+
+    def test_rebuild_recovers_rows_written_outside_the_crud(self, db_session):
+        load = _seed(db_session)
+        db_session.add(
+            CallSummary(load_id=load.load_id, outcome="accepted", agreed_price=900.0)
+        )
+        db_session.commit()
+
+        mismatches = check_rollup(db_session)
+        assert mismatches["total_calls"] == (5, 4)
+        assert mismatches["accepted"] == (3, 2)
+
+        rebuilt = rebuild_rollup(db_session)
+        db_session.commit()
+
+        assert rebuilt == 5
+        assert check_rollup(db_session) == {}
+        assert calculate_metrics(db_session).avg_agreed_price == round(
+            (1800.0 + 2050.0 + 900.0) / 3, 2
+        )
+        assert db_session.scalar(select(func.count()).select_from(CallSummary)) == 5
+
+
+class TestTimeBucketedMetrics:
+    """Test suite for the windowed and bucketed metrics"""
+
+    CALL_TIMES = [
+        datetime(2025, 8, 4, 9, 15),  # Monday
+        datetime(2025, 8, 4, 9, 45),
+        datetime(2025, 8, 4, 14, 5),
+        datetime(2025, 8, 6, 8, 0),  # Wednesday, same ISO week
+        datetime(2025, 8, 11, 23, 59),  # next Monday
+    ]
+
+    def _seed(self, db_session):
+        load = make_load()
+        db_session.add(load)
+        db_session.add_all(
+            CallSummary(
+                load_id=load.load_id,
+                outcome="accepted" if index % 2 == 0 else "rejected",
+                agreed_price=1000.0 + 100 * index,
+                created_at=created_at,
+            )
+            for index, created_at in enumerate(self.CALL_TIMES)
+        )
+        db_session.commit()
+        rebuild_rollup(db_session)
+        db_session.commit()
+
+    def _calls_per_bucket(self, series):
+        return [
+            (point.bucket_start, point.metrics.total_calls) for point in series.points
+        ]
+
+    def test_created_at_is_set_on_insert(self, db_session):
+        _seed(db_session)
+
+        summary = db_session.scalars(select(CallSummary)).first()
+        hours = db_session.scalars(select(CallMetricsHourly.bucket_start)).all()
+
+        assert summary.created_at is not None
+        assert set(hours) == {
+            summary.created_at.replace(minute=0, second=0, microsecond=0)
+        }
+
+    def test_rebuild_fills_hourly_buckets(self, db_session):
+        self._seed(db_session)
+
+        assert check_rollup(db_session) == {}
+        series = calculate_metrics_series(db_session, MetricsBucket.HOUR)
+        assert self._calls_per_bucket(series) == [
+            (datetime(2025, 8, 4, 9), 2),
+            (datetime(2025, 8, 4, 14), 1),
+            (datetime(2025, 8, 6, 8), 1),
+            (datetime(2025, 8, 11, 23), 1),
+        ]
+
+    def test_day_and_week_buckets(self, db_session):
+        self._seed(db_session)
+
+        days = calculate_metrics_series(db_session, MetricsBucket.DAY)
+        weeks = calculate_metrics_series(db_session, MetricsBucket.WEEK)
+
+        assert self._calls_per_bucket(days) == [
+            (datetime(2025, 8, 4), 3),
+            (datetime(2025, 8, 6), 1),
+            (datetime(2025, 8, 11), 1),
+        ]
+        assert self._calls_per_bucket(weeks) == [
+            (datetime(2025, 8, 4), 4),
+            (datetime(2025, 8, 11), 1),
+        ]
+        assert weeks.points[0].metrics.accepted == 2
+        assert weeks.points[0].metrics.avg_agreed_price == 1150.0
+
+    def test_window_is_aligned_to_hours(self, db_session):
+        self._seed(db_session)
+
+        window = calculate_window_metrics(
+            db_session, datetime(2025, 8, 4, 9, 30), datetime(2025, 8, 6, 8, 0)
+        )
+        series = calculate_metrics_series(
+            db_session, MetricsBucket.DAY, start=datetime(2025, 8, 5)
+        )
+
+        assert window.total_calls == 3
+        assert window.total_loads == 1
+        assert self._calls_per_bucket(series) == [
+            (datetime(2025, 8, 6), 1),
+            (datetime(2025, 8, 11), 1),
+        ]
+
+    def test_async_series_matches_sync_series(self, db_session):
+        self._seed(db_session)
+        expected = calculate_metrics_series(db_session, MetricsBucket.WEEK)
+
+        async def scenario():
+            async with async_db_session() as db:
+                await db.run_sync(self._seed)
+                return await calculate_metrics_series_async(db, MetricsBucket.WEEK)
+
+        series = asyncio.run(scenario())
+        assert self._calls_per_bucket(series) == self._calls_per_bucket(expected)
+
+    def test_bucket_start_of_week_is_monday(self):
+        sunday = datetime(2025, 8, 10, 18, 30)
+
+        assert bucket_start_of(sunday, MetricsBucket.WEEK) == datetime(2025, 8, 4)
+        assert bucket_start_of(sunday, MetricsBucket.DAY) == datetime(2025, 8, 10)
+        assert bucket_start_of(sunday, MetricsBucket.HOUR) == datetime(
+            2025, 8, 10, 18
+        )
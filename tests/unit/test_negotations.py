@@ -1,7 +1,17 @@
+import math
+import random
+
 import pytest
+from fastapi.testclient import TestClient
+
 from app.schemas.negotiations import CounterOfferRequest, FinalStatus
-from app.business.negotiation import evaluate_counter_offer
-from app.core.config import constants
+from app.business.negotiation import (
+    NegotiationRules,
+    evaluate_counter_offer,
+    evaluate_counter_offers,
+)
+from app.core.config import constants, settings
+from app.main import app
 
 
 @pytest.fixture
@@ -60,3 +70,159 @@ def test_standard_counteroffer_flow(base_request):
     assert response.counter_suggestion > req.carrier_offer
     assert response.counter_suggestion <= req.max_rate
     assert "can do" in response.message.lower()
+
+
+def _random_offers(count):
+    rng = random.Random(7)
+    offers = {
+        "carrier_offers": [],
+        "last_offers": [],
+        "negotiation_rounds": [],
+        "max_rates": [],
+    }
+    for _ in range(count):
+        max_rate = rng.choice([1700, rng.randint(500, 5000), rng.random() * 5000 + 1])
+        last_offer = rng.choice([max_rate, max_rate * 0.8, rng.randint(400, 5000)])
+        # Ties with our offers and the max, whole dollars, halves and arbitrary floats
+        carrier_offer = rng.choice(
+            [
+                max_rate,
+                last_offer,
+                rng.randint(300, 6000),
+                rng.randint(300, 6000) + 0.5,
+                rng.random() * 6000 + 0.01,
+            ]
+        )
+        offers["carrier_offers"].append(carrier_offer)
+        offers["last_offers"].append(last_offer)
+        offers["negotiation_rounds"].append(rng.randint(1, 3))
+        offers["max_rates"].append(max_rate)
+    return offers
+
+
+def _assert_matches_scalar(offers, evaluated):
+    for i in range(len(offers["carrier_offers"])):
+        expected = evaluate_counter_offer(
+            CounterOfferRequest(
+                carrier_offer=offers["carrier_offers"][i],
+                last_offer=offers["last_offers"][i],
+                negotiation_round=offers["negotiation_rounds"][i],
+                max_rate=offers["max_rates"][i],
+            )
+        )
+        suggestion = evaluated["counter_suggestion"][i]
+        assert evaluated["final_status"][i] == expected.final_status.value
+        assert (None if math.isnan(suggestion) else suggestion) == (
+            expected.counter_suggestion
+        )
+        assert evaluated["rounds_left"][i] == expected.rounds_left
+
+
+def test_batch_matches_scalar_evaluation():
+    """Every offer is evaluated exactly like `evaluate_counter_offer`"""
+    offers = _random_offers(5000)
+
+    _assert_matches_scalar(offers, evaluate_counter_offers(**offers))
+
+
+def test_batch_alternative_rules(monkeypatch):
+    """Other rules evaluate like the scalar function with those constants"""
+    offers = _random_offers(1000)
+
+    evaluated = evaluate_counter_offers(**offers, rules=NegotiationRules(2, 25))
+
+    monkeypatch.setattr(constants, "MAX_NEGOTIATION_ROUNDS", 2)
+    monkeypatch.setattr(constants, "ROUNDING_STEP", 25)
+    _assert_matches_scalar(offers, evaluated)
+
+
+def test_batch_endpoint_compares_strategies():
+    headers = {settings.AUTH_HEADER_KEY: settings.AUTH_API_KEY}
+    batch = {
+        "carrier_offers": [1900, 1500, 1200],
+        "last_offers": [1500, 1500, 1500],
+        "negotiation_rounds": [1, 2, 2],
+        "max_rates": [1700, 1700, 1700],
+        "strategies": {
+            "two_rounds": {"max_negotiation_rounds": 2, "rounding_step": 50}
+        },
+    }
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v1/counteroffer/batch", json=batch, headers=headers
+        )
+        mismatched = client.post(
+            "/api/v1/counteroffer/batch",
+            json={**batch, "max_rates": [1700]},
+            headers=headers,
+        )
+        too_many = client.post(
+            "/api/v1/counteroffer/batch",
+            json={
+                **batch,
+                "carrier_offers": [1500] * (constants.NEGOTIATION_BATCH_MAX_SIZE + 1),
+            },
+            headers=headers,
+        )
+
+    results = response.json()["results"]
+    assert results["current"] == {
+        "final_status": ["counter", "accepted", "counter"],
+        "counter_suggestion": [1600.0, None, 1450.0],
+        "rounds_left": [2, 1, 1],
+        "status_counts": {"accepted": 1, "counter": 2},
+    }
+    assert results["two_rounds"]["final_status"] == [
+        "counter",
+        "accepted",
+        "limit_reached",
+    ]
+    assert results["two_rounds"]["counter_suggestion"] == [1600.0, None, None]
+    assert mismatched.status_code == 400
+    assert too_many.status_code == 422
+
+
+def test_batch_rounds_are_masked_beyond_each_strategy_limit():
+    """Offers in rounds a strategy does not allow are not evaluated with it"""
+    headers = {settings.AUTH_HEADER_KEY: settings.AUTH_API_KEY}
+    batch = {
+        "carrier_offers": [1900, 1200, 1900],
+        "last_offers": [1500, 1500, 1500],
+        "negotiation_rounds": [1, 4, 6],
+        "max_rates": [1700, 1700, 1700],
+    }
+    strategies = {
+        "five_rounds": {"max_negotiation_rounds": 5, "rounding_step": 10},
+        "six_rounds": {"max_negotiation_rounds": 6, "rounding_step": 10},
+    }
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/v1/counteroffer/batch",
+            json={**batch, "strategies": strategies},
+            headers=headers,
+        )
+        beyond_every_strategy = client.post(
+            "/api/v1/counteroffer/batch",
+            json={**batch, "strategies": {"five_rounds": strategies["five_rounds"]}},
+            headers=headers,
+        )
+
+    results = response.json()["results"]
+    assert results["current"] == {
+        "final_status": ["counter", None, None],
+        "counter_suggestion": [1600.0, None, None],
+        "rounds_left": [2, None, None],
+        "status_counts": {"counter": 1, "out_of_range": 2},
+    }
+    assert results["five_rounds"]["final_status"] == ["counter", "counter", None]
+    assert results["five_rounds"]["rounds_left"] == [4, 1, None]
+    assert results["five_rounds"]["status_counts"] == {
+        "counter": 2,
+        "out_of_range": 1,
+    }
+    assert results["six_rounds"]["rounds_left"] == [5, 2, 0]
+    assert results["six_rounds"]["status_counts"] == {"counter": 3}
+    assert beyond_every_strategy.status_code == 400
+    assert "at most 5" in beyond_every_strategy.json()["detail"]
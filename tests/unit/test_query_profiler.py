@@ -0,0 +1,142 @@
+import logging
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.query_profiler import (
+    QueryBudgetExceeded,
+    QueryProfile,
+    attach_query_profiler,
+    profile_engine,
+    profile_queries,
+)
+from app.database_engine.base_class import Base
+from app.database_engine.session import get_async_db
+from app.main import app, create_app
+from app.models.load import Load
+from tests.unit.conftest import make_load
+
+HEADERS = {settings.AUTH_HEADER_KEY: settings.AUTH_API_KEY}
+
+
+@contextmanager
+def sqlite_client(application):
+    """TestClient whose async sessions share one in-memory aiosqlite engine."""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def create_schema():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def get_db():
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            yield session
+
+    application.dependency_overrides[get_async_db] = get_db
+    try:
+        with TestClient(application) as client:
+            client.portal.call(create_schema)
+            try:
+                yield client, engine.sync_engine
+            finally:
+                client.portal.call(engine.dispose)
+    finally:
+        application.dependency_overrides.clear()
+
+
+class TestQueryProfiler:
+    """Test suite for the SQL query profiler"""
+
+    def test_repeated_statements_are_flagged(self, db_session):
+        loads = [make_load() for _ in range(6)]
+        db_session.add_all(loads)
+        db_session.commit()
+        load_ids = [load.load_id for load in loads]
+
+        with profile_engine(db_session.get_bind()) as profile:
+            for load_id in load_ids:
+                db_session.execute(select(Load).where(Load.load_id == load_id))
+
+        ((_, count),) = profile.repeated(5)
+        assert count == 6
+        assert profile.problems(budget=10, repeat_threshold=5)[0].startswith(
+            "possible N+1, run 6 times: SELECT"
+        )
+        with pytest.raises(QueryBudgetExceeded, match="6 statements ran, at most 5"):
+            profile.assert_within(5)
+
+    def test_slow_statements_are_explained(self, db_session):
+        db_session.add(make_load(origin="dallas, tx"))
+        db_session.commit()
+        profile = QueryProfile(slow_threshold=0.0, max_explains=1)
+
+        with profile_engine(db_session.get_bind(), profile):
+            rows = db_session.execute(
+                select(Load.origin).where(Load.origin == "dallas, tx")
+            ).all()
+            db_session.execute(text("SELECT 1"))
+
+        assert rows == [("dallas, tx",)]  # Unaffected by the EXPLAIN
+        first, second = profile.slow
+        assert first.plan.startswith("SEARCH loads USING COVERING INDEX")
+        assert second.plan is None
+
+    def test_failed_explain_leaves_the_transaction_usable(self, db_session):
+        db_session.add(make_load(origin="dallas, tx"))
+        db_session.flush()
+        profile = QueryProfile(slow_threshold=0.0)
+
+        profile.record(
+            db_session.connection(), "SELECT missing FROM loads", (), elapsed=1.0
+        )
+        db_session.commit()
+
+        (slow,) = profile.slow
+        assert slow.plan.startswith("EXPLAIN failed: OperationalError")
+        assert db_session.execute(select(Load.origin)).scalars().all() == ["dallas, tx"]
+
+    def test_profiles_are_scoped_to_the_block(self, db_session):
+        attach_query_profiler(db_session.get_bind())
+
+        with profile_queries() as profile:
+            db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 1"))
+
+        assert profile.queries == 1
+
+    @pytest.mark.parametrize(
+        "path, max_queries",
+        [
+            ("/api/v1/loads?origin=chicago", 1),
+            ("/api/v1/loads?origin=chicago&limit=5", 1),
+            ("/api/v1/metrics", 1),
+            ("/api/v1/call-summary?limit=20", 1),
+        ],
+    )
+    def test_route_query_budgets(self, path, max_queries):
+        """Routes must not regress in the number of statements they run"""
+        with sqlite_client(app) as (client, engine):
+            with profile_engine(engine) as profile:
+                response = client.get(path, headers=HEADERS)
+
+        assert response.status_code == 200
+        profile.assert_within(max_queries)
+
+    def test_middleware_warns_over_budget(self, monkeypatch, caplog):
+        monkeypatch.setattr(settings, "QUERY_PROFILER_ENABLED", True)
+        monkeypatch.setattr(settings, "QUERY_PROFILER_BUDGET", 0)
+        caplog.set_level(logging.WARNING, logger="app.core.query_profiler")
+
+        with sqlite_client(create_app()) as (client, engine):
+            attach_query_profiler(engine)
+            client.get("/api/v1/loads?origin=chicago", headers=HEADERS)
+
+        (record,) = caplog.records
+        assert record.getMessage().startswith(
+            "[QUERY PROFILER] GET /api/v1/loads: 1 statements (budget 0)"
+        )
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.business.healthcheck import HealthcheckManager
+from app.core.request_capture import RequestCapture
+from app.middlewares.api_log_request import APILogRequestMiddleware
+from app.schemas.traffic import RecordedRequest
+
+
+def _app(capture: RequestCapture) -> FastAPI:
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        await capture.start()
+        app.state.request_capture = capture
+        yield
+        await capture.stop()
+
+    app = FastAPI(lifespan=lifespan)
+    app.add_middleware(APILogRequestMiddleware)
+
+    @app.post("/api/v1/carriers/{mc_number}/offers")
+    async def offer(mc_number: str, payload: dict):
+        return {"mc_number": mc_number, **payload}
+
+    @app.post("/api/v1/loads/import")
+    async def import_loads():
+        return {"imported": 0}
+
+    return app
+
+
+def _read(path) -> list:
+    with open(path, encoding="utf-8") as file:
+        return [RecordedRequest.model_validate_json(line) for line in file]
+
+
+def _recorded(offset: float) -> RecordedRequest:
+    return RecordedRequest(offset=offset, method="GET", path="/api/v1/loads")
+
+
+class TestRequestCapture:
+    """Test suite for the sampled request capture"""
+
+    def test_captures_json_requests_without_logging(self, tmp_path, caplog):
+        caplog.set_level(logging.WARNING, logger="app.middlewares.api_log_request")
+        capture = RequestCapture(str(tmp_path / "requests-{pid}.jsonl"))
+
+        with TestClient(_app(capture)) as client:
+            response = client.post(
+                "/api/v1/carriers/123456/offers?round=2", json={"offer": 1500}
+            )
+            client.post(
+                "/api/v1/loads/import",
+                content="load_id,origin\n",
+                headers={"Content-Type": "text/csv"},
+            )
+
+        assert response.json() == {"mc_number": "123456", "offer": 1500}
+        (recorded,) = _read(capture.path)
+        assert recorded.model_dump(exclude={"offset", "latency_ms"}) == {
+            "method": "POST",
+            "path": "/api/v1/carriers/123456/offers",
+            "route": "/api/v1/carriers/{mc_number}/offers",
+            "query": "round=2",
+            "body": {"offer": 1500},
+            "status": 200,
+        }
+        assert recorded.latency_ms > 0
+
+    def test_rotates_and_keeps_backups(self, tmp_path):
+        line_size = len(_recorded(0).model_dump_json()) + 1
+        capture = RequestCapture(
+            str(tmp_path / "requests.jsonl"), max_bytes=2 * line_size, backups=2
+        )
+
+        async def write():
+            await capture.start()
+            for offset in range(7):
+                capture.submit(_recorded(offset))
+            await capture.stop()
+
+        asyncio.run(write())
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "requests.jsonl",
+            "requests.jsonl.1",
+            "requests.jsonl.2",
+        ]
+        assert [r.offset for r in _read(capture.path)] == [6]
+        assert [r.offset for r in _read(tmp_path / "requests.jsonl.1")] == [
+            4,
+            5,
+        ]
+
+    def test_drops_requests_when_the_writer_is_behind(self, tmp_path):
+        capture = RequestCapture(str(tmp_path / "requests.jsonl"), queue_size=2)
+
+        accepted = [capture.submit(_recorded(offset)) for offset in range(3)]
+
+        assert accepted == [True, True, False]
+        assert capture.dropped == 1
+
+    def test_write_errors_are_counted_and_the_writer_recovers(
+        self, tmp_path, monkeypatch
+    ):
+        line_size = len(_recorded(0).model_dump_json()) + 1
+        capture = RequestCapture(
+            str(tmp_path / "requests.jsonl"), max_bytes=line_size, backups=1
+        )
+        rotate = capture._rotate
+        failures = iter([OSError("disk full")])
+
+        def flaky_rotate(file):
+            failure = next(failures, None)
+            if failure is not None:
+                file.close()
+                raise failure
+            return rotate(file)
+
+        monkeypatch.setattr(capture, "_rotate", flaky_rotate)
+
+        async def write():
+            await capture.start()
+            for offset in range(3):
+                capture.submit(_recorded(offset))
+            stats = capture.stats()
+            await capture.stop()
+            return stats
+
+        stats = asyncio.run(write())
+
+        assert stats["writer_alive"]
+        assert capture.stats()["write_errors"] == 1
+        assert [r.offset for r in _read(tmp_path / "requests.jsonl.1")] == [0]
+        assert [r.offset for r in _read(capture.path)] == [2]
+
+    def test_health_reports_the_capture(self, tmp_path):
+        capture = RequestCapture(str(tmp_path / "requests.jsonl"), queue_size=1)
+        capture.submit(_recorded(0))
+        capture.submit(_recorded(1))
+
+        status = HealthcheckManager().status(request_capture=capture)
+
+        assert status["request_capture"] == {
+            "path": str(capture.path),
+            "writer_alive": False,
+            "queued": 1,
+            "dropped": 1,
+            "write_errors": 0,
+        }
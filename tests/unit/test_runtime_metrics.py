@@ -0,0 +1,113 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.instrumentation import (
+    STAGE_DURATION,
+    Histogram,
+    RuntimeMetrics,
+    instrument_engine,
+    stage,
+    track_request_db_usage,
+)
+from app.database_engine.session import get_async_db
+from app.main import app
+from tests.unit.conftest import async_db_engine
+
+
+class TestRuntimeMetrics:
+    """Test suite for the runtime histograms and their exposition"""
+
+    def test_histogram_renders_cumulative_buckets(self):
+        histogram = Histogram(
+            "request_seconds", "Request time.", buckets=(0.1, 1), labelnames=("route",)
+        )
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, '/a"b')
+
+        assert histogram.render() == [
+            "# HELP request_seconds Request time.",
+            "# TYPE request_seconds histogram",
+            'request_seconds_bucket{route="/a\\"b",le="0.1"} 2',
+            'request_seconds_bucket{route="/a\\"b",le="1"} 3',
+            'request_seconds_bucket{route="/a\\"b",le="+Inf"} 4',
+            'request_seconds_sum{route="/a\\"b"} 3.65',
+            'request_seconds_count{route="/a\\"b"} 4',
+        ]
+
+    def test_registry_renders_every_histogram(self):
+        registry = RuntimeMetrics()
+        registry.histogram("first_seconds", "First.").observe(0.2)
+        registry.histogram("second_seconds", "Second.")
+
+        exposition = registry.render()
+
+        assert "first_seconds_count 1\n" in exposition
+        assert "# TYPE second_seconds histogram\n" in exposition
+
+    def test_stages_are_timed(self, monkeypatch):
+        def count(name):
+            return sum(STAGE_DURATION.snapshot().get((name,), ([0], 0))[0])
+
+        before = count("test.stage")
+        with stage("test.stage"):
+            pass
+        monkeypatch.setattr("app.core.instrumentation.runtime_metrics.enabled", False)
+        with stage("test.stage"):
+            pass
+
+        assert count("test.stage") == before + 1
+
+    def test_statements_are_counted_per_request(self, db_session):
+        engine = db_session.get_bind()
+        instrument_engine(engine)
+        instrument_engine(engine)  # Idempotent
+
+        with track_request_db_usage() as usage:
+            for _ in range(3):
+                db_session.execute(text("SELECT 1"))
+        db_session.execute(text("SELECT 1"))
+
+        assert usage.queries == 3
+        assert usage.seconds > 0
+
+    def test_runtime_endpoint_exposes_route_and_stage_histograms(self):
+        async def instrumented_db():
+            async with async_db_engine() as engine:
+                instrument_engine(engine.sync_engine)
+                async with AsyncSession(engine) as session:
+                    yield session
+
+        app.dependency_overrides[get_async_db] = instrumented_db
+        try:
+            with TestClient(app) as client:
+                client.get(
+                    "/api/v1/loads?origin=chicago",
+                    headers={settings.AUTH_HEADER_KEY: settings.AUTH_API_KEY},
+                )
+                response = client.get("/api/v1/metrics/runtime")
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        lines = response.text.splitlines()
+        assert any(
+            line.startswith(
+                'http_request_duration_seconds_count{method="GET",'
+                'route="/api/v1/loads",status="200"}'
+            )
+            for line in lines
+        )
+        assert any(
+            line.startswith('stage_duration_seconds_count{stage="rank_loads.db"}')
+            for line in lines
+        )
+        queries = next(
+            line
+            for line in lines
+            if line.startswith(
+                'http_request_db_queries_sum{method="GET",route="/api/v1/loads"}'
+            )
+        )
+        assert float(queries.rsplit(" ", 1)[1]) >= 1